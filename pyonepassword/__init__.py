@@ -8,6 +8,10 @@ except ImportError:  # pragma: no coverage
 from .__about__ import __summary__, __title__, __version__
 # Import and discard _API_INITIALIZER to ensure all API classes get registered
 from ._api_initializer import _API_INITIALIZED as _
+from ._async_op import AsyncOP as AsyncOP
+from ._op_registry import OPRegistry as OPRegistry
+from ._op_registry import shared_op as shared_op
+from ._py_op_cli import op_deadline as op_deadline
 # to re-export, either use this redundant import-as construct
 # or do:
 # __all__ = ["OP"]
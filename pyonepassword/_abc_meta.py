@@ -1,4 +1,6 @@
+import weakref
 from abc import ABCMeta
+from typing import FrozenSet, Tuple
 
 
 def enforcedmethod(func):
@@ -26,33 +28,29 @@ class ABCMetaDict(ABCMeta):
             # you must override this method, and then call this method via super()
     """
 
-    def __call__(cls, *args, **kwargs):
-        enforced = set()
-        unenforced = set()
+    # Incremented whenever a class using this metaclass is modified. Since modifying a base class
+    # can change the verdict for all of its subclasses, any modification invalidates every
+    # cached verdict
+    _generation = 0
+    # class -> (generation, enforced method names)
+    _verdicts: "weakref.WeakKeyDictionary[type, Tuple[int, FrozenSet[str]]]" = weakref.WeakKeyDictionary()
 
-        # get two sets of attributes: enforced flag is set and enforced flag is not set
-        for name, value in cls.__dict__.items():
-            if getattr(value, "__enforcedmethod__", False):
-                enforced.add(name)
-            else:
-                unenforced.add(name)
+    def __setattr__(cls, name, value):
+        super().__setattr__(name, value)
+        ABCMetaDict._generation += 1
+
+    def __delattr__(cls, name):
+        super().__delattr__(name)
+        ABCMetaDict._generation += 1
 
-        for base in cls.__mro__:
-            if base in [dict, object, cls]:
-                # if the class is dict, object or this class, skip it
-                # that way methods in those classes don't count as being imlemented
-                continue
-
-            for name, value in base.__dict__.items():
-                # if the item is flagged as enforced and isn't already in the
-                # unenforced set (i.e., there's an implementation somewhere)
-                # then added to the enforced set
-                if getattr(value, "__enforcedmethod__", False):
-                    if name not in unenforced:
-                        enforced.add(name)
-                else:
-                    # this item isn't flagged as enforced, so add it to the unenforced list
-                    unenforced.add(name)
+    def __call__(cls, *args, **kwargs):
+        generation = ABCMetaDict._generation
+        verdict = ABCMetaDict._verdicts.get(cls)
+        if verdict is not None and verdict[0] == generation:
+            enforced = verdict[1]
+        else:
+            enforced = _enforced_methods(cls)
+            ABCMetaDict._verdicts[cls] = (generation, enforced)
 
         if enforced:
             raise TypeError("Can't instantiate abstract class {} "
@@ -60,3 +58,37 @@ class ABCMetaDict(ABCMeta):
                                 cls.__name__, ', '.join(enforced)))
         else:
             return super(ABCMetaDict, cls).__call__(*args, **kwargs)
+
+
+def _enforced_methods(cls) -> FrozenSet[str]:
+    """
+    Names of methods flagged with @enforcedmethod that 'cls' doesn't override
+    """
+    enforced = set()
+    unenforced = set()
+
+    # get two sets of attributes: enforced flag is set and enforced flag is not set
+    for name, value in cls.__dict__.items():
+        if getattr(value, "__enforcedmethod__", False):
+            enforced.add(name)
+        else:
+            unenforced.add(name)
+
+    for base in cls.__mro__:
+        if base in [dict, object, cls]:
+            # if the class is dict, object or this class, skip it
+            # that way methods in those classes don't count as being imlemented
+            continue
+
+        for name, value in base.__dict__.items():
+            # if the item is flagged as enforced and isn't already in the
+            # unenforced set (i.e., there's an implementation somewhere)
+            # then added to the enforced set
+            if getattr(value, "__enforcedmethod__", False):
+                if name not in unenforced:
+                    enforced.add(name)
+            else:
+                # this item isn't flagged as enforced, so add it to the unenforced list
+                unenforced.add(name)
+
+    return frozenset(enforced)
@@ -0,0 +1,275 @@
+import asyncio
+import fnmatch
+import logging
+import subprocess
+import time
+import weakref
+from os import environ
+from typing import Optional, Tuple
+
+from ._py_op_cli import (
+    EXEC_MODE_ONE_SHOT,
+    LOG_OP_ERR_ENV_NAME,
+    ExecModeEnum,
+    _command_deadline,
+    _environ_snapshot,
+    _remaining
+)
+from ._py_op_commands import (
+    EXISTING_AUTH_IGNORE,
+    ExistingAuthEnum,
+    _OPCommandInterface
+)
+from .op_items._item_list import OPItemList
+from .op_items._op_item_type_registry import OPItemFactory
+from .op_items._op_items_base import OPAbstractItem
+from .op_items.totp import OPTOTPItem
+from .op_objects import OPVaultDescriptorList
+from .py_op_exceptions import (
+    OPCmdFailedException,
+    OPDocumentGetException,
+    OPInvalidDocumentException,
+    OPItemGetException,
+    OPItemListException,
+    OPNotFoundException,
+    OPVaultListException
+)
+from .version import PyOPAboutMixin
+
+
+class AsyncOP(_OPCommandInterface, PyOPAboutMixin):
+    """
+    Class for querying a 1Password account via the 'op' cli command from asyncio code.
+
+    Queries run 'op' via asyncio.create_subprocess_exec(), so they don't block the event loop.
+    Sign-in happens synchronously during object instantiation, exactly as with OP
+    """
+    DEFAULT_MAX_CONCURRENCY = 8
+
+    def __init__(self,
+                 account: Optional[str] = None,
+                 password: Optional[str] = None,
+                 existing_auth: ExistingAuthEnum = EXISTING_AUTH_IGNORE,
+                 password_prompt: bool = True,
+                 vault: Optional[str] = None,
+                 op_path: str = 'op',
+                 logger: Optional[logging.Logger] = None,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 exec_mode: ExecModeEnum = EXEC_MODE_ONE_SHOT,
+                 pool_size: Optional[int] = None,
+                 timeout: Optional[float] = None):
+        """
+        Create an AsyncOP object. The 1Password (non-initial) sign-in happens during object instantiation.
+
+        Parameters
+        ----------
+        Same as OP(), plus:
+
+        max_concurrency : int, optional
+            Maximum number of 'op' processes this object's async queries may run at once
+            in each event loop, by default 8
+
+        Raises
+        ------
+        Same as OP()
+        """
+        super().__init__(vault=vault,
+                         account=account,
+                         password=password,
+                         logger=logger,
+                         op_path=op_path,
+                         existing_auth=existing_auth,
+                         password_prompt=password_prompt,
+                         exec_mode=exec_mode,
+                         pool_size=pool_size,
+                         timeout=timeout)
+        self.max_concurrency = max_concurrency
+        # A semaphore is bound to the event loop it's first used in, so each loop gets its
+        # own, created on first use. Loops are weakly referenced, so closed loops, e.g.,
+        # from successive asyncio.run() calls, don't accumulate
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = \
+            weakref.WeakKeyDictionary()
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores.setdefault(
+                loop, asyncio.Semaphore(self.max_concurrency))
+        return semaphore
+
+    async def _arun_raw(self, argv, input_string=None, capture_stdout=False, env=environ, timeout=None) -> Tuple[bytes, bytes, int]:
+        stdout = subprocess.PIPE if capture_stdout else None
+        stdin = None
+        if input_string:
+            stdin = subprocess.PIPE
+            if isinstance(input_string, str):
+                input_string = input_string.encode("utf-8")
+
+        if timeout is None:
+            timeout = self._timeout
+        # time spent waiting for the semaphore counts against the deadline
+        deadline = _command_deadline(timeout)
+        async with self._get_semaphore():
+            remaining = _remaining(deadline)
+            if remaining == 0:
+                raise self._op_timed_out(argv, 0)
+            start = time.perf_counter()
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *argv, stdin=stdin, stdout=stdout, stderr=subprocess.PIPE,
+                    env=_environ_snapshot(env))
+                try:
+                    output, stderr = await asyncio.wait_for(
+                        proc.communicate(input=input_string), remaining)
+                except asyncio.TimeoutError as err:
+                    proc.kill()
+                    await proc.wait()
+                    raise self._op_timed_out(argv, remaining) from err
+                except asyncio.CancelledError:
+                    # don't leave an orphaned 'op' process behind
+                    proc.kill()
+                    await proc.wait()
+                    raise
+            finally:
+                elapsed = time.perf_counter() - start
+                self._executor.record_latency(
+                    self._executor.command_name(argv), elapsed)
+
+        returncode = proc.returncode
+        if returncode != 0:
+            stderr_output = stderr.decode("utf-8").rstrip()
+            if environ.get(LOG_OP_ERR_ENV_NAME) == "1":
+                self.logger.error(stderr_output)
+            ocfe = OPCmdFailedException(stderr_output, returncode)
+            self._note_cmd_failure(ocfe)
+            raise ocfe
+        return (output, stderr, returncode)
+
+    async def _arun(self, argv, capture_stdout=False, input_string=None, decode=None, env=environ, timeout=None):
+        self.logger.debug(f"Running: {argv.cmd_str()}")
+        try:
+            output, _, _ = await self._arun_raw(
+                argv, input_string=input_string, capture_stdout=capture_stdout, env=env,
+                timeout=timeout)
+        except FileNotFoundError as err:
+            self.logger.error(
+                "1Password 'op' command not found at: {}".format(argv[0]))
+            self.logger.error(
+                "See https://developer.1password.com/docs/cli for more information")
+            raise OPNotFoundException(argv[0], err.errno) from err
+
+        if decode and output is not None:
+            return output.decode(decode)
+        return output
+
+    async def item_get(self, item_identifier, vault=None, include_archive=False, generic_okay=False, relaxed_validation=False) -> OPAbstractItem:
+        """
+        Async equivalent of OP.item_get(). See OP.item_get() for details
+        """
+        argv = self._item_get_argv(
+            item_identifier, vault=vault, include_archive=include_archive)
+        try:
+            output = await self._arun(argv, capture_stdout=True, decode=None)
+        except OPCmdFailedException as ocfe:
+            raise OPItemGetException.from_opexception(ocfe) from ocfe
+
+        op_item = OPItemFactory.op_item(
+            output, generic_okay=generic_okay, relaxed_validation=relaxed_validation)
+        return op_item
+
+    async def item_get_totp(self, item_identifier: str, vault=None) -> OPTOTPItem:
+        """
+        Async equivalent of OP.item_get_totp(). See OP.item_get_totp() for details
+        """
+        argv = self._item_get_totp_argv(item_identifier, vault=vault)
+        try:
+            output = await self._arun(argv, capture_stdout=True, decode="utf-8")
+        except OPCmdFailedException as ocfe:
+            raise OPItemGetException.from_opexception(ocfe) from ocfe
+
+        totp = OPTOTPItem(output)
+        return totp
+
+    async def item_list(self, categories=[], include_archive=False, tags=[], title_glob=None, vault=None, generic_okay=True) -> OPItemList:
+        """
+        Async equivalent of OP.item_list(). See OP.item_list() for details
+        """
+        argv = self._item_list_argv(
+            categories=categories, include_archive=include_archive, tags=tags, vault=vault)
+        try:
+            item_list_json = await self._arun(argv, capture_stdout=True, decode=None)
+        except OPCmdFailedException as e:
+            raise OPItemListException.from_opexception(e)
+
+        item_list = OPItemList(item_list_json, generic_okay=generic_okay)
+        if title_glob:
+            _list = []
+            for obj in item_list:
+                if fnmatch.fnmatch(obj.title, title_glob):
+                    _list.append(obj)
+            item_list = OPItemList(_list)
+        return item_list
+
+    async def vault_list(self, group_name_or_id=None, user_name_or_id=None) -> OPVaultDescriptorList:
+        """
+        Async equivalent of OP.vault_list(). See OP.vault_list() for details
+        """
+        argv = self._vault_list_argv(
+            group_name_or_id=group_name_or_id, user_name_or_id=user_name_or_id)
+        try:
+            vault_list_json = await self._arun(argv, capture_stdout=True, decode=None)
+        except OPCmdFailedException as ocfe:
+            raise OPVaultListException.from_opexception(ocfe)
+
+        vault_list = OPVaultDescriptorList(vault_list_json)
+        return vault_list
+
+    async def document_get(self, document_name_or_id, vault=None, include_archive=False, relaxed_validation=False):
+        """
+        Async equivalent of OP.document_get(). See OP.document_get() for details
+
+        The document item lookup (for its filename) and the document download run concurrently
+        """
+        item_task = asyncio.ensure_future(
+            self.item_get(document_name_or_id, vault=vault,
+                          include_archive=include_archive, relaxed_validation=relaxed_validation))
+        document_task = asyncio.ensure_future(
+            self._document_bytes(document_name_or_id, vault=vault, include_archive=include_archive))
+        try:
+            item = await item_task
+        except OPCmdFailedException as ocfe:
+            self._discard_task(document_task)
+            raise OPDocumentGetException.from_opexception(ocfe) from ocfe
+        except BaseException:
+            self._discard_task(document_task)
+            raise
+
+        if not hasattr(item, "file_name"):
+            self._discard_task(document_task)
+            raise OPInvalidDocumentException(
+                "Item has no 'fileName' attribute")
+        file_name = item.file_name
+
+        document_bytes = await document_task
+        return (file_name, document_bytes)
+
+    @staticmethod
+    def _discard_task(task: asyncio.Future):
+        # cancel a task whose result we no longer need. If it already finished with
+        # an exception, retrieve it so asyncio doesn't log it as never retrieved
+        if task.done():
+            if not task.cancelled():
+                task.exception()
+        else:
+            task.cancel()
+
+    async def _document_bytes(self, document_name_or_id, vault=None, include_archive=False) -> bytes:
+        argv = self._document_get_argv(
+            document_name_or_id, vault=vault, include_archive=include_archive)
+        try:
+            document_bytes = await self._arun(argv, capture_stdout=True)
+        except OPCmdFailedException as ocfe:
+            raise OPDocumentGetException.from_opexception(ocfe) from ocfe
+        document_bytes = self._trim_document_bytes(document_bytes)
+        return document_bytes
@@ -0,0 +1,194 @@
+import hashlib
+import os
+import tempfile
+from typing import BinaryIO, Dict, Iterable, List, NamedTuple, Optional, Union
+
+from .json import dumps, safe_unjson
+
+DocumentDestination = Union[str, "os.PathLike[str]", BinaryIO]
+
+# how much of an existing file to read at a time when computing its digest
+_FILE_DIGEST_CHUNK_SIZE = 64 * 1024
+
+DOCUMENT_DOWNLOADED = "downloaded"
+DOCUMENT_SKIPPED = "skipped"
+DOCUMENT_FAILED = "failed"
+
+
+class OPDocumentDownload(NamedTuple):
+    """
+    Outcome of downloading a document to a file or file-like object
+    """
+    file_name: str
+    size: int
+    # hex digest of the document's bytes, or None if no digest was computed
+    digest: Optional[str]
+
+
+class OPDocumentManifestEntry(NamedTuple):
+    """
+    Outcome of backing up a single document with OP.document_get_many()
+
+    'status' is one of DOCUMENT_DOWNLOADED, DOCUMENT_SKIPPED (an identical copy was
+    already present), or DOCUMENT_FAILED, in which case 'error' is the exception that
+    caused the failure, and the remaining fields may be None
+    """
+    unique_id: str
+    title: str
+    version: int
+    status: str
+    file_name: Optional[str] = None
+    # relative to the destination directory
+    path: Optional[str] = None
+    size: Optional[int] = None
+    digest: Optional[str] = None
+    error: Optional[Exception] = None
+
+
+class OPDocumentManifest:
+    """
+    Record of the documents backed up to a directory by OP.document_get_many()
+
+    The manifest is also saved to the directory, so later backups to the same directory
+    can skip documents that haven't changed
+    """
+    FILE_NAME = ".op-document-manifest.json"
+
+    def __init__(self, dest_dir: str, digest_algorithm: str, entries: List[OPDocumentManifestEntry]):
+        self.dest_dir = dest_dir
+        self.digest_algorithm = digest_algorithm
+        self.entries = entries
+
+    @property
+    def downloaded(self) -> List[OPDocumentManifestEntry]:
+        return [e for e in self.entries if e.status == DOCUMENT_DOWNLOADED]
+
+    @property
+    def skipped(self) -> List[OPDocumentManifestEntry]:
+        return [e for e in self.entries if e.status == DOCUMENT_SKIPPED]
+
+    @property
+    def failed(self) -> List[OPDocumentManifestEntry]:
+        return [e for e in self.entries if e.status == DOCUMENT_FAILED]
+
+    @classmethod
+    def load_stored(cls, dest_dir: str, digest_algorithm: str) -> Dict[str, Dict]:
+        """
+        Stored manifest entries from a previous backup to 'dest_dir', keyed by
+        document unique ID
+
+        Entries are only usable if their digests were computed with the same algorithm,
+        so if the manifest is missing, unreadable, or used a different algorithm, there
+        are no entries
+        """
+        manifest_path = os.path.join(dest_dir, cls.FILE_NAME)
+        try:
+            with open(manifest_path, "rb") as f:
+                stored = safe_unjson(f.read())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(stored, dict) or stored.get("digest_algorithm") != digest_algorithm:
+            return {}
+        return stored.get("documents", {})
+
+    def save(self, stored: Dict[str, Dict]):
+        """
+        Save this manifest to its destination directory
+
+        Documents that failed to download keep their entries from the previous manifest,
+        if any, since the files from that backup are still in place
+        """
+        documents = {}
+        for entry in self.entries:
+            if entry.status == DOCUMENT_FAILED:
+                if entry.unique_id in stored:
+                    documents[entry.unique_id] = stored[entry.unique_id]
+                continue
+            documents[entry.unique_id] = {
+                "title": entry.title,
+                "version": entry.version,
+                "file_name": entry.file_name,
+                "path": entry.path,
+                "size": entry.size,
+                "digest": entry.digest
+            }
+        manifest = {"digest_algorithm": self.digest_algorithm,
+                    "documents": documents}
+        manifest_bytes = dumps(manifest, indent=2).encode("utf-8")
+        _write_document_chunks([manifest_bytes],
+                               os.path.join(self.dest_dir, self.FILE_NAME), None)
+
+
+def _document_path(unique_id: str, file_name: str) -> str:
+    """
+    Path, relative to a backup directory, to save a document to
+
+    Each document gets its own directory, named for its unique ID, since file names
+    needn't be unique. Only the last component of the file name is used, so it can't
+    point outside that directory
+    """
+    base_name = os.path.basename(file_name.replace("\\", "/"))
+    if base_name in ["", ".", ".."]:
+        base_name = unique_id
+    return os.path.join(unique_id, base_name)
+
+
+def _file_matches(path: str, size: int, digest: Optional[str], digest_algorithm: str) -> bool:
+    """
+    Whether the file at 'path' has the given size and digest
+    """
+    try:
+        if os.path.getsize(path) != size:
+            return False
+        hasher = hashlib.new(digest_algorithm)
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(_FILE_DIGEST_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+    except OSError:
+        return False
+    return hasher.hexdigest() == digest
+
+
+def _new_hasher(digest_algorithm: Optional[str]):
+    hasher = None
+    if digest_algorithm:
+        # raises ValueError for an unknown algorithm, before anything is downloaded
+        hasher = hashlib.new(digest_algorithm)
+    return hasher
+
+
+def _copy_chunks(chunks: Iterable[bytes], dest_file: BinaryIO, hasher) -> int:
+    size = 0
+    for chunk in chunks:
+        dest_file.write(chunk)
+        if hasher is not None:
+            hasher.update(chunk)
+        size += len(chunk)
+    return size
+
+
+def _write_document_chunks(chunks: Iterable[bytes], dest: DocumentDestination, hasher) -> int:
+    """
+    Write document chunks to 'dest', returning the total number of bytes written
+
+    If 'dest' is a path, the document is first written to a temporary file in the same
+    directory, which then replaces 'dest' only once the entire document has been written.
+    Like other temporary files, it's readable only by the current user. If 'dest' is a
+    file-like object, chunks are written to it directly
+    """
+    if not isinstance(dest, (str, os.PathLike)):
+        return _copy_chunks(chunks, dest, hasher)
+
+    dest_dir = os.path.dirname(os.path.abspath(dest))
+    fd, temp_path = tempfile.mkstemp(dir=dest_dir, prefix=".op-document-")
+    try:
+        with os.fdopen(fd, "wb") as temp_file:
+            size = _copy_chunks(chunks, temp_file, hasher)
+        os.replace(temp_path, dest)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:  # pragma: no coverage
+            pass
+        raise
+    return size
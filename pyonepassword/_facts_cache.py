@@ -0,0 +1,70 @@
+"""
+Process-wide cache of the facts gathered when an OP object is created, such as the
+'op' version and the account list. Each fact is keyed by the identity of the files it
+depends on, so it's recomputed only when the 'op' binary or its config changes
+"""
+import os
+import shutil
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _OPFactsCache:
+
+    def __init__(self):
+        self._facts: Dict[Tuple[str, Hashable], Any] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def file_identity(path) -> Optional[Tuple]:
+        """
+        A tuple that changes whenever the file at 'path' is replaced or modified,
+        or None if it can't be stat'ed
+        """
+        try:
+            st = os.stat(path)
+        except (OSError, TypeError):
+            return None
+        return (os.path.realpath(path), st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+
+    @classmethod
+    def op_identity(cls, op_path: str) -> Optional[Tuple]:
+        # 'op_path' may be a bare command name resolved via $PATH
+        resolved = shutil.which(op_path)
+        if not resolved:
+            return None
+        return cls.file_identity(resolved)
+
+    def fact(self, name: str, identity: Optional[Hashable], compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached fact 'name' for 'identity', calling compute() to produce it
+        if it isn't cached. If 'identity' is None, the fact is always computed and never cached
+        """
+        if identity is None:
+            return compute()
+
+        key = (name, identity)
+        with self._lock:
+            if key in self._facts:
+                return self._facts[key]
+
+        # compute outside the lock; this may run 'op'
+        value = compute()
+        with self._lock:
+            self._facts[key] = value
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._facts.clear()
+
+
+_FACTS_CACHE = _OPFactsCache()
+
+
+def clear_facts_cache():
+    """
+    Forget all cached facts, such as the 'op' version and account list, so the next
+    OP object gathers them again with 'op'
+    """
+    _FACTS_CACHE.clear()
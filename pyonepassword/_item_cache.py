@@ -0,0 +1,167 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import List, NamedTuple, Optional, Tuple, Union
+
+from .op_items._op_items_base import OPAbstractItem
+from .op_items.compact_item import OPCompactItem
+
+_CachedItem = Union[OPAbstractItem, OPCompactItem]
+
+
+class OPItemCacheKey(NamedTuple):
+    item_identifier: str
+    vault: Optional[str]
+    include_archive: bool
+    relaxed_validation: bool
+    compact: bool = False
+
+
+class OPItemCacheRevalidation(NamedTuple):
+    """
+    Outcome of revalidating an item cache against 'op item list'. Each list holds the
+    unique IDs of the affected items
+    """
+    unchanged: List[str]
+    updated: List[str]
+    removed: List[str]
+
+
+class _OPItemCacheEntry:
+
+    def __init__(self, item: _CachedItem, expires: float):
+        self.item = item
+        self.expires = expires
+
+
+class OPItemCache:
+    """
+    In-memory cache of item objects returned by OP.item_get(), with a per-entry
+    time-to-live and least-recently-used eviction once 'max_entries' is reached
+
+    Entries are keyed by (item identifier, vault, include_archive, relaxed_validation, compact).
+    The same cached object is returned to every caller, so callers should treat
+    cached items as read-only
+
+    This class is thread-safe
+    """
+    DEFAULT_TTL = 300.0
+    DEFAULT_MAX_ENTRIES = 1024
+
+    def __init__(self, ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Create an item cache, to be passed to OP(item_cache=...)
+
+        Parameters
+        ----------
+        ttl : float, optional
+            Number of seconds an item stays valid after it is cached, by default 300
+        max_entries : int, optional
+            Maximum number of items to hold before evicting the least recently used,
+            by default 1024
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[OPItemCacheKey,
+                                   _OPItemCacheEntry] = OrderedDict()
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def key(item_identifier: str,
+            vault: Optional[str] = None,
+            include_archive: bool = False,
+            relaxed_validation: bool = False,
+            compact: bool = False) -> OPItemCacheKey:
+        return OPItemCacheKey(item_identifier, vault, bool(include_archive), bool(relaxed_validation), bool(compact))
+
+    def get(self, key: OPItemCacheKey) -> Optional[_CachedItem]:
+        """
+        Look up a cached item, returning None if it isn't cached or has expired
+        """
+        item = None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires <= time.monotonic():
+                    del self._entries[key]
+                else:
+                    self._entries.move_to_end(key)
+                    item = entry.item
+        return item
+
+    def put(self, key: OPItemCacheKey, item: _CachedItem):
+        expires = time.monotonic() + self.ttl
+        with self._lock:
+            self._entries[key] = _OPItemCacheEntry(item, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, item_identifier: str, vault: Optional[str] = None) -> int:
+        """
+        Evict every cached entry referring to 'item_identifier'
+
+        An entry matches if it was looked up by 'item_identifier', or if the cached item's
+        unique ID or title is 'item_identifier'. So invalidating by unique ID also evicts
+        entries that were looked up by title, and vice versa
+
+        Parameters
+        ----------
+        item_identifier : str
+            Item name/title or unique ID
+        vault : str, optional
+            If provided, only evict entries that were looked up in this vault, or whose
+            item belongs to a vault with this name or ID
+
+        Returns
+        -------
+        int
+            The number of entries evicted
+        """
+        with self._lock:
+            evict = []
+            for key, entry in self._entries.items():
+                if vault is not None and not self._in_vault(key, entry.item, vault):
+                    continue
+                if item_identifier in [key.item_identifier, entry.item.unique_id, entry.item.title]:
+                    evict.append(key)
+            for key in evict:
+                del self._entries[key]
+        return len(evict)
+
+    def entries(self, vault: Optional[str] = None) -> List[Tuple[OPItemCacheKey, _CachedItem]]:
+        """
+        Return a snapshot of the unexpired (key, item) pairs in the cache
+
+        Parameters
+        ----------
+        vault : str, optional
+            If provided, only return entries that were looked up in this vault, or whose
+            item belongs to a vault with this name or ID
+        """
+        now = time.monotonic()
+        with self._lock:
+            entries = [(key, entry.item) for key, entry in self._entries.items()
+                       if entry.expires > now and (vault is None or self._in_vault(key, entry.item, vault))]
+        return entries
+
+    def discard(self, key: OPItemCacheKey):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    @staticmethod
+    def _in_vault(key: OPItemCacheKey, item: _CachedItem, vault: str) -> bool:
+        if key.vault == vault:
+            return True
+        item_vault = item.vault
+        return item_vault is not None and vault in [item_vault.unique_id, item_vault.name]
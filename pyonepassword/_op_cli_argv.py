@@ -316,3 +316,17 @@ class _OPArgv(list):
         delete_argv = cls.document_generic_argv(op_exe, "delete", sub_cmd_args)
 
         return delete_argv
+
+    @classmethod
+    def inject_argv(cls, op_exe: str):
+        # 'op inject' reads the template from stdin and writes the
+        # rendered template to stdout
+        args: List[str] = []
+        argv_obj = cls(op_exe, "inject", args)
+        return argv_obj
+
+    @classmethod
+    def read_argv(cls, op_exe: str, reference: str):
+        args = [reference, "--no-newline"]
+        argv_obj = cls(op_exe, "read", args)
+        return argv_obj
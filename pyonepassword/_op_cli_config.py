@@ -71,7 +71,8 @@ class OPCLIConfig(dict):
             account_map[account.shorthand] = account
         self.account_map = account_map
 
-    def _get_config_path(self) -> pathlib.Path:
+    @classmethod
+    def _get_config_path(cls) -> pathlib.Path:
         configpath: pathlib.Path = None
         config_home = None
         try:
@@ -80,7 +81,7 @@ class OPCLIConfig(dict):
         except KeyError:
             config_home = pathlib.Path.home()
 
-        for subpath in self.OP_CONFIG_PATHS:
+        for subpath in cls.OP_CONFIG_PATHS:
             _configpath = pathlib.Path(config_home, subpath)
             if os.path.exists(_configpath):
                 configpath = _configpath
@@ -0,0 +1,129 @@
+import threading
+from typing import Dict, Optional, Tuple
+
+from ._py_op_commands import EXISTING_AUTH_REQD
+from .pyonepassword import OP
+
+_OPRegistryKey = Tuple[Optional[str], str, Optional[str]]
+
+
+class OPRegistry:
+    """
+    A thread-safe registry of signed-in OP objects, one per (account, op_path, vault)
+
+    Code paths that would each construct their own OP object can instead ask the
+    registry for one, and share a single object and its session. Sign-in isn't verified
+    on every request; it's verified again only after 'reverify_interval' seconds have
+    passed, or after a command failed because the session was no longer signed in.
+    If verification fails, a new OP object is created in place of the old one
+    """
+    DEFAULT_REVERIFY_INTERVAL = 600.0
+
+    def __init__(self, reverify_interval: float = DEFAULT_REVERIFY_INTERVAL):
+        """
+        Create an OP object registry
+
+        Parameters
+        ----------
+        reverify_interval : float, optional
+            Seconds after which a registered object's sign-in is verified again
+            before it's handed out, by default 600
+        """
+        self.reverify_interval = reverify_interval
+        self._ops: Dict[_OPRegistryKey, OP] = {}
+        self._key_locks: Dict[_OPRegistryKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self,
+            account: Optional[str] = None,
+            vault: Optional[str] = None,
+            op_path: str = "op",
+            existing_auth=EXISTING_AUTH_REQD,
+            **op_kwargs) -> OP:
+        """
+        Get the shared OP object for (account, op_path, vault), creating one if necessary
+
+        Parameters
+        ----------
+        account : str, optional
+            The account to sign into, as for OP(), by default None
+        vault : str, optional
+            The object's default vault, as for OP(), by default None
+        op_path : str, optional
+            Path to the 'op' executable, by default 'op'
+        existing_auth : ExistingAuthEnum, optional
+            As for OP(). By default EXISTING_AUTH_REQD, so an existing session is required
+        **op_kwargs
+            Any other OP() arguments, used only if a new object has to be created
+
+        Raises
+        ------
+        Same as OP()
+
+        Returns
+        -------
+        OP
+            A signed-in OP object, shared with every other caller asking for the same key
+        """
+        key = (account, op_path, vault)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # only callers for the same key wait on each other while an object is
+        # verified or created
+        with key_lock:
+            op = self._ops.get(key)
+            if op is not None and self._needs_reverify(op):
+                if not op.reverify_signin():
+                    op = None
+            if op is None:
+                op = OP(account=account,
+                        vault=vault,
+                        op_path=op_path,
+                        existing_auth=existing_auth,
+                        **op_kwargs)
+                with self._lock:
+                    self._ops[key] = op
+        return op
+
+    def remove(self, account: Optional[str] = None, vault: Optional[str] = None, op_path: str = "op") -> Optional[OP]:
+        """
+        Remove and return the registered OP object for (account, op_path, vault), if any
+        """
+        with self._lock:
+            op = self._ops.pop((account, op_path, vault), None)
+        return op
+
+    def clear(self):
+        with self._lock:
+            self._ops.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._ops)
+
+    def _needs_reverify(self, op: OP) -> bool:
+        if op.signin_stale:
+            return True
+        elapsed = op.seconds_since_verified()
+        return elapsed is None or elapsed >= self.reverify_interval
+
+
+_DEFAULT_REGISTRY = OPRegistry()
+
+
+def shared_op(account: Optional[str] = None,
+              vault: Optional[str] = None,
+              op_path: str = "op",
+              existing_auth=EXISTING_AUTH_REQD,
+              **op_kwargs) -> OP:
+    """
+    Get a process-wide shared OP object for (account, op_path, vault) from the default
+    OPRegistry. See OPRegistry.get() for details
+    """
+    op = _DEFAULT_REGISTRY.get(account=account,
+                               vault=vault,
+                               op_path=op_path,
+                               existing_auth=existing_auth,
+                               **op_kwargs)
+    return op
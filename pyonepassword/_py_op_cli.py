@@ -1,12 +1,40 @@
+import concurrent.futures
+import contextlib
+import contextvars
+import enum
+import functools
+import io
 import logging
 import subprocess
+import tempfile
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
 from os import environ
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, cast
 
-from .py_op_exceptions import OPCmdFailedException, OPNotFoundException
+from .py_op_exceptions import (
+    OPCmdFailedException,
+    OPCmdTimeoutException,
+    OPNotFoundException
+)
 
 # Mainly for use in automated testing
 LOG_OP_ERR_ENV_NAME = "LOG_OP_ERR"
 
+# How much of a streamed command's output to read at a time
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Serializes writes (and copies) of os.environ, e.g., exporting OP_SESSION_<user_id>,
+# since OP objects may be shared between threads
+_ENVIRON_LOCK = threading.Lock()
+
+# Absolute time.monotonic() deadline, if any, for every 'op' command run in the current
+# thread or asyncio task. See op_deadline()
+_DEADLINE: "contextvars.ContextVar[Optional[float]]" = contextvars.ContextVar(
+    "_DEADLINE", default=None)
+
 """
 Module to hold stuff that interacts directly with 'op' or its config
 
@@ -14,10 +42,283 @@ TODO: Move other code that closely touches 'op' here
 """
 
 
+class ExecModeEnum(enum.IntEnum):
+    ONE_SHOT = 0  # Spawn a fresh 'op' process for every command, in the calling thread
+    POOLED = 1    # Dispatch every command to a bounded pool of persistent worker threads
+
+
+EXEC_MODE_ONE_SHOT = ExecModeEnum.ONE_SHOT
+EXEC_MODE_POOLED = ExecModeEnum.POOLED
+
+
+@contextlib.contextmanager
+def op_deadline(seconds: float):
+    """
+    Context manager that bounds how long every 'op' command run within it may take,
+    in total
+
+    Any 'op' command still running when the deadline passes is killed, and
+    OPCmdTimeoutException is raised, as it is for any command started after the
+    deadline. This applies to all OP and AsyncOP objects, and on top of any per-object
+    timeout. Nested deadlines can only shorten an enclosing one
+
+    Deadlines are per-thread, and per-asyncio task, and are carried over to the worker
+    threads OP methods like item_get_many() use
+
+    Parameters
+    ----------
+    seconds : float
+        How long from now the deadline is
+    """
+    if seconds <= 0:
+        raise ValueError(f"Deadline must be in the future: {seconds}")
+    deadline = time.monotonic() + seconds
+    enclosing = _DEADLINE.get()
+    if enclosing is not None:
+        deadline = min(deadline, enclosing)
+    token = _DEADLINE.set(deadline)
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(token)
+
+
+def _command_deadline(timeout: Optional[float]) -> Optional[float]:
+    """
+    Absolute deadline for a command that's about to start, given its own timeout and
+    any enclosing op_deadline()
+    """
+    deadline = _DEADLINE.get()
+    if timeout is not None:
+        command_deadline = time.monotonic() + timeout
+        if deadline is None or command_deadline < deadline:
+            deadline = command_deadline
+    return deadline
+
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    remaining = None
+    if deadline is not None:
+        remaining = max(deadline - time.monotonic(), 0.0)
+    return remaining
+
+
+def _environ_snapshot(env: Mapping[str, str]) -> Mapping[str, str]:
+    """
+    Copy os.environ, while holding _ENVIRON_LOCK, so a subprocess never sees it mid-update
+    by another thread. Any other mapping is returned as-is
+    """
+    if env is environ:
+        with _ENVIRON_LOCK:
+            env = dict(environ)
+    return env
+
+
+def _with_caller_deadline(func: Callable) -> Callable:
+    """
+    Wrap 'func' so that, wherever it's called, e.g., in a worker thread, it runs under
+    the caller's current op_deadline(), if any
+    """
+    deadline = _DEADLINE.get()
+
+    @functools.wraps(func)
+    def _wrapper(*args, **kwargs):
+        token = _DEADLINE.set(deadline)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _DEADLINE.reset(token)
+    return _wrapper
+
+
+class _hybridmethod:
+    """
+    Decorator similar to @classmethod, except that when the method is accessed
+    via an instance, the instance rather than the class is bound as the first argument
+
+    This lets class-level callers (e.g., 'op account list' before there's an OP object)
+    use class defaults, while instance callers pick up per-instance state such as
+    the command executor
+    """
+
+    def __init__(self, func):
+        self.__func__ = func
+        self.__doc__ = func.__doc__
+
+    def __get__(self, obj, objtype=None) -> Callable[..., Any]:
+        bind_to = objtype if obj is None else obj
+        return types.MethodType(self.__func__, bind_to)
+
+
+class OPCommandLatency:
+    """
+    Running latency statistics for a single 'op' command (e.g., 'item get')
+    """
+
+    def __init__(self, command: str):
+        self.command = command
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def record(self, elapsed: float):
+        self.count += 1
+        self.total += elapsed
+        if self.min is None or elapsed < self.min:
+            self.min = elapsed
+        if self.max is None or elapsed > self.max:
+            self.max = elapsed
+
+    @property
+    def mean(self) -> Optional[float]:
+        mean = None
+        if self.count:
+            mean = self.total / self.count
+        return mean
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}(command={self.command!r}, count={self.count}, "
+                f"mean={self.mean}, min={self.min}, max={self.max})")
+
+
+class _OPCLIExecutor:
+    """
+    Default executor: each command is a fresh 'op' process run in the calling thread.
+
+    Executors also keep per-command latency statistics so different execution modes
+    can be compared
+    """
+    EXEC_MODE = EXEC_MODE_ONE_SHOT
+
+    def __init__(self):
+        self._latency: Dict[str, OPCommandLatency] = {}
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def command_name(argv) -> str:
+        """
+        Human-readable command name used to key latency statistics, e.g., 'item get'
+        """
+        parts = [getattr(argv, "command", None),
+                 getattr(argv, "subcommand", None)]
+        name = " ".join([p for p in parts if p])
+        if not name:
+            # e.g., 'op --version'
+            name = " ".join(argv[1:])
+        return name
+
+    def run(self, argv, input_bytes=None, stdout=None, env=environ, deadline=None) -> subprocess.CompletedProcess:
+        """
+        Run 'op', killing it and raising subprocess.TimeoutExpired if it's still running
+        at 'deadline', an absolute time.monotonic() time
+        """
+        start = time.perf_counter()
+        try:
+            completed = self._execute(
+                argv, input_bytes=input_bytes, stdout=stdout,
+                env=_environ_snapshot(env), deadline=deadline)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.record_latency(self.command_name(argv), elapsed)
+        return completed
+
+    def record_latency(self, command: str, elapsed: float):
+        with self._stats_lock:
+            latency = self._latency.get(command)
+            if latency is None:
+                latency = OPCommandLatency(command)
+                self._latency[command] = latency
+            latency.record(elapsed)
+
+    def latency_stats(self) -> Dict[str, OPCommandLatency]:
+        with self._stats_lock:
+            stats = dict(self._latency)
+        return stats
+
+    def reset_latency_stats(self):
+        with self._stats_lock:
+            self._latency = {}
+
+    def shutdown(self, wait: bool = True):
+        pass
+
+    def _execute(self, argv, input_bytes=None, stdout=None, env=environ, deadline=None) -> subprocess.CompletedProcess:
+        # the remaining time is computed here, rather than by the caller, so time spent
+        # waiting for a pooled worker counts against the deadline
+        timeout = _remaining(deadline)
+        if timeout == 0:
+            raise subprocess.TimeoutExpired(argv, 0)
+        # subprocess.run() kills 'op' and reaps it before re-raising TimeoutExpired
+        _ran = subprocess.run(
+            argv, input=input_bytes, stderr=subprocess.PIPE, stdout=stdout, env=env,
+            timeout=timeout)
+        return _ran
+
+
+class _OPPooledCLIExecutor(_OPCLIExecutor):
+    """
+    Executor that hands each command to a bounded pool of long-lived worker threads.
+
+    NOTE: 'op' has no persistent/co-process mode; each command is still its own 'op'
+    process. What the pool provides is a fixed set of pre-started workers that are reused
+    across calls, and a hard cap on how many 'op' processes an OP object runs at once,
+    no matter how many threads are calling into it
+    """
+    EXEC_MODE = EXEC_MODE_POOLED
+    DEFAULT_POOL_SIZE = 4
+
+    def __init__(self, pool_size: Optional[int] = None):
+        super().__init__()
+        if not pool_size:
+            pool_size = self.DEFAULT_POOL_SIZE
+        self.pool_size = pool_size
+        self._pool = ThreadPoolExecutor(
+            max_workers=pool_size, thread_name_prefix="op-worker")
+        # pre-start all workers so the first commands don't pay for thread creation
+        warmups = [self._pool.submit(time.sleep, 0) for _ in range(pool_size)]
+        for warmup in warmups:
+            warmup.result()
+
+    def _execute(self, argv, input_bytes=None, stdout=None, env=environ, deadline=None) -> subprocess.CompletedProcess:
+        timeout = _remaining(deadline)
+        future = self._pool.submit(
+            super()._execute, argv, input_bytes=input_bytes, stdout=stdout, env=env,
+            deadline=deadline)
+        try:
+            completed = future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError as err:
+            # if the command is still queued, it never runs. If it's already running,
+            # the worker kills 'op' itself, since it has the same deadline
+            future.cancel()
+            raise subprocess.TimeoutExpired(argv, timeout) from err
+        return completed
+
+    def shutdown(self, wait: bool = True):
+        self._pool.shutdown(wait=wait)
+
+
+def _new_executor(exec_mode: ExecModeEnum = EXEC_MODE_ONE_SHOT, pool_size: Optional[int] = None) -> _OPCLIExecutor:
+    executor: _OPCLIExecutor
+    exec_mode = ExecModeEnum(exec_mode)
+    if exec_mode == EXEC_MODE_POOLED:
+        executor = _OPPooledCLIExecutor(pool_size=pool_size)
+    else:
+        executor = _OPCLIExecutor()
+    return executor
+
+
 class _OPCLIExecute:
     logger = logging.getLogger("_OPCLIExecute")
     logger.setLevel(logging.INFO)
 
+    # class-level executor used for commands run before (or without) an OP object,
+    # e.g., 'op account list'. Instances may override this with their own executor
+    _executor: _OPCLIExecutor = _OPCLIExecutor()
+
+    # default per-command timeout, in seconds. Instances may override this
+    _timeout: Optional[float] = None
+
     def __new__(cls, *args, logger=None, **kwargs):
         if logger:
             cls.set_logger(logger)
@@ -26,15 +327,21 @@ class _OPCLIExecute:
     Class for logging into and querying a 1Password account via the 'op' cli command.
     """
 
-    @classmethod
-    def _run_raw(cls, argv, input_string=None, capture_stdout=False, ignore_error=False, env=environ):
+    @_hybridmethod
+    def _run_raw(cls, argv, input_string=None, capture_stdout=False, ignore_error=False, env=environ, timeout=None):
         stdout = subprocess.PIPE if capture_stdout else None
         if input_string:
             if isinstance(input_string, str):
                 input_string = input_string.encode("utf-8")
 
-        _ran = subprocess.run(
-            argv, input=input_string, stderr=subprocess.PIPE, stdout=stdout, env=env)
+        if timeout is None:
+            timeout = cls._timeout
+        deadline = _command_deadline(timeout)
+        try:
+            _ran = cls._executor.run(
+                argv, input_bytes=input_string, stdout=stdout, env=env, deadline=deadline)
+        except subprocess.TimeoutExpired as err:
+            raise cls._op_timed_out(argv, err.timeout, err.stderr) from err
 
         stdout = _ran.stdout
         stderr = _ran.stderr
@@ -51,24 +358,120 @@ class _OPCLIExecute:
 
         return (stdout, stderr, returncode)
 
-    @classmethod
-    def _run(cls, argv, capture_stdout=False, input_string=None, decode=None, env=environ):
+    @_hybridmethod
+    def _run(cls, argv, capture_stdout=False, input_string=None, decode=None, env=environ, timeout=None):
         cls.logger.debug(f"Running: {argv.cmd_str()}")
         output = None
         try:
             output, _, _ = cls._run_raw(
-                argv, input_string=input_string, capture_stdout=capture_stdout, env=env)
+                argv, input_string=input_string, capture_stdout=capture_stdout, env=env,
+                timeout=timeout)
             if decode and output is not None:
                 output = output.decode(decode)
         except FileNotFoundError as err:
-            cls.logger.error(
-                "1Password 'op' command not found at: {}".format(argv[0]))
-            cls.logger.error(
-                "See https://developer.1password.com/docs/cli for more information")
-            raise OPNotFoundException(argv[0], err.errno) from err
+            raise cls._op_not_found(argv, err) from err
 
         return output
 
+    @_hybridmethod
+    def _run_stream(cls, argv, chunk_size=STREAM_CHUNK_SIZE, env=environ, timeout=None) -> Iterator[bytes]:
+        """
+        Run 'op', yielding chunks of its stdout as they're read, rather than all of it
+        once 'op' exits
+
+        Stderr is spooled to a temporary file so 'op' can't block writing to it. If the
+        caller stops iterating early, 'op' is killed
+
+        The timeout, if any, covers the entire time 'op' runs, including time the
+        caller spends processing chunks between reads
+
+        NOTE: Streamed commands always run in the calling thread, so they don't count
+        toward a pooled executor's limit on concurrent 'op' processes
+
+        Raises
+        ------
+        OPCmdFailedException
+            If 'op' exits non-zero, after all of its output has been yielded
+        OPCmdTimeoutException
+            If 'op' is still running when the timeout or deadline expires
+        OPNotFoundException
+            If the 'op' command can't be found
+        """
+        cls.logger.debug(f"Running (streaming): {argv.cmd_str()}")
+        if timeout is None:
+            timeout = cls._timeout
+        remaining = _remaining(_command_deadline(timeout))
+        if remaining == 0:
+            raise cls._op_timed_out(argv, 0)
+        start = time.perf_counter()
+        try:
+            with tempfile.TemporaryFile() as stderr_file:
+                try:
+                    proc = subprocess.Popen(
+                        argv, stdout=subprocess.PIPE, stderr=stderr_file,
+                        env=_environ_snapshot(env))
+                except FileNotFoundError as err:
+                    raise cls._op_not_found(argv, err) from err
+
+                # reads block, so a timer kills 'op' at the deadline, which ends the read
+                timed_out = threading.Event()
+                killer = None
+                if remaining is not None:
+                    def _kill():
+                        timed_out.set()
+                        proc.kill()
+                    killer = threading.Timer(remaining, _kill)
+                    killer.daemon = True
+                    killer.start()
+                # with the default bufsize, Popen() makes stdout a buffered reader
+                stdout = cast(io.BufferedReader, proc.stdout)
+                try:
+                    while True:
+                        chunk = stdout.read1(chunk_size)
+                        if not chunk:
+                            break
+                        yield chunk
+                    returncode = proc.wait()
+                finally:
+                    if killer is not None:
+                        killer.cancel()
+                    if proc.returncode is None:
+                        proc.kill()
+                        proc.wait()
+                    stdout.close()
+
+                # if 'op' managed to exit successfully anyway, its output is complete
+                if timed_out.is_set() and returncode != 0:
+                    stderr_file.seek(0)
+                    raise cls._op_timed_out(argv, remaining, stderr_file.read())
+
+                if returncode != 0:
+                    stderr_file.seek(0)
+                    stderr_output = stderr_file.read().decode("utf-8").rstrip()
+                    if environ.get(LOG_OP_ERR_ENV_NAME) == "1":
+                        cls.logger.error(stderr_output)
+                    raise OPCmdFailedException(stderr_output, returncode)
+        finally:
+            elapsed = time.perf_counter() - start
+            cls._executor.record_latency(
+                cls._executor.command_name(argv), elapsed)
+
+    @classmethod
+    def _op_timed_out(cls, argv, timeout: float, stderr: Optional[bytes] = None) -> OPCmdTimeoutException:
+        stderr_output = ""
+        if stderr:
+            stderr_output = stderr.decode("utf-8", errors="replace").rstrip()
+        cls.logger.error(f"'op' timed out after {timeout:.3f}s: {argv.cmd_str()}")
+        return OPCmdTimeoutException(argv.cmd_str(), timeout, stderr_output)
+
+    @classmethod
+    def _op_not_found(cls, argv, err: FileNotFoundError) -> OPNotFoundException:
+        cls.logger.error(
+            "1Password 'op' command not found at: {}".format(argv[0]))
+        cls.logger.error(
+            "See https://developer.1password.com/docs/cli for more information")
+        return OPNotFoundException(argv[0], err.errno)
+
     @classmethod
     def set_logger(cls, logger: logging.Logger):
         cls.logger = logger
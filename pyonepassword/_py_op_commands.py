@@ -3,12 +3,25 @@ Description: A module that maps methods to to `op` commands and subcommands
 """
 import enum
 import logging
+import time
+import weakref
 from os import environ
-from typing import Mapping, Optional, Union
+from typing import Dict, Generator, Iterator, Mapping, Optional, Union
 
+from ._facts_cache import _FACTS_CACHE
 from ._op_cli_argv import _OPArgv
 from ._op_cli_config import OPCLIConfig
-from ._py_op_cli import _OPCLIExecute
+from ._py_op_cli import (
+    _ENVIRON_LOCK,
+    EXEC_MODE_ONE_SHOT,
+    STREAM_CHUNK_SIZE,
+    ExecModeEnum,
+    OPCommandLatency,
+    _hybridmethod,
+    _new_executor,
+    _OPCLIExecute
+)
+from ._response_cache import OPResponseCache
 from .account import OPAccount, OPAccountList
 from .op_cli_version import DOCUMENT_BYTES_BUG_VERSION, OPCLIVersion
 from .py_op_exceptions import (
@@ -17,11 +30,13 @@ from .py_op_exceptions import (
     OPDocumentGetException,
     OPGroupGetException,
     OPGroupListException,
+    OPInjectException,
     OPItemCreateException,
     OPItemDeleteException,
     OPItemGetException,
     OPItemListException,
     OPNotSignedInException,
+    OPReadException,
     OPSigninException,
     OPUnknownAccountException,
     OPUserGetException,
@@ -63,7 +78,11 @@ class _OPCommandInterface(_OPCLIExecute):
                  vault: str = None,
                  password_prompt: bool = True,
                  op_path: str = OP_PATH,
-                 logger: logging.Logger = None):
+                 logger: logging.Logger = None,
+                 exec_mode: ExecModeEnum = EXEC_MODE_ONE_SHOT,
+                 pool_size: Optional[int] = None,
+                 response_cache: Optional[OPResponseCache] = None,
+                 timeout: Optional[float] = None):
         """
         Constructor to authenticate or verify existing authentication to `op`
         """
@@ -75,6 +94,18 @@ class _OPCommandInterface(_OPCLIExecute):
         self.vault = vault
         self.logger = logger
 
+        # every command this object runs, including sign-in, goes through its executor
+        self._executor = _new_executor(exec_mode=exec_mode, pool_size=pool_size)
+        # stop the executor's workers, if any, once this object is discarded. The
+        # finalizer mustn't refer to this object, or it would never be collected
+        self._executor_finalizer = weakref.finalize(
+            self, self._executor.shutdown, False)
+        # likewise, every command it runs is subject to its default timeout, if any
+        self._timeout = timeout
+        self._response_cache = response_cache
+        self._signin_stale = True
+        self._last_verified: Optional[float] = None
+
         # Coerce existing_auth to an Enum in case it was passed in as a legacy bool
         # False -> ExistingAuthFlag.NONE, True -> ExistingAuthFlag.AVAILABLE
         existing_auth = ExistingAuthEnum(existing_auth)
@@ -113,7 +144,8 @@ class _OPCommandInterface(_OPCLIExecute):
                 # and compute the session environment variable name
                 self._account_identifier = account_obj.user_uuid
                 self._sess_var = self._compute_session_var_name()
-            environ[self._sess_var] = self.token
+            with _ENVIRON_LOCK:
+                environ[self._sess_var] = self.token
 
     @property
     def token(self) -> str:
@@ -123,6 +155,79 @@ class _OPCommandInterface(_OPCLIExecute):
     def session_var(self) -> str:
         return self._sess_var
 
+    @property
+    def exec_mode(self) -> ExecModeEnum:
+        return self._executor.EXEC_MODE
+
+    def close(self):
+        """
+        Release the resources this object holds, such as a pooled executor's worker
+        threads, waiting for any commands still running to finish. No more commands can
+        be run afterward
+
+        This also happens, without waiting, when the object is garbage collected. Objects
+        can be used as context managers, so they're closed on leaving the 'with' block
+
+        NOTE: This doesn't sign out of 1Password. See OP.signout()
+        """
+        if self._executor_finalizer.detach() is not None:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def timeout(self) -> Optional[float]:
+        """
+        The default timeout, in seconds, for each 'op' command this object runs, or None
+        if commands may run indefinitely
+        """
+        return self._timeout
+
+    def latency_stats(self) -> Dict[str, OPCommandLatency]:
+        """
+        Per-command latency statistics for every 'op' command run by this object,
+        keyed by command name (e.g., 'item get')
+        """
+        return self._executor.latency_stats()
+
+    def _response_cache_account(self) -> str:
+        account = self._signed_in_account
+        return f"{account.account_uuid}/{account.user_uuid}"
+
+    def _run_cacheable(self, argv, decode=None, refresh_cache=False):
+        """
+        Run a read-only command, serving its output from the response cache if there is one
+
+        If 'refresh_cache' is True, the command is always run, and its output replaces
+        any cached response
+        """
+        output = None
+        if self._response_cache is not None and not refresh_cache:
+            output = self._response_cache.get(
+                argv, self._response_cache_account())
+            if output is not None:
+                self.logger.debug(f"Response cache hit: {argv.cmd_str()}")
+
+        if output is None:
+            output = self._run(argv, capture_stdout=True)
+            if self._response_cache is not None:
+                self._response_cache.put(
+                    argv, self._response_cache_account(), output)
+
+        if decode:
+            return output.decode(decode)
+        return output
+
+    def _invalidate_response_cache(self):
+        # after any change to the account, none of its cached responses can be trusted
+        if self._response_cache is not None:
+            self._response_cache.clear(
+                account=self._response_cache_account())
+
     @classmethod
     def uses_biometric(cls, op_path: str = "op", encoding: str = "utf-8", account_list: OPAccountList = None):
         uses_bio = True
@@ -142,9 +247,21 @@ class _OPCommandInterface(_OPCLIExecute):
         return uses_bio
 
     def _gather_facts(self):
-        self._op_config = OPCLIConfig()
-        self._cli_version = self._get_cli_version(self.op_path)
-        self._account_list = self._get_account_list(self.op_path)
+        # these facts rarely change, so they're cached process-wide and only
+        # gathered again if the 'op' binary or its config file changes
+        op_identity = _FACTS_CACHE.op_identity(self.op_path)
+        config_path = OPCLIConfig._get_config_path()
+        config_identity = _FACTS_CACHE.file_identity(config_path)
+        account_list_identity = None
+        if op_identity and config_identity:
+            account_list_identity = (op_identity, config_identity)
+
+        self._op_config = _FACTS_CACHE.fact(
+            "op-config", config_identity, lambda: OPCLIConfig(configpath=config_path))
+        self._cli_version = _FACTS_CACHE.fact(
+            "cli-version", op_identity, lambda: self._get_cli_version(self.op_path))
+        self._account_list = _FACTS_CACHE.fact(
+            "account-list", account_list_identity, lambda: self._get_account_list(self.op_path))
         self._uses_bio = self.uses_biometric(
             op_path=self.op_path, account_list=self._account_list)
         self._account_identifier = self._normalize_account_id()
@@ -157,7 +274,7 @@ class _OPCommandInterface(_OPCLIExecute):
         cli_version = OPCLIVersion(output)
         return cli_version
 
-    @classmethod
+    @_hybridmethod
     def _get_account_list(cls, op_path, decode="utf-8") -> OPAccountList:
         account_list_json = cls._signed_in_accounts(op_path, decode=decode)
         account_list = OPAccountList(account_list_json)
@@ -242,7 +359,8 @@ class _OPCommandInterface(_OPCLIExecute):
             # make a copy of environment rather than modifying actual env
             # in order to verify login
             # we'll offically set it once we know it works
-            env = dict(environ)
+            with _ENVIRON_LOCK:
+                env = dict(environ)
             env[self._sess_var] = token
         else:
             # we don't have a token to verify
@@ -260,23 +378,87 @@ class _OPCommandInterface(_OPCLIExecute):
                 argv, capture_stdout=True, decode="utf-8", env=env)
             account = OPAccount(account_json)
         except OPCmdFailedException as opfe:
-            # scrape error message about not being signed in
-
-            fragments = [self.NO_ACTIVE_SESSION_FOUND_TEXT,
-                         self.NOT_SIGNED_IN_TEXT,
-                         self.NO_SESSION_TOKEN_FOUND_TEXT,
-                         self.ACCT_IS_NOT_SIGNED_IN_TEXT]
-            unknown_err = True
-            for frag in fragments:
-                if frag in opfe.err_output:
-                    unknown_err = False
-                    break
             # there was a different error so raise the exception
-            if unknown_err:  # pragma: no cover
+            if not self._is_not_signed_in_error(opfe):  # pragma: no cover
                 raise opfe
 
+        if account:
+            self._signin_stale = False
+            self._last_verified = time.monotonic()
         return account
 
+    @classmethod
+    def _is_not_signed_in_error(cls, opfe: OPCmdFailedException) -> bool:
+        # scrape error message about not being signed in
+        fragments = [cls.NO_ACTIVE_SESSION_FOUND_TEXT,
+                     cls.NOT_SIGNED_IN_TEXT,
+                     cls.NO_SESSION_TOKEN_FOUND_TEXT,
+                     cls.ACCT_IS_NOT_SIGNED_IN_TEXT]
+        not_signed_in = False
+        for frag in fragments:
+            if frag in opfe.err_output:
+                not_signed_in = True
+                break
+        return not_signed_in
+
+    def _note_cmd_failure(self, opfe: OPCmdFailedException):
+        # remember that the session went away, so whoever shares this object
+        # knows to verify (or redo) sign-in before trusting it again
+        if self._is_not_signed_in_error(opfe):
+            self._signin_stale = True
+
+    @_hybridmethod
+    def _run(cls, argv, capture_stdout=False, input_string=None, decode=None, env=environ, timeout=None):
+        try:
+            output = super()._run(argv, capture_stdout=capture_stdout,
+                                  input_string=input_string, decode=decode, env=env,
+                                  timeout=timeout)
+        except OPCmdFailedException as opfe:
+            if isinstance(cls, _OPCommandInterface):
+                cls._note_cmd_failure(opfe)
+            raise
+        return output
+
+    @_hybridmethod
+    def _run_stream(cls, argv, chunk_size=STREAM_CHUNK_SIZE, env=environ, timeout=None) -> Iterator[bytes]:
+        try:
+            yield from super()._run_stream(argv, chunk_size=chunk_size, env=env, timeout=timeout)
+        except OPCmdFailedException as opfe:
+            if isinstance(cls, _OPCommandInterface):
+                cls._note_cmd_failure(opfe)
+            raise
+
+    @property
+    def signin_stale(self) -> bool:
+        """
+        Whether sign-in needs to be verified again, either because a command failed
+        with a "not signed in" error, or sign-in has never been verified
+        """
+        return self._signin_stale
+
+    def seconds_since_verified(self) -> Optional[float]:
+        """
+        Seconds since sign-in was last successfully verified, or None if it never was
+        """
+        elapsed = None
+        if self._last_verified is not None:
+            elapsed = time.monotonic() - self._last_verified
+        return elapsed
+
+    def reverify_signin(self) -> bool:
+        """
+        Check, via 'op whoami', that this object's session is still signed in
+
+        Returns
+        -------
+        bool
+            True if the session is still signed in, False otherwise
+        """
+        account = self._verify_signin(token=self.token)
+        if account is None:
+            self._signin_stale = True
+        return account is not None
+
     def _do_normal_signin(self, password: str, password_prompt: bool) -> Union[str, None]:
         # normalize empty string to None, otherwise use password as given
         password = None if password == "" else password
@@ -397,12 +579,26 @@ class _OPCommandInterface(_OPCLIExecute):
             self.op_path, group_name_or_id=group_name_or_id, user_name_or_id=user_name_or_id)
         return vault_list_argv
 
-    def _item_get(self, item_name_or_id, vault=None, fields=None, include_archive=False, decode="utf-8"):
+    def _item_get(self, item_name_or_id, vault=None, fields=None, include_archive=False, decode="utf-8", refresh_cache=False):
         get_item_argv = self._item_get_argv(
             item_name_or_id, vault=vault, fields=fields, include_archive=include_archive)
         try:
-            output = self._run(
-                get_item_argv, capture_stdout=True, decode=decode)
+            output = self._run_cacheable(
+                get_item_argv, decode=decode, refresh_cache=refresh_cache)
+        except OPCmdFailedException as ocfe:
+            raise OPItemGetException.from_opexception(ocfe) from ocfe
+
+        return output
+
+    def _item_get_multiple(self, batch_json, vault=None, include_archive=False, decode="utf-8"):
+        # op item get takes '-' for the item to get if objects are
+        # provided over stdin
+        item_id = "-"
+        get_item_argv = self._item_get_argv(
+            item_id, vault=vault, include_archive=include_archive)
+        try:
+            output = self._run(get_item_argv, capture_stdout=True,
+                               input_string=batch_json, decode=decode)
         except OPCmdFailedException as ocfe:
             raise OPItemGetException.from_opexception(ocfe) from ocfe
 
@@ -417,6 +613,7 @@ class _OPCommandInterface(_OPCLIExecute):
             self._run(item_delete_argv, decode=decode)
         except OPCmdFailedException as ocfe:
             raise OPItemDeleteException.from_opexception(ocfe)
+        self._invalidate_response_cache()
 
         return
 
@@ -432,6 +629,7 @@ class _OPCommandInterface(_OPCLIExecute):
             self._run(item_delete_argv, input_string=batch_json)
         except OPCmdFailedException as ocfe:
             raise OPItemDeleteException.from_opexception(ocfe)
+        self._invalidate_response_cache()
 
         return
 
@@ -470,12 +668,59 @@ class _OPCommandInterface(_OPCLIExecute):
         except OPCmdFailedException as ocfe:
             raise OPDocumentGetException.from_opexception(ocfe) from ocfe
 
+        document_bytes = self._trim_document_bytes(document_bytes)
+
+        return document_bytes
+
+    def _document_get_stream(self,
+                             document_name_or_id: str,
+                             vault: Optional[str] = None,
+                             include_archive: Optional[bool] = False) -> Generator[bytes, None, None]:
+        """
+        Download a document object from a 1Password vault by name or UUID, yielding
+        its bytes in chunks as they're read from 'op'
+
+        Raises
+        ------
+        OPDocumentGetException
+            If the lookup fails for any reason, possibly after some chunks have been yielded
+        OPNotFoundException
+            If the 1Password command can't be found
+        """
+        get_document_argv = self._document_get_argv(
+            document_name_or_id, vault=vault, include_archive=include_archive)
+
+        chunks = self._run_stream(get_document_argv)
+        if self._cli_version <= DOCUMENT_BYTES_BUG_VERSION:  # pragma: no cover
+            chunks = self._trim_document_stream(chunks)
+        try:
+            yield from chunks
+        except OPCmdFailedException as ocfe:
+            raise OPDocumentGetException.from_opexception(ocfe) from ocfe
+
+    @staticmethod
+    def _trim_document_stream(chunks: Iterator[bytes]) -> Iterator[bytes]:
+        # op v2.x appends an erroneous \x0a ('\n') byte to document bytes
+        # hold back the last byte read until we know whether it's the last byte of all,
+        # and drop it if it's the erroneous one
+        held = b""
+        for chunk in chunks:
+            if not chunk:
+                continue
+            if held:
+                yield held
+            if len(chunk) > 1:
+                yield chunk[:-1]
+            held = chunk[-1:]
+        if held and held != b"\n":
+            yield held
+
+    def _trim_document_bytes(self, document_bytes: bytes) -> bytes:
         if self._cli_version <= DOCUMENT_BYTES_BUG_VERSION:  # pragma: no cover
             # op v2.x appends an erroneous \x0a ('\n') byte to document bytes
             # trim it off if its present
             if document_bytes[-1] == 0x0a:
                 document_bytes = document_bytes[:-1]
-
         return document_bytes
 
     def _document_delete(self, document_name_or_id: str, vault: Optional[str] = None, archive=False):
@@ -488,10 +733,11 @@ class _OPCommandInterface(_OPCLIExecute):
             self._run(document_delete_argv)
         except OPCmdFailedException as ocfe:
             raise OPDocumentDeleteException.from_opexception(ocfe)
+        self._invalidate_response_cache()
 
         return
 
-    @classmethod
+    @_hybridmethod
     def _signed_in_accounts(cls, op_path, decode="utf-8"):
         account_list_argv = cls._account_list_argv(op_path, encoding=decode)
         output = cls._run(account_list_argv,
@@ -501,9 +747,7 @@ class _OPCommandInterface(_OPCLIExecute):
     def _user_get(self, user_name_or_id: str, decode: str = "utf-8") -> str:
         get_user_argv = self._user_get_argv(user_name_or_id)
         try:
-            output = self._run(
-                get_user_argv, capture_stdout=True, decode=decode
-            )
+            output = self._run_cacheable(get_user_argv, decode=decode)
         except OPCmdFailedException as ocfe:
             raise OPUserGetException.from_opexception(ocfe) from ocfe
         return output
@@ -512,9 +756,7 @@ class _OPCommandInterface(_OPCLIExecute):
         user_list_argv = self._user_list_argv(
             group_name_or_id=group_name_or_id, vault=vault)
         try:
-            output = self._run(
-                user_list_argv, capture_stdout=True, decode=decode
-            )
+            output = self._run_cacheable(user_list_argv, decode=decode)
         except OPCmdFailedException as ocfe:
             raise OPUserListException.from_opexception(ocfe)
         return output
@@ -522,9 +764,7 @@ class _OPCommandInterface(_OPCLIExecute):
     def _group_get(self, group_name_or_id: str, decode: str = "utf-8") -> str:
         group_get_argv = self._group_get_argv(group_name_or_id)
         try:
-            output = self._run(
-                group_get_argv, capture_stdout=True, decode=decode
-            )
+            output = self._run_cacheable(group_get_argv, decode=decode)
         except OPCmdFailedException as ocfe:
             raise OPGroupGetException.from_opexception(ocfe) from ocfe
         return output
@@ -533,9 +773,7 @@ class _OPCommandInterface(_OPCLIExecute):
         group_list_argv = self._group_list_argv(
             user_name_or_id=user_name_or_id, vault=vault)
         try:
-            output = self._run(
-                group_list_argv, capture_stdout=True, decode=decode
-            )
+            output = self._run_cacheable(group_list_argv, decode=decode)
         except OPCmdFailedException as ocfe:
             raise OPGroupListException.from_opexception(ocfe)
         return output
@@ -543,9 +781,7 @@ class _OPCommandInterface(_OPCLIExecute):
     def _vault_get(self, vault_name_or_id: str, decode: str = "utf-8") -> str:
         vault_get_argv = self._vault_get_argv(vault_name_or_id)
         try:
-            output = self._run(
-                vault_get_argv, capture_stdout=True, decode=decode
-            )
+            output = self._run_cacheable(vault_get_argv, decode=decode)
         except OPCmdFailedException as ocfe:
             raise OPVaultGetException.from_opexception(ocfe)
         return output
@@ -554,8 +790,7 @@ class _OPCommandInterface(_OPCLIExecute):
         vault_list_argv = self._vault_list_argv(
             group_name_or_id=group_name_or_id, user_name_or_id=user_name_or_id)
         try:
-            output = self._run(
-                vault_list_argv, capture_stdout=True, decode=decode)
+            output = self._run_cacheable(vault_list_argv, decode=decode)
         except OPCmdFailedException as ocfe:
             raise OPVaultListException.from_opexception(ocfe)
         return output
@@ -575,21 +810,56 @@ class _OPCommandInterface(_OPCLIExecute):
         argv = _OPArgv.forget_argv(op_path, account)
         cls._run(argv)
 
+    def _inject_argv(self):
+        inject_argv = _OPArgv.inject_argv(self.op_path)
+        return inject_argv
+
+    def _read_argv(self, reference: str):
+        read_argv = _OPArgv.read_argv(self.op_path, reference)
+        return read_argv
+
+    def _inject(self, template: str, decode: str = "utf-8") -> str:
+        inject_argv = self._inject_argv()
+        try:
+            output = self._run(inject_argv, capture_stdout=True,
+                               input_string=template, decode=decode)
+        except OPCmdFailedException as ocfe:
+            raise OPInjectException.from_opexception(ocfe) from ocfe
+        return output
+
+    def _read(self, reference: str, decode: str = "utf-8") -> str:
+        read_argv = self._read_argv(reference)
+        try:
+            output = self._run(read_argv, capture_stdout=True, decode=decode)
+        except OPCmdFailedException as ocfe:
+            raise OPReadException.from_opexception(ocfe) from ocfe
+        return output
+
     def _item_list_argv(self, categories=[], include_archive=False, tags=[], vault=None):
         vault_arg = vault if vault else self.vault
         list_items_argv = _OPArgv.item_list_argv(self.op_path,
                                                  categories=categories, include_archive=include_archive, tags=tags, vault=vault_arg)
         return list_items_argv
 
-    def _item_list(self, categories=[], include_archive=False, tags=[], vault=None, decode="utf-8"):
+    def _item_list(self, categories=[], include_archive=False, tags=[], vault=None, decode="utf-8", refresh_cache=False):
         argv = self._item_list_argv(
             categories=categories, include_archive=include_archive, tags=tags, vault=vault)
         try:
-            output = self._run(argv, capture_stdout=True, decode=decode)
+            output = self._run_cacheable(
+                argv, decode=decode, refresh_cache=refresh_cache)
         except OPCmdFailedException as e:
             raise OPItemListException.from_opexception(e)
         return output
 
+    def _item_list_stream(self, categories=[], include_archive=False, tags=[], vault=None) -> Iterator[bytes]:
+        # bypasses the response cache, since caching would mean holding the entire output
+        argv = self._item_list_argv(
+            categories=categories, include_archive=include_archive, tags=tags, vault=vault)
+        try:
+            yield from self._run_stream(argv)
+        except OPCmdFailedException as e:
+            raise OPItemListException.from_opexception(e)
+
     def _item_create_argv(self, item, password_recipe, vault):
         vault_arg = vault if vault else self.vault
         create_item_argv = _OPArgv.item_create_argv(
@@ -603,5 +873,6 @@ class _OPCommandInterface(_OPCLIExecute):
             output = self._run(argv, capture_stdout=True, decode=decode)
         except OPCmdFailedException as e:
             raise OPItemCreateException.from_opexception(e)
+        self._invalidate_response_cache()
 
         return output
@@ -0,0 +1,254 @@
+"""
+Disk-backed cache of raw 'op' responses, so separate processes on the same host
+can share the results of read-only commands instead of each spawning 'op'
+"""
+import hashlib
+import json
+import os
+import stat
+import tempfile
+import time
+from typing import List, Optional
+
+try:
+    # optional: only needed for OPFernetKeyProvider
+    from cryptography.fernet import (  # type: ignore[import-not-found]
+        Fernet,
+        InvalidToken
+    )
+except ImportError:  # pragma: no coverage
+    Fernet = None
+
+from .py_op_exceptions import OPResponseCacheException
+
+
+class OPResponseCacheKeyProvider:
+    """
+    Base class for at-rest protection of cached responses. Subclasses override
+    encrypt() and decrypt() to encrypt responses with a key of their choosing,
+    e.g., one fetched from a key management service
+
+    This base class stores responses as-is, with no encryption
+    """
+
+    def encrypt(self, plaintext: bytes) -> bytes:
+        return plaintext
+
+    def decrypt(self, ciphertext: bytes) -> bytes:
+        """
+        Decrypt a cached response. Implementations should raise an exception if
+        the response can't be authenticated or decrypted, and it will be treated as a cache miss
+        """
+        return ciphertext
+
+
+class OPFernetKeyProvider(OPResponseCacheKeyProvider):
+    """
+    Key provider that encrypts cached responses with Fernet (AES-128-CBC + HMAC-SHA256)
+
+    Requires the 'cryptography' package
+    """
+
+    def __init__(self, key: bytes):
+        """
+        Parameters
+        ----------
+        key : bytes
+            A URL-safe base64-encoded 32-byte key, e.g., from Fernet.generate_key()
+
+        Raises
+        ------
+        OPResponseCacheException
+            If the 'cryptography' package isn't installed
+        """
+        if Fernet is None:
+            raise OPResponseCacheException(
+                "The 'cryptography' package is required for OPFernetKeyProvider")
+        self._fernet = Fernet(key)
+
+    def encrypt(self, plaintext: bytes) -> bytes:
+        return self._fernet.encrypt(plaintext)
+
+    def decrypt(self, ciphertext: bytes) -> bytes:
+        try:
+            plaintext = self._fernet.decrypt(ciphertext)
+        except InvalidToken as e:
+            raise OPResponseCacheException(
+                "Unable to decrypt cached response") from e
+        return plaintext
+
+
+class OPResponseCache:
+    """
+    A directory of cached 'op' responses, keyed by the command's argument list and the
+    signed-in account. Each response lives in its own file, readable and writable only by
+    the owner (mode 0600), and expires 'ttl' seconds after it was written
+
+    Identical commands from different processes map to the same cache entry, and
+    OPItemList sorts list responses after parsing, so a cached list is indistinguishable
+    from a fresh one
+
+    Since responses may contain secrets, a key provider that encrypts them is required,
+    unless storing them in plaintext is explicitly allowed
+    """
+    DEFAULT_TTL = 300.0
+    CACHE_FILE_SUFFIX = ".op-response"
+
+    def __init__(self,
+                 cache_dir: str,
+                 ttl: float = DEFAULT_TTL,
+                 key_provider: Optional[OPResponseCacheKeyProvider] = None,
+                 allow_plaintext: bool = False):
+        """
+        Create or open a response cache, to be passed to OP(response_cache=...)
+
+        Parameters
+        ----------
+        cache_dir : str
+            Directory to hold cached responses. It is created with mode 0700 if it doesn't
+            exist. If it does exist, it must be owned by the current user, and any group or
+            other permissions are removed
+        ttl : float, optional
+            Number of seconds a cached response remains valid, by default 300
+        key_provider : OPResponseCacheKeyProvider, optional
+            Encrypts and decrypts cached responses, e.g., OPFernetKeyProvider
+        allow_plaintext : bool, optional
+            Allow responses to be stored unencrypted, if 'key_provider' isn't given or
+            doesn't encrypt, by default False
+
+        Raises
+        ------
+        OPResponseCacheException
+            - If responses would be stored in plaintext without 'allow_plaintext'
+            - If 'cache_dir' is owned by another user
+        """
+        if not key_provider:
+            key_provider = OPResponseCacheKeyProvider()
+        if self._is_plaintext(key_provider) and not allow_plaintext:
+            raise OPResponseCacheException(
+                "Cached responses would be stored unencrypted. Provide a key provider that "
+                "encrypts, or pass allow_plaintext=True")
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.key_provider = key_provider
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        self._secure_cache_dir(cache_dir)
+
+    @staticmethod
+    def _is_plaintext(key_provider: OPResponseCacheKeyProvider) -> bool:
+        # providers that don't override encrypt() store responses as-is
+        return type(key_provider).encrypt is OPResponseCacheKeyProvider.encrypt
+
+    @staticmethod
+    def _secure_cache_dir(cache_dir: str):
+        """
+        Ensure an existing cache directory is owned by the current user, and accessible
+        only by that user
+
+        makedirs() leaves an existing directory alone, whoever owns it and whatever its
+        mode. Ownership and permissions aren't checked on Windows
+        """
+        if not hasattr(os, "getuid"):  # pragma: no coverage
+            return
+        st = os.stat(cache_dir)
+        if st.st_uid != os.getuid():
+            raise OPResponseCacheException(
+                f"Response cache directory isn't owned by the current user: {cache_dir}")
+        if stat.S_IMODE(st.st_mode) & 0o077:
+            os.chmod(cache_dir, 0o700)
+
+    @staticmethod
+    def _digest(obj) -> str:
+        serialized = json.dumps(obj, separators=(",", ":"))
+        digest = hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+        return digest
+
+    def cache_path(self, argv: List[str], account: str) -> str:
+        """
+        Path to the cache file for 'argv' run against 'account'
+
+        File names are <account digest>-<argv digest> so every entry belonging to an
+        account can be cleared without reading any files
+        """
+        account_digest = self._digest(account)[:16]
+        argv_digest = self._digest(list(argv))
+        fname = f"{account_digest}-{argv_digest}{self.CACHE_FILE_SUFFIX}"
+        return os.path.join(self.cache_dir, fname)
+
+    def get(self, argv: List[str], account: str) -> Optional[bytes]:
+        """
+        Look up the cached response for 'argv' run against 'account',
+        returning None if it's not cached, has expired, or can't be decrypted
+        """
+        cache_path = self.cache_path(argv, account)
+        try:
+            fd = os.open(cache_path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+        except OSError:
+            return None
+
+        with os.fdopen(fd, "rb") as f:
+            mtime = os.fstat(f.fileno()).st_mtime
+            ciphertext = f.read()
+
+        if mtime + self.ttl <= time.time():
+            self._remove(cache_path)
+            return None
+
+        try:
+            response = self.key_provider.decrypt(ciphertext)
+        except Exception:
+            # corrupted, tampered, or encrypted with a different key
+            self._remove(cache_path)
+            return None
+        return response
+
+    def put(self, argv: List[str], account: str, response: bytes):
+        """
+        Cache 'response' for 'argv' run against 'account'
+
+        The file is written to a temporary name and renamed into place, so concurrent
+        readers never see a partially written response
+        """
+        cache_path = self.cache_path(argv, account)
+        ciphertext = self.key_provider.encrypt(response)
+        # mkstemp() creates the file with mode 0600
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(ciphertext)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+
+    def clear(self, account: Optional[str] = None) -> int:
+        """
+        Remove cached responses
+
+        Parameters
+        ----------
+        account : str, optional
+            Only remove responses cached for this account, by default remove everything
+
+        Returns
+        -------
+        int
+            The number of responses removed
+        """
+        prefix = ""
+        if account is not None:
+            prefix = self._digest(account)[:16] + "-"
+        removed = 0
+        for fname in os.listdir(self.cache_dir):
+            if fname.startswith(prefix) and fname.endswith(self.CACHE_FILE_SUFFIX):
+                if self._remove(os.path.join(self.cache_dir, fname)):
+                    removed += 1
+        return removed
+
+    @staticmethod
+    def _remove(path) -> bool:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            return False
+        return True
@@ -0,0 +1,15 @@
+from .._facts_cache import clear_facts_cache
+from .._item_cache import OPItemCache, OPItemCacheKey, OPItemCacheRevalidation
+from .._response_cache import (
+    OPFernetKeyProvider,
+    OPResponseCache,
+    OPResponseCacheKeyProvider
+)
+
+__all__ = ["clear_facts_cache",
+           "OPItemCache",
+           "OPItemCacheKey",
+           "OPItemCacheRevalidation",
+           "OPFernetKeyProvider",
+           "OPResponseCache",
+           "OPResponseCacheKeyProvider"]
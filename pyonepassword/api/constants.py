@@ -1,3 +1,9 @@
+from .._document_download import (
+    DOCUMENT_DOWNLOADED,
+    DOCUMENT_FAILED,
+    DOCUMENT_SKIPPED
+)
+from .._py_op_cli import EXEC_MODE_ONE_SHOT, EXEC_MODE_POOLED, ExecModeEnum
 # expect more recipe constants to be added over time
 from ..op_items.password_recipe import (
     LETTERS_DIGITS_25,
@@ -8,6 +14,12 @@ from ..op_items.password_recipe import (
 # https://mypy.readthedocs.io/en/stable/config_file.html?highlight=export#confval-implicit_reexport
 # anything that gets imported needs to be added to this list
 __all__ = [
+    "DOCUMENT_DOWNLOADED",
+    "DOCUMENT_FAILED",
+    "DOCUMENT_SKIPPED",
+    "EXEC_MODE_ONE_SHOT",
+    "EXEC_MODE_POOLED",
+    "ExecModeEnum",
     "LETTERS_DIGITS_25",
     "LETTERS_DIGITS_SYMBOLS_20"
 ]
@@ -20,20 +20,25 @@ from ..op_objects import (
 )
 from ..py_op_exceptions import (
     OPCmdFailedException,
+    OPCmdTimeoutException,
     OPConfigNotFoundException,
     OPDocumentDeleteException,
     OPDocumentGetException,
     OPForgetException,
     OPGroupGetException,
     OPGroupListException,
+    OPInjectException,
     OPInvalidDocumentException,
     OPInvalidItemException,
+    OPInvalidTOTPException,
     OPItemDeleteException,
     OPItemDeleteMultipleException,
     OPItemGetException,
     OPItemListException,
     OPNotFoundException,
     OPNotSignedInException,
+    OPReadException,
+    OPResponseCacheException,
     OPSigninException,
     OPSignoutException,
     OPUnknownAccountException,
@@ -47,20 +52,25 @@ from ..py_op_exceptions import (
 # https://mypy.readthedocs.io/en/stable/config_file.html?highlight=export#confval-implicit_reexport
 # anything that gets imported needs to be added to this list
 __all__ = ["OPCmdFailedException",
+           "OPCmdTimeoutException",
            "OPConfigNotFoundException",
            "OPDocumentDeleteException",
            "OPDocumentGetException",
            "OPForgetException",
            "OPGroupGetException",
            "OPGroupListException",
+           "OPInjectException",
            "OPInvalidDocumentException",
            "OPInvalidItemException",
+           "OPInvalidTOTPException",
            "OPItemDeleteException",
            "OPItemDeleteMultipleException",
            "OPItemGetException",
            "OPItemListException",
            "OPNotFoundException",
            "OPNotSignedInException",
+           "OPReadException",
+           "OPResponseCacheException",
            "OPSigninException",
            "OPSignoutException",
            "OPUnknownAccountException",
@@ -1,3 +1,8 @@
+from .._document_download import (
+    OPDocumentDownload,
+    OPDocumentManifest,
+    OPDocumentManifestEntry
+)
 from ..account import OPAccount
 from ..op_items._item_list import OPItemList
 from ..op_items._new_field_registry import OPNewItemField
@@ -12,6 +17,13 @@ from ..op_items._new_fields import (
 from ..op_items._new_item import OPNewSection
 from ..op_items._op_items_base import OPAbstractItem
 from ..op_items.api_credential import OPAPICredentialItem
+from ..op_items.compact_item import (
+    OPCompactField,
+    OPCompactFile,
+    OPCompactItem,
+    OPCompactSection,
+    OPCompactURL
+)
 from ..op_items.credit_card import OPCreditCardItem
 from ..op_items.database import OPDatabaseItem, OPDatabaseItemRelaxedValidation
 from ..op_items.document import OPDocumentFile, OPDocumentItem
@@ -30,7 +42,7 @@ from ..op_items.password_recipe import OPPasswordRecipe
 from ..op_items.secure_note import OPSecureNoteItem
 from ..op_items.server import OPServerItem, OPServerItemRelaxedValidation
 from ..op_items.ssh_key import OPSSHKeyItem
-from ..op_items.totp import OPTOTPItem
+from ..op_items.totp import OPTOTPGenerator, OPTOTPItem, OPTOTPProvider
 from ..op_objects import OPGroup, OPUser, OPVault
 
 # This causes these types to properly re-exported
@@ -38,6 +50,9 @@ from ..op_objects import OPGroup, OPUser, OPVault
 # anything that gets imported needs to be added to this list
 __all__ = [
     "OPAccount",
+    "OPDocumentDownload",
+    "OPDocumentManifest",
+    "OPDocumentManifestEntry",
     "OPItemList",
     "OPNewItemField",
     "OPNewConcealedField",
@@ -49,6 +64,11 @@ __all__ = [
     "OPNewSection",
     "OPAbstractItem",
     "OPAPICredentialItem",
+    "OPCompactField",
+    "OPCompactFile",
+    "OPCompactItem",
+    "OPCompactSection",
+    "OPCompactURL",
     "OPCreditCardItem",
     "OPDocumentFile",
     "OPDocumentItem",
@@ -70,7 +90,9 @@ __all__ = [
     "OPServerItem",
     "OPServerItemRelaxedValidation",
     "OPSSHKeyItem",
+    "OPTOTPGenerator",
     "OPTOTPItem",
+    "OPTOTPProvider",
     "OPGroup",
     "OPUser",
     "OPVault"
@@ -0,0 +1,25 @@
+from ..json import (
+    OPJSONCodec,
+    OPOrjsonCodec,
+    available_json_codecs,
+    get_json_codec,
+    set_json_codec
+)
+from ..op_items.item_parsing_policy import (
+    disable_lazy_item_maps,
+    enable_lazy_item_maps,
+    get_lazy_item_maps,
+    set_eager_item_maps_for_class,
+    set_lazy_item_maps_for_class
+)
+
+__all__ = ["OPJSONCodec",
+           "OPOrjsonCodec",
+           "available_json_codecs",
+           "get_json_codec",
+           "set_json_codec",
+           "enable_lazy_item_maps",
+           "disable_lazy_item_maps",
+           "get_lazy_item_maps",
+           "set_lazy_item_maps_for_class",
+           "set_eager_item_maps_for_class"]
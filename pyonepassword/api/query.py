@@ -0,0 +1,5 @@
+from ..op_items.item_query import OPItemQuery, OPTag, OPTagExpression
+
+__all__ = ["OPItemQuery",
+           "OPTag",
+           "OPTagExpression"]
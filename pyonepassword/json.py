@@ -1,12 +1,272 @@
+"""
+JSON encoding & decoding for pyonepassword
+
+All JSON goes through a pluggable codec. By default the fastest codec available is used:
+'orjson' if it's installed (pip install pyonepassword[orjson]), otherwise the standard
+library's 'json' module. Codecs decode 'op' output directly from the bytes it was read as,
+without decoding to str first
+
+Every codec serializes with the 'json' module, so serialized JSON, such as
+OPItemList.serialize() output, or JSON piped to 'op', doesn't depend on what's installed
+"""
+import codecs
+import itertools
 import json
+import re
+from typing import Dict, Iterable, Iterator, List, Type, Union
+
+try:
+    # optional accelerated JSON parser
+    import orjson
+except ImportError:  # pragma: no coverage
+    orjson = None
+
+JSONInput = Union[str, bytes, bytearray, memoryview]
+
+_JSON_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+# iter_json_array() parsing states
+_ARRAY_START = 0        # expecting '['
+_ARRAY_FIRST_VALUE = 1  # expecting the first element or ']'
+_ARRAY_VALUE = 2        # expecting an element
+_ARRAY_SEPARATOR = 3    # expecting ',' or ']'
+_ARRAY_END = 4          # expecting nothing more
+
+
+class OPJSONCodec:
+    """
+    JSON codec using the standard library 'json' module, and base class for other codecs
+
+    Subclasses override loads(), which must accept str, bytes, bytearray, or memoryview,
+    and raise json.JSONDecodeError (or a subclass of it) on invalid JSON. dumps() output
+    must stay identical to json.dumps() output
+    """
+    NAME = "json"
+
+    def loads(self, data: JSONInput):
+        if isinstance(data, memoryview):
+            # json.loads() accepts bytes but not memoryview
+            data = data.tobytes()
+        return json.loads(data)
+
+    def dumps(self, obj, indent=None) -> str:
+        return json.dumps(obj, indent=indent)
+
+    def dump(self, obj, fp, indent=None):
+        """
+        Serialize 'obj' to the text file object 'fp'
+        """
+        fp.write(self.dumps(obj, indent=indent))
+
+
+class OPOrjsonCodec(OPJSONCodec):
+    """
+    JSON codec that decodes with 'orjson'
+
+    Serializing still uses the 'json' module, since 'orjson' output differs from it, e.g.,
+    in whitespace, and in writing non-ASCII characters unescaped
+
+    Requires the 'orjson' package, installed with the 'orjson' extra
+    """
+    NAME = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError(
+                "The 'orjson' package is required for OPOrjsonCodec")
+
+    def loads(self, data: JSONInput):
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+        return orjson.loads(data)
+
+
+# in order of preference
+_CODEC_CLASSES: Dict[str, Type[OPJSONCodec]] = {
+    OPOrjsonCodec.NAME: OPOrjsonCodec,
+    OPJSONCodec.NAME: OPJSONCodec
+}
+
+
+def available_json_codecs() -> List[str]:
+    """
+    Names of the JSON codecs that can be used, most preferred first
+    """
+    available = []
+    for name, codec_class in _CODEC_CLASSES.items():
+        try:
+            codec_class()
+        except ImportError:
+            continue
+        available.append(name)
+    return available
+
+
+def _default_codec() -> OPJSONCodec:
+    name = available_json_codecs()[0]
+    return _CODEC_CLASSES[name]()
+
+
+_codec: OPJSONCodec = _default_codec()
+
+
+def get_json_codec() -> OPJSONCodec:
+    """
+    Get the JSON codec currently in use
+    """
+    return _codec
+
+
+def set_json_codec(codec: Union[str, OPJSONCodec, None]) -> OPJSONCodec:
+    """
+    Set the JSON codec used for all JSON encoding & decoding
+
+    Parameters
+    ----------
+    codec : Union[str, OPJSONCodec, None]
+        The name of an available codec (see available_json_codecs()), a codec object,
+        or None to go back to the default
+
+    Raises
+    ------
+    ValueError
+        If 'codec' names an unknown or unavailable codec
+
+    Returns
+    -------
+    OPJSONCodec
+        The codec now in use
+    """
+    global _codec
+    if codec is None:
+        codec = _default_codec()
+    elif isinstance(codec, str):
+        if codec not in available_json_codecs():
+            raise ValueError(f"JSON codec not available: {codec}")
+        codec = _CODEC_CLASSES[codec]()
+    _codec = codec
+    return _codec
+
+
+def loads(data: JSONInput):
+    """
+    Decode JSON from str, bytes, bytearray, or memoryview, using the current codec
+    """
+    return _codec.loads(data)
+
+
+def dumps(obj, indent=None) -> str:
+    """
+    Encode 'obj' as a JSON string, using the current codec
+    """
+    return _codec.dumps(obj, indent=indent)
 
 
 def safe_unjson(json_or_obj):
     """
-    Transparently un-json things if they are strings, and no-op if not
+    Transparently un-json things if they are strings or bytes, and no-op if not
     """
-    if isinstance(json_or_obj, str):
-        obj = json.loads(json_or_obj)
+    if isinstance(json_or_obj, (str, bytes, bytearray, memoryview)):
+        obj = loads(json_or_obj)
     else:
         obj = json_or_obj
     return obj
+
+
+def iter_concatenated_json(json_stream: str):
+    """
+    Yield each value from a string of concatenated JSON values, such as the
+    back-to-back objects 'op' outputs when given multiple items over stdin
+
+    Values may be separated by any amount of whitespace, including none
+
+    Raises
+    ------
+    JSONDecodeError
+        If the string contains anything other than whitespace-separated JSON values
+    """
+    decoder = json.JSONDecoder()
+    idx = 0
+    end = len(json_stream)
+    while True:
+        # skip separating whitespace
+        while idx < end and json_stream[idx].isspace():
+            idx += 1
+        if idx >= end:
+            break
+        obj, idx = decoder.raw_decode(json_stream, idx)
+        yield obj
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator:
+    """
+    Yield each element of a JSON array as it's read, from an iterable of byte chunks
+    such as 'op' stdout read through a pipe
+
+    Each element is decoded as soon as it has been completely read, and its text is
+    then discarded, so memory use depends on the size of the largest element rather
+    than the size of the array. Input consisting only of whitespace yields nothing
+
+    NOTE: Elements are decoded with the standard library's 'json' module rather than
+    the current codec, since it can decode a value from the middle of a string and
+    report where the value ends
+
+    Raises
+    ------
+    JSONDecodeError
+        If the input isn't a single JSON array, or any of its elements is invalid
+    """
+    decoder = json.JSONDecoder()
+    utf8_decoder = codecs.getincrementaldecoder("utf-8")()
+    text = ""
+    # don't try decoding a partially read element again until there's this much text
+    retry_len = 0
+    state = _ARRAY_START
+    for chunk in itertools.chain(chunks, [None]):
+        final = chunk is None
+        text += utf8_decoder.decode(chunk or b"", final=final)
+        if len(text) < retry_len and not final:
+            continue
+        retry_len = 0
+        pos = 0
+        while True:
+            pos = _JSON_WHITESPACE_RE.match(text, pos).end()
+            if pos == len(text):
+                break
+            char = text[pos]
+            if state == _ARRAY_START:
+                if char != "[":
+                    raise json.JSONDecodeError("Expecting '['", text, pos)
+                state = _ARRAY_FIRST_VALUE
+                pos += 1
+            elif state == _ARRAY_SEPARATOR:
+                if char == ",":
+                    state = _ARRAY_VALUE
+                elif char == "]":
+                    state = _ARRAY_END
+                else:
+                    raise json.JSONDecodeError(
+                        "Expecting ',' delimiter", text, pos)
+                pos += 1
+            elif state == _ARRAY_FIRST_VALUE and char == "]":
+                state = _ARRAY_END
+                pos += 1
+            elif state == _ARRAY_END:
+                raise json.JSONDecodeError("Extra data", text, pos)
+            else:
+                try:
+                    obj, end = decoder.raw_decode(text, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    # element hasn't been completely read yet
+                    retry_len = 2 * (len(text) - pos)
+                    break
+                if end == len(text) and not final:
+                    # a number may continue in the next chunk
+                    break
+                yield obj
+                state = _ARRAY_SEPARATOR
+                pos = end
+        text = text[pos:]
+
+    if state not in [_ARRAY_START, _ARRAY_END]:
+        raise json.JSONDecodeError("Unterminated array", text, len(text))
@@ -1,19 +1,33 @@
-import json
-from typing import List, Union
+from operator import attrgetter
+from typing import Callable, Dict, Hashable, List, Optional, Union
 
-from ..json import safe_unjson
+from ..json import dumps, safe_unjson
 from ._item_descriptor_base import OPAbstractItemDescriptor
 from ._item_descriptor_registry import OPItemDescriptorFactory
 
 
 class OPItemList(List[OPAbstractItemDescriptor]):
+    """
+    A sorted list of item descriptors, as returned by 'op item list'
+
+    In addition to ordinary list operations, descriptors can be looked up by unique ID,
+    title, tag, category, or vault. The indexes backing these lookups are built the first
+    time each is needed, and discarded whenever the list is modified
+    """
+    # class-level default, so the attribute exists even if list methods are called
+    # before __init__(), as happens when unpickling
+    _indexes: Optional[Dict[str, Dict]] = None
+    # the list's length when the indexes were started. += and *= don't go through any
+    # method that can be overridden compatibly, but always change the length when they
+    # change the list, so a different length means the indexes are stale
+    _indexed_length: int = 0
+
     def __init__(self, item_list_json: Union[str, List], generic_okay=False):
         super().__init__()
         item_list = safe_unjson(item_list_json)
-        for i_dict in item_list:
-            descriptor = OPItemDescriptorFactory.item_descriptor(
-                i_dict, generic_okay=generic_okay)
-            self.append(descriptor)
+        descriptors = [OPItemDescriptorFactory.item_descriptor(i_dict, generic_okay=generic_okay)
+                       for i_dict in item_list]
+        super().extend(descriptors)
 
         # 'op item list' returns items in a non-deterministic order
         # so sorting ourselves hopefully ensures we are in a consistent order every time
@@ -22,7 +36,7 @@ class OPItemList(List[OPAbstractItemDescriptor]):
         self.sort()
 
     def serialize(self, indent=None) -> str:
-        json_str = json.dumps(self, indent=indent)
+        json_str = dumps(self, indent=indent)
         return json_str
 
     def sort(self):
@@ -30,9 +44,195 @@ class OPItemList(List[OPAbstractItemDescriptor]):
         # human friendly (mainly for troubleshooting)
         # but in the case if title collisions, this is still non-deterministic
         # since 'op' may return them in a non-deterministic order
-        # since list.sort() is considered stable we can ensure items
-        # with the same title are in a particular order relative to each other by...
-        # first, sorting by unique id
-        super().sort(key=lambda item: item.unique_id)
-        # Then sort by title
-        super().sort(key=lambda item: item.title)
+        # so items with the same title are ordered by unique id
+        super().sort(key=attrgetter("title", "unique_id"))
+        self._invalidate_indexes()
+
+    def by_id(self, unique_id: str) -> Optional[OPAbstractItemDescriptor]:
+        """
+        Look up an item descriptor by its unique ID
+
+        Parameters
+        ----------
+        unique_id : str
+            The unique ID of the item
+
+        Returns
+        -------
+        Optional[OPAbstractItemDescriptor]
+            The item descriptor, or None if there's no item with that ID in this list
+        """
+        index = self._index("id", self._descriptor_id)
+        matches = index.get(unique_id)
+        descriptor = matches[0] if matches else None
+        return descriptor
+
+    def by_title(self, title: str, case_sensitive=True) -> List[OPAbstractItemDescriptor]:
+        """
+        Look up item descriptors by title
+
+        Parameters
+        ----------
+        title : str
+            The title to match
+        case_sensitive : bool, optional
+            Whether to match the title exactly, or ignoring case, by default True
+
+        Returns
+        -------
+        List[OPAbstractItemDescriptor]
+            A new list of matching item descriptors, in list order. The list is empty
+            if there are no matches
+        """
+        if case_sensitive:
+            index = self._index("title", self._descriptor_title)
+        else:
+            index = self._index("title_casefold", self._descriptor_title_casefold)
+            title = title.casefold()
+        return list(index.get(title, []))
+
+    def with_tag(self, tag: str) -> List[OPAbstractItemDescriptor]:
+        """
+        Look up item descriptors by tag
+
+        Parameters
+        ----------
+        tag : str
+            The tag to match
+
+        Returns
+        -------
+        List[OPAbstractItemDescriptor]
+            A new list of item descriptors that have the tag, in list order. The list is
+            empty if there are no matches
+        """
+        index = self._index("tag", self._descriptor_tags, multi_key=True)
+        return list(index.get(tag, []))
+
+    def by_category(self, category: str) -> List[OPAbstractItemDescriptor]:
+        """
+        Look up item descriptors by item category, such as "LOGIN" or "PASSWORD"
+
+        Parameters
+        ----------
+        category : str
+            The category to match
+
+        Returns
+        -------
+        List[OPAbstractItemDescriptor]
+            A new list of item descriptors in the category, in list order. The list is
+            empty if there are no matches
+        """
+        index = self._index("category", self._descriptor_category)
+        return list(index.get(category, []))
+
+    def in_vault(self, vault_id: str) -> List[OPAbstractItemDescriptor]:
+        """
+        Look up item descriptors by the unique ID of the vault they're in
+
+        Parameters
+        ----------
+        vault_id : str
+            The vault's unique ID
+
+        Returns
+        -------
+        List[OPAbstractItemDescriptor]
+            A new list of item descriptors in the vault, in list order. The list is
+            empty if there are no matches
+        """
+        index = self._index("vault", self._descriptor_vault_id)
+        return list(index.get(vault_id, []))
+
+    def _index(self, name: str, key_func: Callable, multi_key=False) -> Dict[Hashable, List]:
+        indexes = self._indexes
+        if indexes is None or self._indexed_length != len(self):
+            indexes = {}
+            self._indexes = indexes
+            self._indexed_length = len(self)
+        index = indexes.get(name)
+        if index is None:
+            index = {}
+            for descriptor in self:
+                keys = key_func(descriptor)
+                if not multi_key:
+                    keys = [keys]
+                for key in keys:
+                    if key is not None:
+                        index.setdefault(key, []).append(descriptor)
+            indexes[name] = index
+        return index
+
+    def _invalidate_indexes(self):
+        # replace rather than clear, since a shallow copy of this list shares the
+        # same dictionary
+        self._indexes = None
+
+    @staticmethod
+    def _descriptor_id(descriptor):
+        return descriptor.get("id")
+
+    @staticmethod
+    def _descriptor_title(descriptor):
+        return descriptor.get("title")
+
+    @staticmethod
+    def _descriptor_title_casefold(descriptor):
+        title = descriptor.get("title")
+        if title is not None:
+            title = title.casefold()
+        return title
+
+    @staticmethod
+    def _descriptor_tags(descriptor):
+        return set(descriptor.get("tags") or [])
+
+    @staticmethod
+    def _descriptor_category(descriptor):
+        return descriptor.get("category")
+
+    @staticmethod
+    def _descriptor_vault_id(descriptor):
+        vault = descriptor.get("vault")
+        vault_id = vault.get("id") if vault else None
+        return vault_id
+
+    # any modification invalidates the indexes
+
+    def append(self, descriptor):
+        super().append(descriptor)
+        self._invalidate_indexes()
+
+    def extend(self, descriptors):
+        super().extend(descriptors)
+        self._invalidate_indexes()
+
+    def insert(self, index, descriptor):
+        super().insert(index, descriptor)
+        self._invalidate_indexes()
+
+    def remove(self, descriptor):
+        super().remove(descriptor)
+        self._invalidate_indexes()
+
+    def pop(self, index=-1):
+        descriptor = super().pop(index)
+        self._invalidate_indexes()
+        return descriptor
+
+    def clear(self):
+        super().clear()
+        self._invalidate_indexes()
+
+    def reverse(self):
+        super().reverse()
+        self._invalidate_indexes()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._invalidate_indexes()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._invalidate_indexes()
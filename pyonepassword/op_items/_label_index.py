@@ -0,0 +1,71 @@
+from typing import Dict, Generic, Iterable, List, Optional, Protocol, TypeVar
+
+
+class _OPLabeled(Protocol):
+    @property
+    def label(self) -> Optional[str]:
+        ...
+
+
+_T = TypeVar("_T", bound=_OPLabeled)
+
+
+class _OPLabelIndex(Generic[_T]):
+    """
+    Index of fields or sections by label, for both case-sensitive and
+    case-insensitive (casefolded) lookups
+
+    Objects are indexed in the order they're added, so lookups return matches in
+    the same order a linear scan would
+    """
+
+    def __init__(self, objects: Iterable[_T] = ()):
+        self._by_label: Dict[str, List[_T]] = {}
+        self._by_label_casefold: Dict[str, List[_T]] = {}
+        self._count = 0
+        for obj in objects:
+            self.add(obj)
+
+    def __len__(self):
+        return self._count
+
+    def add(self, obj: _T):
+        label = obj.label
+        # objects without a label can't match any lookup, but still count
+        if label is not None:
+            self._by_label.setdefault(label, []).append(obj)
+            self._by_label_casefold.setdefault(
+                label.casefold(), []).append(obj)
+        self._count += 1
+
+    def lookup(self, label: str, case_sensitive=True) -> List[_T]:
+        """
+        Return a new list of the objects matching 'label'
+        """
+        if case_sensitive:
+            matches = self._by_label.get(label, [])
+        else:
+            matches = self._by_label_casefold.get(label.casefold(), [])
+        return list(matches)
+
+
+class _OPFieldIndex(_OPLabelIndex):
+    """
+    Index of fields by label, as for _OPLabelIndex, and by purpose
+    """
+
+    def __init__(self, fields=()):
+        self._by_purpose: Dict[str, List] = {}
+        super().__init__(fields)
+
+    def add(self, field):
+        super().add(field)
+        purpose = field.get("purpose")
+        if purpose:
+            self._by_purpose.setdefault(purpose, []).append(field)
+
+    def lookup_purpose(self, purpose: str) -> List:
+        """
+        Return a new list of the fields whose purpose is 'purpose'
+        """
+        return list(self._by_purpose.get(purpose, []))
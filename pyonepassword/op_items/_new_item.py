@@ -1,8 +1,8 @@
-import json
 import os
 import tempfile
 from typing import Dict, List, Optional
 
+from ..json import get_json_codec
 from ..py_op_exceptions import OPInvalidItemException
 from ._new_field_registry import OPNewItemField, OPNewItemFieldFactory
 from .item_field_base import OPItemField
@@ -231,7 +231,7 @@ class OPNewItemMixin:
         temp = tempfile.NamedTemporaryFile(
             mode="w", delete=False, encoding=encoding)
         self._temp_files.append(temp.name)
-        json.dump(self, temp)
+        get_json_codec().dump(self, temp)
         temp.close()
         return temp.name
 
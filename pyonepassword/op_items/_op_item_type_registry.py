@@ -5,11 +5,13 @@ from ..json import safe_unjson
 from ..py_op_exceptions import OPInvalidItemException
 from ._item_descriptor_base import OPAbstractItemDescriptor
 from ._op_items_base import OPAbstractItem
+from .compact_item import OPCompactItem
 from .generic_item import (
     _OPGenericItem,
     _OPGenericItemDescriptor,
     _OPGenericItemRelaxedValidation
 )
+from .item_validation_policy import get_relaxed_validation
 
 
 class OPUnknownItemTypeException(Exception):
@@ -68,6 +70,27 @@ class OPItemFactory:
 
     @classmethod
     def _item_from_dict(cls, item_dict: Dict[str, Any], generic_okay: bool = False, relaxed_validation: bool = False):
+        item_cls = cls._item_class_for_dict(
+            item_dict, generic_okay=generic_okay, relaxed_validation=relaxed_validation)
+        obj = item_cls(item_dict)
+
+        return obj
+
+    @classmethod
+    def _compact_item_from_dict(cls, item_dict: Dict[str, Any], generic_okay: bool = False, relaxed_validation: bool = False):
+        item_cls = cls._item_class_for_dict(
+            item_dict, generic_okay=generic_okay, relaxed_validation=relaxed_validation)
+        # validate exactly as the regular item class would
+        relaxed = getattr(item_cls, "_relaxed_validation", False) or \
+            get_relaxed_validation(item_class=item_cls)
+        generic = issubclass(item_cls, (_OPGenericItem, _OPGenericItemDescriptor))
+        obj = OPCompactItem(
+            item_dict, relaxed_validation=relaxed, generic=generic)
+
+        return obj
+
+    @classmethod
+    def _item_class_for_dict(cls, item_dict: Dict[str, Any], generic_okay: bool = False, relaxed_validation: bool = False):
         generic_item_class: GenericType
         if relaxed_validation:
             registry = cls._RELAXED_TYPE_REGISTRY
@@ -87,27 +110,32 @@ class OPItemFactory:
                 raise OPUnknownItemTypeException(
                     f"Unknown item type {item_type}", item_dict=item_dict) from ke
 
-        obj = item_cls(item_dict)
-
-        return obj
+        return item_cls
 
     @classmethod
-    def op_item(cls, item_json_or_dict: Union[str, Dict], generic_okay: bool = False, relaxed_validation: bool = False):
+    def op_item(cls,
+                item_json_or_dict: Union[str, bytes, Dict],
+                generic_okay: bool = False,
+                relaxed_validation: bool = False,
+                compact: bool = False):
         """
         Factory methiod to instantiate an op item from JSON or a dictionary
 
         Parameters
         ----------
-        item_json_or_dict : Union[str, Dict]
-            JSON or dictionary representing an op item object
+        item_json_or_dict : Union[str, bytes, Dict]
+            JSON (as str or undecoded bytes) or dictionary representing an op item object
         relaxed_validation : bool, optional
             Whether relaxed validation should be enabled for this instance, by default False
             If true, the item class will be looked up from the relaxed validation registry
+        compact : bool, optional
+            Return a read-only OPCompactItem rather than an OPAbstractItem, by default False.
+            Compact items use a fraction of the memory, for callers holding many items at once
 
         Returns
         -------
-        OPAbstractItem
-            An instance of OPAbstractItem representing the 1Password item object
+        OPAbstractItem or OPCompactItem
+            An object representing the 1Password item object
 
         Raises
         ------
@@ -119,8 +147,12 @@ class OPItemFactory:
         except JSONDecodeError as jdce:
             raise OPInvalidItemException(
                 f"Failed to unserialize item JSON: {jdce}") from jdce
-        obj = cls._item_from_dict(
-            item_dict, generic_okay=generic_okay, relaxed_validation=relaxed_validation)
+        if compact:
+            obj = cls._compact_item_from_dict(
+                item_dict, generic_okay=generic_okay, relaxed_validation=relaxed_validation)
+        else:
+            obj = cls._item_from_dict(
+                item_dict, generic_okay=generic_okay, relaxed_validation=relaxed_validation)
         return obj
 
 
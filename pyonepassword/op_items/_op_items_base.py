@@ -1,10 +1,13 @@
-from typing import Dict, List, Optional, Union
+import threading
+from typing import Dict, List, Optional, Set, Union
 
 from .._abc_meta import enforcedmethod
 from ..py_op_exceptions import OPInvalidItemException
 from ._item_descriptor_base import OPAbstractItemDescriptor
+from ._label_index import _OPFieldIndex, _OPLabelIndex
 from .field_registry import OPItemFieldFactory
 from .item_field_base import OPItemField
+from .item_parsing_policy import get_lazy_item_maps
 from .item_section import (
     OPItemFieldCollisionException,
     OPSection,
@@ -12,6 +15,10 @@ from .item_section import (
 )
 from .item_validation_policy import get_relaxed_validation
 
+# serializes lazy construction of section & field maps, so items shared between
+# threads (e.g., via an item cache) are only ever built once
+_LAZY_MAP_LOCK = threading.RLock()
+
 
 class OPSectionNotFoundException(Exception):
     pass
@@ -21,6 +28,103 @@ class OPFieldNotFoundException(Exception):
     pass
 
 
+def _validated_section_id(section_dict: Dict, section_ids, relaxed_validation: bool) -> str:
+    """
+    Get a section dictionary's ID, raising an exception if it has none, or if a section
+    with the same ID has already been seen, unless validation is relaxed
+    """
+    if "id" in section_dict:
+        section_id = section_dict["id"]
+    elif relaxed_validation:
+        # in rare instances sections may lack an "id" altogether
+        # Let's treat that as having an empty string instead, since we have
+        # logic to deal with that below, and sometimes that occurs as well
+        section_id = ""
+    else:
+        raise OPInvalidItemException(f"section has no ID {section_dict}")
+
+    if section_id in section_ids:
+        # NOTE: in rare cases 'op' will return items
+        # that have multiple duplicated sections, including section ID
+        # resulting in section ID collisions. In these cases
+        # relaxed validation is required to parse the dictionary
+        # and return a usable object
+        # see:
+        # tests/test_non_conformant_data/test_duplicate_sections.py
+        # if relaxed validation is not enabled
+        # raise an exception
+        if not relaxed_validation:
+            raise OPSectionCollisionException(
+                f"Section {section_id} already registered")
+        else:
+            # for code coverage visibility
+            pass
+    return section_id
+
+
+def _validated_field_id(field_dict: Dict, field_ids, relaxed_validation: bool) -> str:
+    """
+    Get a field dictionary's ID, raising an exception if it has none, or if a field
+    with the same ID has already been seen, unless validation is relaxed
+    """
+    if "id" in field_dict:
+        field_id = field_dict["id"]
+    elif relaxed_validation:
+        # Based on evidence of sections occasionally lacking "id" elements,
+        # in theory there may be instances where fields also lack an "id"
+        # Let's treat that as having an empty string instead, since we have
+        # logic to deal with that below, and sometimes that occurs as well
+        field_id = ""
+    else:
+        raise OPInvalidItemException(
+            f"Field has no ID: {field_dict['label']}")
+
+    if field_id in field_ids:
+        # NOTE: in many cases 'op' will return items
+        # that have multiple fields with empty-string IDs
+        # resulting in field ID collisions. In these cases
+        # relaxed validation is required to parse the dictionary
+        # and return a usable object
+
+        # if relaxed validation is not enabled
+        # raise an exception
+        if not relaxed_validation:
+            raise OPItemFieldCollisionException(
+                f"Field {field_id} already registered")
+        else:
+            # for code coverage visibility
+            pass
+    return field_id
+
+
+def _validate_item_dict(item_dict: Dict, relaxed_validation: bool):
+    """
+    Check an item dictionary's sections & fields for everything OPAbstractItem would
+    reject when building its section & field maps, raising the same exceptions,
+    without building any objects
+    """
+    section_ids: Set[str] = set()
+    _sections = item_dict.get("sections")
+    if _sections:
+        for section_dict in _sections:
+            section_ids.add(_validated_section_id(
+                section_dict, section_ids, relaxed_validation))
+
+    field_ids: Set[str] = set()
+    _fields = item_dict.get("fields", [])
+    for field_dict in _fields:
+        # raises KeyError if the field has no type, as item_field() would
+        OPItemFieldFactory.field_type_lookup(field_dict)
+        field_ids.add(_validated_field_id(
+            field_dict, field_ids, relaxed_validation))
+        section_dict = field_dict.get("section")
+        if section_dict:
+            section_id = section_dict["id"]
+            if section_id not in section_ids:
+                raise OPSectionNotFoundException(
+                    f"Section not found with Section ID: {section_id}")
+
+
 class OPAbstractItem(OPAbstractItemDescriptor):
     CATEGORY: Optional[str] = None
     FROM_TEMPLATE = False
@@ -32,14 +136,71 @@ class OPAbstractItem(OPAbstractItemDescriptor):
     @enforcedmethod
     def __init__(self, item_dict_or_json: Union[Dict, str]):
         super().__init__(item_dict_or_json)
-        self._section_map = self._initialize_sections()
-        self._field_map = self._initialize_fields()
+        self._section_map: Optional[Dict[str, OPSection]] = None
+        self._field_map: Optional[Dict[str, OPItemField]] = None
+        # label & purpose indexes, built on the first lookup that needs them
+        self._field_index: Optional[_OPFieldIndex] = None
+        self._section_index: Optional[_OPLabelIndex[OPSection]] = None
+        if self.lazy_maps():
+            # Validate now, so a lazy item raises the same exceptions at the same
+            # point as an eager one. Section & field objects are built on first access.
+            # Until then, self["sections"] and self["fields"] hold the original dictionaries
+            self._validate_sections_and_fields()
+            # the eager builders always store lists, even for items with no sections
+            # or fields, so do the same here, giving lazy and eager items the same keys
+            for key in ("sections", "fields"):
+                if not self.get(key):
+                    self[key] = []
+        else:
+            self._section_map = self._initialize_sections()
+            self._field_map = self._initialize_fields()
+
+    def __eq__(self, other):
+        if not isinstance(other, OPAbstractItem):
+            return super().__eq__(other)
+        # lazy and eager items for the same data should compare equal, so compare the
+        # underlying dictionaries, leaving out the field lists that are registered into
+        # sections once the section map is built. This way comparing doesn't build
+        # either item's maps
+        if self.keys() != other.keys():
+            return False
+        for key, value in self.items():
+            if key != "sections" and value != other[key]:
+                return False
+        return self._unregistered_sections() == other._unregistered_sections()
+
+    def __ne__(self, other):
+        eq = self.__eq__(other)
+        if eq is NotImplemented:
+            return eq
+        return not eq
 
     @property
     def sections(self) -> List[OPSection]:
+        self._ensure_section_map()
         section_list = self.get("sections", [])
         return section_list
 
+    def lazy_maps(self) -> bool:
+        """
+        Get lazy section & field maps policy
+
+        May be determined by either of the following:
+        - Lazy maps are globally set for this class via OPItemParsingPolicy
+        - Lazy maps are globally set for all op item classes
+
+        Items created from templates always build their maps eagerly
+
+        Returns
+        -------
+        bool
+            Whether lazy section & field maps are enabled
+        """
+        lazy = False
+        if not self.FROM_TEMPLATE:
+            lazy = get_lazy_item_maps(item_class=self.__class__)
+        return lazy
+
     def relaxed_validation(self) -> bool:
         """
         Get relaxed validation policy
@@ -66,19 +227,17 @@ class OPAbstractItem(OPAbstractItemDescriptor):
         Returns a list of zero or more sections matching the given title.
         Sections are not required to have unique titles, so there may be more than one match.
         """
-        matching_sections = []
-        sect: OPSection
-        for sect in self.sections:
-            s_label = sect.label
-            if not case_sensitive:
-                s_label = s_label.lower()
-                label = label.lower()
-            if s_label == label:
-                matching_sections.append(sect)
+        section_index = self._section_index
+        if section_index is None:
+            section_index = _OPLabelIndex(self.sections)
+            self._section_index = section_index
+        matching_sections = section_index.lookup(
+            label, case_sensitive=case_sensitive)
 
         return matching_sections
 
     def section_by_id(self, section_id) -> OPSection:
+        self._ensure_section_map()
         try:
             section: OPSection = self._section_map[section_id]
         except KeyError:
@@ -102,6 +261,7 @@ class OPAbstractItem(OPAbstractItemDescriptor):
         return value
 
     def field_by_id(self, field_id) -> OPItemField:
+        self._ensure_field_map()
         try:
             field = self._field_map[field_id]
         except KeyError:
@@ -110,16 +270,15 @@ class OPAbstractItem(OPAbstractItemDescriptor):
         return field
 
     def fields_by_label(self, field_label: str, case_sensitive=True) -> List[OPItemField]:
-        fields = []
-        f: OPItemField
-        for _, f in self._field_map.items():
-            f_label = f.label
-            if not case_sensitive:
-                f_label = f_label.lower()
-                field_label = field_label.lower()
-
-            if f_label == field_label:
-                fields.append(f)
+        fields = self._get_field_index().lookup(
+            field_label, case_sensitive=case_sensitive)
+        return fields
+
+    def fields_by_purpose(self, purpose: str) -> List[OPItemField]:
+        """
+        Returns all fields with the given purpose, such as "USERNAME", "PASSWORD", or "NOTES"
+        """
+        fields = self._get_field_index().lookup_purpose(purpose)
         return fields
 
     def first_field_by_label(self, field_label: str, case_sensitive=True) -> OPItemField:
@@ -138,87 +297,87 @@ class OPAbstractItem(OPAbstractItemDescriptor):
         ref = field.reference
         return ref
 
+    def _get_field_index(self) -> _OPFieldIndex:
+        field_index = self._field_index
+        if field_index is None:
+            self._ensure_field_map()
+            # index the same fields as the field map, so duplicate IDs
+            # resolve the same way as with field_by_id()
+            field_index = _OPFieldIndex(self._field_map.values())
+            self._field_index = field_index
+        return field_index
+
     def _field_value_from_section(self, section: OPSection, field_label: str):
         section_field: OPItemField = section.fields_by_label(field_label)[0]
         value = section_field.value
         return value
 
+    def _unregistered_sections(self) -> List[Dict]:
+        sections = [{k: v for k, v in section.items() if k != "fields"}
+                    for section in self.get("sections", [])]
+        return sections
+
     def _initialize_sections(self):
+        relaxed_validation = self.relaxed_validation()
         section_list = []
-        section_map = {}
+        section_map: Dict[str, OPSection] = {}
         _sections = self.get("sections")
         if _sections:
             for section_dict in _sections:
                 s = OPSection(section_dict)
-                try:
-                    section_id = s.section_id
-                except KeyError as e:
-                    # in rare instances sections may lack an "id" altogether
-                    # Let's treat that as having an empty string instead, since we have
-                    # logic to deal with that below, and sometimes that occurs as well
-                    if self.relaxed_validation():
-                        section_id = ""
-                    else:
-                        raise OPInvalidItemException(
-                            f"section has no ID {s}") from e
-
-                if section_id in section_map:
-                    # NOTE: in rare cases 'op' will return items
-                    # that have multiple duplicated sections, including section ID
-                    # resulting in section ID collisions. In these cases
-                    # relaxed validation is required to parse the dictionary
-                    # and return a usable object
-                    # see:
-                    # tests/test_non_conformant_data/test_duplicate_sections.py
-                    # if relaxed validation is not enabled
-                    # raise an exception
-                    if not self.relaxed_validation():
-                        raise OPSectionCollisionException(
-                            f"Section {section_id} already registered")
-                    else:
-                        # for code coverage visibility
-                        pass
+                section_id = _validated_section_id(
+                    s, section_map, relaxed_validation)
                 section_map[section_id] = s
                 section_list.append(s)
         self["sections"] = section_list
         return section_map
 
-    def _initialize_fields(self):
+    def _ensure_field_map(self):
+        if self._field_map is not None:
+            return
+        with _LAZY_MAP_LOCK:
+            if self._field_map is None:
+                # sections may not have been built yet, so field registration
+                # is left to _ensure_section_map()
+                self._field_map = self._initialize_fields(register_sections=False)
+
+    def _ensure_section_map(self):
+        if self._section_map is not None:
+            return
+        with _LAZY_MAP_LOCK:
+            if self._section_map is not None:
+                return
+            self._ensure_field_map()
+            relaxed_validation = self.relaxed_validation()
+            section_map = self._initialize_sections()
+            f: OPItemField
+            for f in self["fields"]:
+                section_dict = f.get("section")
+                if section_dict:
+                    section = section_map[section_dict["id"]]
+                    # register a plain dictionary, as _initialize_fields() does
+                    section.register_field(
+                        dict(f), relaxed_validation=relaxed_validation)
+            self._section_map = section_map
+
+    def _validate_sections_and_fields(self):
+        """
+        Check the item's section & field dictionaries for everything _initialize_sections()
+        and _initialize_fields() would reject, without building any objects
+        """
+        _validate_item_dict(self, self.relaxed_validation())
+
+    def _initialize_fields(self, register_sections=True):
         relaxed_validation = self.relaxed_validation()
         field_list = []
-        field_map = {}
+        field_map: Dict[str, OPItemField] = {}
         _fields = self.get("fields", [])
         for field_dict in _fields:
             field = OPItemFieldFactory.item_field(field_dict)
-            try:
-                field_id = field.field_id
-            except KeyError as e:
-                # Based on evidence of sections occasionally lacking "id" elements,
-                # in theory there may be instances where fields also lack an "id"
-                # Let's treat that as having an empty string instead, since we have
-                # logic to deal with that below, and sometimes that occurs as well
-                if self.relaxed_validation():
-                    field_id = ""
-                else:
-                    raise OPInvalidItemException(
-                        f"Field has no ID: {field.label}") from e
-            if field_id in field_map:
-                # NOTE: in many cases 'op' will return items
-                # that have multiple fields with empty-string IDs
-                # resulting in field ID collisions. In these cases
-                # relaxed validation is required to parse the dictionary
-                # and return a usable object
-
-                # if relaxed validation is not enabled
-                # raise an exception
-                if not relaxed_validation:
-                    raise OPItemFieldCollisionException(
-                        f"Field {field_id} already registered")
-                else:
-                    # for code coverage visibility
-                    pass
+            field_id = _validated_field_id(
+                field, field_map, relaxed_validation)
             section_dict = field.get("section")
-            if section_dict:
+            if register_sections and section_dict:
                 section_id = section_dict["id"]
                 section = self.section_by_id(section_id)
                 section.register_field(
@@ -0,0 +1,522 @@
+"""
+Compact, read-only representations of 1Password items
+
+Regular item objects are dictionary subclasses, and each section holds its own copy of
+its fields. That's convenient, but costly for callers holding many thousands of items in
+memory. The classes in this module store each value in a __slots__ attribute instead,
+share one object per field between an item and its sections, and intern IDs, labels, and
+types, so the same strings repeated across items are stored once
+"""
+import datetime
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+from .._datetime import fromisoformat_z
+from ..op_objects import OPVaultDescriptor
+from ._op_items_base import (
+    OPFieldNotFoundException,
+    OPSectionNotFoundException,
+    _validate_item_dict
+)
+
+
+def _intern(value):
+    if isinstance(value, str):
+        value = sys.intern(value)
+    return value
+
+
+class _OPCompactObject:
+    """
+    Base class for compact objects. Each key in _KEYS is stored in a slot named
+    after it, with a leading underscore. Any other keys are kept in a dictionary
+    that is only allocated if there are any
+    """
+    __slots__ = ("_extra",)
+    # dictionary keys stored in their own slots
+    _KEYS: Tuple[str, ...] = ()
+    # keys whose string values are interned
+    _INTERNED_KEYS: Tuple[str, ...] = ()
+
+    _extra: Optional[Dict[str, Any]]
+
+    def __init__(self, obj_dict: Dict[str, Any]):
+        extra = None
+        for key in self._KEYS:
+            setattr(self, "_" + key, None)
+        for key, value in obj_dict.items():
+            if key in self._KEYS:
+                if key in self._INTERNED_KEYS:
+                    value = _intern(value)
+                setattr(self, "_" + key, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        self._extra = extra
+
+    def get(self, key: str, default=None):
+        """
+        Look up a value by its dictionary key, as for dict.get()
+        """
+        value = None
+        if key in self._KEYS:
+            value = self._value_to_dict(key, getattr(self, "_" + key))
+        elif self._extra is not None:
+            value = self._extra.get(key)
+        if value is None:
+            value = default
+        return value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return a new dictionary in the same form as the JSON it was created from
+
+        NOTE: Keys whose value is None are omitted, including any that were present, but
+        null, in the original JSON. Those can't be told apart from keys that were missing
+        """
+        obj_dict = {}
+        for key in self._KEYS:
+            value = getattr(self, "_" + key)
+            if value is not None:
+                obj_dict[key] = self._value_to_dict(key, value)
+        if self._extra:
+            obj_dict.update(self._extra)
+        return obj_dict
+
+    def _value_to_dict(self, key, value):
+        return value
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.to_dict()!r})"
+
+
+class OPCompactSection(_OPCompactObject):
+    __slots__ = ("_id", "_label", "_fields")
+    _KEYS = ("id", "label")
+    _INTERNED_KEYS = ("id", "label")
+
+    _id: str
+    _label: Optional[str]
+    _fields: Tuple["OPCompactField", ...]
+
+    def __init__(self, section_dict: Dict[str, Any]):
+        super().__init__(section_dict)
+        self._fields = ()
+
+    @property
+    def section_id(self) -> str:
+        return self._id
+
+    @property
+    def label(self) -> Optional[str]:
+        return self._label
+
+    @property
+    def fields(self) -> Tuple["OPCompactField", ...]:
+        """
+        The fields in this section. These are the same objects as in the item's field tuple
+        """
+        return self._fields
+
+    def fields_by_label(self, label: str, case_sensitive=True) -> List["OPCompactField"]:
+        return _fields_by_label(self._fields, label, case_sensitive)
+
+    def first_field_by_label(self, label: str, case_sensitive=True) -> "OPCompactField":
+        fields = self.fields_by_label(label, case_sensitive=case_sensitive)
+        return fields[0]
+
+
+class OPCompactField(_OPCompactObject):
+    __slots__ = ("_id", "_type", "_purpose", "_label", "_value", "_reference", "_section")
+    _KEYS = ("id", "type", "purpose", "label", "value", "reference", "section")
+    _INTERNED_KEYS = ("id", "type", "purpose", "label")
+
+    _id: str
+    _type: str
+    _purpose: Optional[str]
+    _label: Optional[str]
+    _value: Any
+    _reference: Optional[str]
+    _section: Optional[OPCompactSection]
+
+    def __init__(self, field_dict: Dict[str, Any], section: Optional[OPCompactSection] = None):
+        """
+        Parameters
+        ----------
+        field_dict : Dict[str, Any]
+            The field's dictionary
+        section : OPCompactSection, optional
+            The item's section this field belongs to, shared rather than copied
+            if it's identical to the field's own section dictionary
+        """
+        super().__init__(field_dict)
+        section_dict = field_dict.get("section")
+        if section_dict:
+            if section is None or section.to_dict() != section_dict:
+                section = OPCompactSection(section_dict)
+            self._section = section
+
+    @property
+    def field_id(self) -> str:
+        return self._id
+
+    @property
+    def field_type(self) -> str:
+        return self._type
+
+    @property
+    def purpose(self) -> Optional[str]:
+        return self._purpose
+
+    @property
+    def label(self) -> Optional[str]:
+        return self._label
+
+    @property
+    def value(self) -> Any:
+        return self._value
+
+    @property
+    def reference(self) -> Optional[str]:
+        return self._reference
+
+    @property
+    def section(self) -> Optional[OPCompactSection]:
+        return self._section
+
+    @property
+    def section_id(self) -> Optional[str]:
+        section_id = None
+        if self._section is not None:
+            section_id = self._section.section_id
+        return section_id
+
+    def _value_to_dict(self, key, value):
+        if key == "section":
+            value = value.to_dict()
+        return value
+
+
+class OPCompactURL(_OPCompactObject):
+    __slots__ = ("_label", "_primary", "_href")
+    _KEYS = ("label", "primary", "href")
+    _INTERNED_KEYS = ("label",)
+
+    _label: Optional[str]
+    _primary: Optional[bool]
+    _href: str
+
+    @property
+    def label(self) -> Optional[str]:
+        return self._label
+
+    @property
+    def primary(self) -> bool:
+        return bool(self._primary)
+
+    @property
+    def href(self) -> str:
+        return self._href
+
+
+class OPCompactFile(_OPCompactObject):
+    __slots__ = ("_id", "_name", "_size", "_content_path")
+    _KEYS = ("id", "name", "size", "content_path")
+    _INTERNED_KEYS = ("id",)
+
+    _id: str
+    _name: str
+    _size: int
+    _content_path: str
+
+    @property
+    def file_id(self) -> str:
+        return self._id
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def content_path(self) -> str:
+        return self._content_path
+
+
+class OPCompactItem(_OPCompactObject):
+    """
+    A compact, read-only 1Password item of any category
+
+    Unlike OPAbstractItem objects, compact items aren't dictionaries, and don't have
+    category-specific properties. Use field_value_by_id() and friends instead, or
+    to_dict() to get a dictionary that may be passed to OPItemFactory.op_item()
+    """
+    __slots__ = ("_id", "_title", "_version", "_vault", "_category", "_last_edited_by",
+                 "_created_at", "_updated_at", "_additional_information", "_tags",
+                 "_favorite", "_state", "_sections", "_fields", "_urls", "_files", "_generic")
+    _KEYS = ("id", "title", "version", "vault", "category", "last_edited_by",
+             "created_at", "updated_at", "additional_information", "tags",
+             "favorite", "state", "sections", "fields", "urls", "files")
+    _INTERNED_KEYS = ("id", "category", "last_edited_by", "state")
+
+    _id: str
+    _title: str
+    _version: int
+    _vault: Optional[Dict[str, Any]]
+    _category: str
+    _last_edited_by: str
+    _created_at: str
+    _updated_at: str
+    _additional_information: Optional[str]
+    _tags: Optional[Tuple[str, ...]]
+    _favorite: Optional[bool]
+    _state: Optional[str]
+    _sections: Optional[Tuple[OPCompactSection, ...]]
+    _fields: Optional[Tuple[OPCompactField, ...]]
+    _urls: Optional[Tuple[OPCompactURL, ...]]
+    _files: Optional[Tuple[OPCompactFile, ...]]
+    _generic: bool
+
+    def __init__(self, item_dict: Dict[str, Any], relaxed_validation: bool = False, generic: bool = False):
+        """
+        Create a compact item from an item dictionary
+
+        Parameters
+        ----------
+        item_dict : Dict[str, Any]
+            An item dictionary, as returned by 'op item get'
+        relaxed_validation : bool, optional
+            Whether to accept non-conformant sections and fields, as for OPAbstractItem,
+            by default False
+        generic : bool, optional
+            Whether the item's category is unknown to OPItemFactory, by default False
+
+        Raises
+        ------
+        OPInvalidItemException, OPSectionCollisionException, OPItemFieldCollisionException
+            Under the same circumstances as OPAbstractItem
+        """
+        _validate_item_dict(item_dict, relaxed_validation)
+        super().__init__(item_dict)
+        self._generic = generic
+
+        vault_dict = item_dict.get("vault")
+        if vault_dict:
+            self._vault = {_intern(k): _intern(v) for k, v in vault_dict.items()}
+
+        tags = item_dict.get("tags")
+        if tags is not None:
+            self._tags = tuple(_intern(t) for t in tags)
+
+        sections = item_dict.get("sections")
+        section_map: Dict[str, OPCompactSection] = {}
+        if sections is not None:
+            compact_sections = tuple(OPCompactSection(s) for s in sections)
+            for section in compact_sections:
+                # on duplicate section IDs, the last one wins, as for OPAbstractItem
+                section_map[section.section_id or ""] = section
+            self._sections = compact_sections
+
+        fields = item_dict.get("fields")
+        if fields is not None:
+            compact_fields = []
+            section_fields: Dict[str, List[OPCompactField]] = {}
+            for field_dict in fields:
+                section = None
+                section_dict = field_dict.get("section")
+                if section_dict:
+                    section = section_map.get(section_dict.get("id"))
+                field = OPCompactField(field_dict, section=section)
+                compact_fields.append(field)
+                if section is not None:
+                    section_fields.setdefault(
+                        section.section_id or "", []).append(field)
+            self._fields = tuple(compact_fields)
+            for section_id, field_list in section_fields.items():
+                section_map[section_id]._fields = tuple(field_list)
+
+        urls = item_dict.get("urls")
+        if urls is not None:
+            self._urls = tuple(OPCompactURL(u) for u in urls)
+
+        files = item_dict.get("files")
+        if files is not None:
+            self._files = tuple(OPCompactFile(f) for f in files)
+
+    @property
+    def unique_id(self) -> str:
+        return self._id
+
+    @property
+    def title(self) -> str:
+        return self._title
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def category(self) -> str:
+        return self._category
+
+    @property
+    def generic(self) -> bool:
+        """
+        Whether this item's category is unknown to OPItemFactory
+        """
+        return self._generic
+
+    @property
+    def vault(self) -> Optional[OPVaultDescriptor]:
+        vault = None
+        if self._vault:
+            vault = OPVaultDescriptor(self._vault)
+        return vault
+
+    @property
+    def vault_id(self) -> str:
+        return self._vault["id"]
+
+    @property
+    def tags(self) -> Tuple[str, ...]:
+        tags = self._tags
+        if tags is None:
+            tags = ()
+        return tags
+
+    @property
+    def favorite(self) -> bool:
+        return bool(self._favorite)
+
+    @property
+    def state(self) -> Optional[str]:
+        return self._state
+
+    @property
+    def archived(self) -> bool:
+        return self._state == "ARCHIVED"
+
+    @property
+    def last_edited_by(self) -> str:
+        return self._last_edited_by
+
+    @property
+    def created_at(self) -> datetime.datetime:
+        return fromisoformat_z(self._created_at)
+
+    @property
+    def updated_at(self) -> datetime.datetime:
+        return fromisoformat_z(self._updated_at)
+
+    @property
+    def sections(self) -> Tuple[OPCompactSection, ...]:
+        sections = self._sections
+        if sections is None:
+            sections = ()
+        return sections
+
+    @property
+    def fields(self) -> Tuple[OPCompactField, ...]:
+        fields = self._fields
+        if fields is None:
+            fields = ()
+        return fields
+
+    @property
+    def urls(self) -> Tuple[OPCompactURL, ...]:
+        urls = self._urls
+        if urls is None:
+            urls = ()
+        return urls
+
+    @property
+    def primary_url(self) -> Optional[OPCompactURL]:
+        primary_url = None
+        for url in self.urls:
+            if url.primary:
+                primary_url = url
+        return primary_url
+
+    @property
+    def files(self) -> Tuple[OPCompactFile, ...]:
+        files = self._files
+        if files is None:
+            files = ()
+        return files
+
+    def section_by_id(self, section_id) -> OPCompactSection:
+        # search from the end so the last of any duplicates wins, as for OPAbstractItem
+        for section in reversed(self.sections):
+            if (section.section_id or "") == section_id:
+                return section
+        raise OPSectionNotFoundException(
+            f"Section not found with Section ID: {section_id}")
+
+    def sections_by_label(self, label, case_sensitive=True) -> List[OPCompactSection]:
+        if not case_sensitive:
+            label = label.lower()
+        matching_sections = []
+        for sect in self.sections:
+            s_label = sect.label
+            if s_label is not None and not case_sensitive:
+                s_label = s_label.lower()
+            if s_label == label:
+                matching_sections.append(sect)
+        return matching_sections
+
+    def first_section_by_label(self, label, case_sensitive=True) -> Optional[OPCompactSection]:
+        sections = self.sections_by_label(label, case_sensitive=case_sensitive)
+        section = None
+        if sections:
+            section = sections[0]
+        return section
+
+    def field_by_id(self, field_id) -> OPCompactField:
+        # search from the end so the last of any duplicates wins, as for OPAbstractItem
+        for field in reversed(self.fields):
+            if (field.field_id or "") == field_id:
+                return field
+        raise OPFieldNotFoundException(
+            f"Field not found with ID: {field_id}")
+
+    def fields_by_label(self, field_label: str, case_sensitive=True) -> List[OPCompactField]:
+        return _fields_by_label(self.fields, field_label, case_sensitive)
+
+    def first_field_by_label(self, field_label: str, case_sensitive=True) -> OPCompactField:
+        fields = self.fields_by_label(
+            field_label, case_sensitive=case_sensitive)
+        return fields[0]
+
+    def field_value_by_id(self, field_id):
+        field = self.field_by_id(field_id)
+        return field.value
+
+    def field_reference_by_id(self, field_id) -> Optional[str]:
+        field = self.field_by_id(field_id)
+        return field.reference
+
+    def _value_to_dict(self, key, value):
+        if key in ("sections", "fields", "urls", "files"):
+            value = [obj.to_dict() for obj in value]
+        elif key == "tags":
+            value = list(value)
+        elif key == "vault":
+            value = dict(value)
+        return value
+
+
+def _fields_by_label(fields, field_label: str, case_sensitive: bool) -> List[OPCompactField]:
+    if not case_sensitive:
+        field_label = field_label.lower()
+    matching_fields = []
+    for f in fields:
+        f_label = f.label
+        if f_label is not None and not case_sensitive:
+            f_label = f_label.lower()
+        if f_label == field_label:
+            matching_fields.append(f)
+    return matching_fields
@@ -1,5 +1,8 @@
+from typing import Optional
+
 from .field_registry import op_register_item_field_type
 from .item_field_base import OPItemField
+from .totp import OPTOTPGenerator, TOTPTime
 
 
 @op_register_item_field_type
@@ -23,3 +26,45 @@ class OPTOTPField(OPStringField):
     @property
     def totp(self) -> str:
         return self["totp"]
+
+    def totp_generator(self) -> OPTOTPGenerator:
+        """
+        A generator for this field's TOTP codes, which are computed locally from its
+        secret, without running 'op'
+
+        The generator is cached, and only recreated if the field's value changes
+
+        Raises
+        ------
+        OPInvalidTOTPException
+            If the field's value isn't a valid TOTP secret or otpauth:// URI
+        """
+        secret_or_uri = self.totp_secret
+        cached = getattr(self, "_totp_generator", None)
+        if cached is None or cached[0] != secret_or_uri:
+            cached = (secret_or_uri,
+                      OPTOTPGenerator.from_secret_or_uri(secret_or_uri))
+            self._totp_generator = cached
+        return cached[1]
+
+    def generate(self, at: Optional[TOTPTime] = None) -> str:
+        """
+        Generate a TOTP code locally from this field's secret
+
+        Parameters
+        ----------
+        at : Union[int, float, datetime.datetime], optional
+            A Unix timestamp or datetime to generate the code for, by default now.
+            Naive datetimes are taken to be UTC
+
+        Raises
+        ------
+        OPInvalidTOTPException
+            If the field's value isn't a valid TOTP secret or otpauth:// URI
+
+        Returns
+        -------
+        str
+            The zero-padded TOTP code
+        """
+        return self.totp_generator().generate(at)
@@ -0,0 +1,173 @@
+from typing import Set
+
+"""
+Module for classes & functions related to item parsing policy.
+
+By default an item object builds its section and field objects when it is created.
+For workloads that parse many items but only look at a few fields of each (or none at all),
+that work can instead be deferred until a section or field is first accessed
+
+This module provides mechanisms to enable/disable lazy section & field maps globaly, or on a
+per-class basis
+"""
+
+
+class _OPItemParsingPolicy:
+    """
+    Class representing the active policy whether a 1Password item object should
+    defer building its section & field maps until first accessed
+    """
+    _lazy_item_classes: Set[type] = set()
+    _lazy_maps: bool = False
+
+    @classmethod
+    def _enable_lazy_maps(cls) -> None:
+        """
+        Enable lazy section & field maps globally
+        """
+        cls._lazy_maps = True
+
+    @classmethod
+    def _disable_lazy_maps(cls) -> None:
+        """
+        Disable lazy section & field maps globally
+
+        Per-class lazy maps will still apply
+        """
+        cls._lazy_maps = False
+
+    @classmethod
+    def _get_lazy_maps(cls, item_class: type = None) -> bool:
+        """
+        Get the parsing policy taking into a account global policy and optionally 'item_class':
+            True if either is true
+
+        Note: if item_class is not provided, then only global parsing policy is consulted
+
+        Parameters
+        ----------
+        item_class : type, optional
+            Any OPAbstractItem class, by default None
+
+        Returns
+        -------
+        bool
+            Whether the lazy section & field maps policy is enabled
+        """
+        global_lazy = cls._lazy_maps
+
+        class_lazy = False
+        if item_class is not None:
+            class_lazy = cls._get_lazy_maps_for_class(item_class)
+
+        # Union of global and class policy
+        lazy = global_lazy or class_lazy
+
+        return lazy
+
+    @classmethod
+    def _get_lazy_maps_for_class(cls, item_class: type) -> bool:
+        """
+        Get the parsing policy only for 'item_class'
+
+        Parameters
+        ----------
+        item_class : type
+            Any OPAbstractItem class
+
+        Returns
+        -------
+        bool
+            Whether lazy section & field maps are set for 'item_class'
+        """
+        lazy = False
+        if issubclass(item_class, tuple(cls._lazy_item_classes)):
+            lazy = True
+        return lazy
+
+    @classmethod
+    def _set_lazy_maps_for_class(cls, item_class) -> None:
+        """
+        Enable lazy section & field maps for 'item_class'
+
+        Parameters
+        ----------
+        item_class : type
+            Any OPAbstractItem class
+        """
+        cls._lazy_item_classes.add(item_class)
+
+    @classmethod
+    def _set_eager_maps_for_class(cls, item_class) -> None:
+        """
+        Disable lazy section & field maps for 'item_class'
+
+        Parameters
+        ----------
+        item_class : type
+            Any OPAbstractItem class
+        """
+        if item_class in cls._lazy_item_classes:
+            cls._lazy_item_classes.remove(item_class)
+
+
+def enable_lazy_item_maps() -> None:
+    """
+    Convenience method to enable lazy section & field maps globally
+    """
+    _OPItemParsingPolicy._enable_lazy_maps()
+
+
+def disable_lazy_item_maps() -> None:
+    """
+    Convenience method to disable lazy section & field maps globally.
+
+    Per-class lazy maps policy still applies
+    """
+    _OPItemParsingPolicy._disable_lazy_maps()
+
+
+def get_lazy_item_maps(item_class=None) -> bool:
+    """
+    Get lazy section & field maps policy.
+
+    If optional 'item_class' is provided, the returned value represents the union of global
+    item parsing policy, and the class-specific item parsing policy.
+
+    Parameters
+    ----------
+    item_class : type, optional
+        Any OPAbstractItem class, by default None
+
+    Returns
+    -------
+    bool
+        The union of the global item parsing policy and the class's item parsing policy
+    """
+    return _OPItemParsingPolicy._get_lazy_maps(item_class=item_class)
+
+
+def set_lazy_item_maps_for_class(item_class) -> None:
+    """
+    Enable lazy section & field maps for the specified op item class
+
+    Parameters
+    ----------
+    item_class : type
+        Any OPAbstractItem class
+    """
+    _OPItemParsingPolicy._set_lazy_maps_for_class(item_class)
+
+
+def set_eager_item_maps_for_class(item_class) -> None:
+    """
+    Remove the specified op item class from the lazy section & field maps list
+
+    Note: lazy maps may still be used if they have been enabled globally
+
+    Parameters
+    ----------
+    item_class : type
+        Any OPAbstractItem class
+    """
+    _OPItemParsingPolicy._set_eager_maps_for_class(item_class)
@@ -0,0 +1,305 @@
+"""
+Queries over 'op item list' results
+
+An OPItemQuery is compiled once into a set of predicates over raw item descriptor
+dictionaries, so items can be filtered before any descriptor objects are created.
+Whatever 'op item list' can filter by itself (categories, tags, vault, and whether
+to include the Archive) is also pushed down to 'op', so it returns less data
+"""
+import datetime
+import fnmatch
+import re
+from abc import ABC, abstractmethod
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Pattern,
+    Union
+)
+
+from .._datetime import fromisoformat_z
+
+_ItemPredicate = Callable[[Dict], bool]
+
+
+class OPTagExpression(ABC):
+    """
+    Base class for boolean expressions over item tags
+
+    Expressions are built from OPTag objects combined with '&' (and), '|' (or), and
+    '~' (not), e.g.:
+        (OPTag("prod") | OPTag("staging")) & ~OPTag("deprecated")
+    """
+
+    @abstractmethod
+    def matches(self, tags: FrozenSet[str]) -> bool:  # pragma: no coverage
+        """
+        Whether an item with the given tags matches this expression
+        """
+
+    def pushdown_tags(self) -> Optional[FrozenSet[str]]:
+        """
+        Tags at least one of which every matching item must have, or None if there's
+        no such set. These can be passed to 'op item list --tags', which matches
+        items with any of the tags given
+        """
+        return None
+
+    def __and__(self, other: "OPTagExpression") -> "OPTagExpression":
+        return _OPTagAll(self, other)
+
+    def __or__(self, other: "OPTagExpression") -> "OPTagExpression":
+        return _OPTagAny(self, other)
+
+    def __invert__(self) -> "OPTagExpression":
+        return _OPTagNot(self)
+
+
+class OPTag(OPTagExpression):
+    """
+    Tag expression matching items that have a specific tag
+    """
+
+    def __init__(self, tag: str):
+        self.tag = tag
+
+    def matches(self, tags: FrozenSet[str]) -> bool:
+        return self.tag in tags
+
+    def pushdown_tags(self) -> Optional[FrozenSet[str]]:
+        return frozenset([self.tag])
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.tag!r})"
+
+
+class _OPTagAll(OPTagExpression):
+
+    def __init__(self, *expressions: OPTagExpression):
+        self.expressions = expressions
+
+    def matches(self, tags: FrozenSet[str]) -> bool:
+        return all([expr.matches(tags) for expr in self.expressions])
+
+    def pushdown_tags(self) -> Optional[FrozenSet[str]]:
+        # any operand's tags will do, and the fewest tags narrows the list the most
+        candidates = [expr.pushdown_tags() for expr in self.expressions]
+        candidates = [c for c in candidates if c is not None]
+        pushdown = min(candidates, key=len) if candidates else None
+        return pushdown
+
+    def __repr__(self):
+        return "(" + " & ".join([repr(expr) for expr in self.expressions]) + ")"
+
+
+class _OPTagAny(OPTagExpression):
+
+    def __init__(self, *expressions: OPTagExpression):
+        self.expressions = expressions
+
+    def matches(self, tags: FrozenSet[str]) -> bool:
+        return any([expr.matches(tags) for expr in self.expressions])
+
+    def pushdown_tags(self) -> Optional[FrozenSet[str]]:
+        # every operand has to be expressible, or items matching the rest would be missed
+        pushdown: FrozenSet[str] = frozenset()
+        for expr in self.expressions:
+            expr_tags = expr.pushdown_tags()
+            if expr_tags is None:
+                return None
+            pushdown = pushdown | expr_tags
+        return pushdown
+
+    def __repr__(self):
+        return "(" + " | ".join([repr(expr) for expr in self.expressions]) + ")"
+
+
+class _OPTagNot(OPTagExpression):
+
+    def __init__(self, expression: OPTagExpression):
+        self.expression = expression
+
+    def matches(self, tags: FrozenSet[str]) -> bool:
+        return not self.expression.matches(tags)
+
+    def __repr__(self):
+        return f"~{self.expression!r}"
+
+
+def _normalize_category(category: str) -> str:
+    # 'op' accepts e.g., "API Credential" or "api_credential", and reports "API_CREDENTIAL"
+    return category.replace(" ", "").replace("_", "").casefold()
+
+
+def _utc(dt: datetime.datetime) -> datetime.datetime:
+    # naive datetimes are taken to be UTC, since that's what 'op' reports
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=datetime.timezone.utc)
+    return dt
+
+
+class OPItemQuery:
+    """
+    A query over the items returned by 'op item list'
+
+    All criteria given must match. Criteria left as None aren't checked. Queries are
+    compiled when created, and can be reused any number of times
+
+    Parameters
+    ----------
+    title_glob : str, optional
+        A shell-style glob pattern that item titles must match
+    title_regex : Union[str, Pattern], optional
+        A regular expression that item titles must contain a match for
+    categories : Iterable[str], optional
+        Item categories, any of which items must be in, e.g., ["Login", "Password"]
+    tags : Union[str, Iterable[str], OPTagExpression], optional
+        A tag expression items must match. A single tag, or a list of tags any of
+        which items must have, is equivalent to the corresponding OPTag expression
+    vaults : Iterable[str], optional
+        Names or IDs of the vaults to query. Each vault is listed separately, and
+        concurrently. By default the OP object's default vault, or all vaults
+    updated_after : datetime.datetime, optional
+        Only match items updated at or after this time
+    updated_before : datetime.datetime, optional
+        Only match items updated before this time
+    created_after : datetime.datetime, optional
+        Only match items created at or after this time
+    created_before : datetime.datetime, optional
+        Only match items created before this time
+    favorite : bool, optional
+        Only match favorite (True) or non-favorite (False) items
+    archived : bool, optional
+        Only match items that are in the Archive (True) or not (False). If None,
+        match both. By default False, the same as OP.item_list()
+
+    Naive datetimes are taken to be UTC
+    """
+
+    def __init__(self,
+                 title_glob: Optional[str] = None,
+                 title_regex: Optional[Union[str, Pattern]] = None,
+                 categories: Optional[Iterable[str]] = None,
+                 tags: Optional[Union[str, Iterable[str], OPTagExpression]] = None,
+                 vaults: Optional[Iterable[str]] = None,
+                 updated_after: Optional[datetime.datetime] = None,
+                 updated_before: Optional[datetime.datetime] = None,
+                 created_after: Optional[datetime.datetime] = None,
+                 created_before: Optional[datetime.datetime] = None,
+                 favorite: Optional[bool] = None,
+                 archived: Optional[bool] = False):
+        if isinstance(tags, str):
+            tags = OPTag(tags)
+        elif tags is not None and not isinstance(tags, OPTagExpression):
+            tags = _OPTagAny(*[OPTag(tag) for tag in tags])
+
+        self.categories = list(categories) if categories else []
+        self.tags: Optional[OPTagExpression] = tags
+        self.vaults = list(vaults) if vaults else []
+        self.archived = archived
+
+        predicates: List[_ItemPredicate] = []
+        if title_glob is not None:
+            glob_re = re.compile(fnmatch.translate(title_glob))
+            predicates.append(self._title_predicate(glob_re.match))
+        if title_regex is not None:
+            if isinstance(title_regex, str):
+                title_regex = re.compile(title_regex)
+            predicates.append(self._title_predicate(title_regex.search))
+        if self.categories:
+            predicates.append(self._category_predicate(self.categories))
+        if tags is not None:
+            predicates.append(self._tags_predicate(tags))
+        for key, after, before in [("updated_at", updated_after, updated_before),
+                                   ("created_at", created_after, created_before)]:
+            if after is not None or before is not None:
+                predicates.append(self._date_predicate(key, after, before))
+        if favorite is not None:
+            predicates.append(self._favorite_predicate(favorite))
+        if archived is not None:
+            predicates.append(self._archived_predicate(archived))
+        self._predicates = tuple(predicates)
+
+    def matches(self, item_dict: Dict) -> bool:
+        """
+        Whether an item matches this query
+
+        Parameters
+        ----------
+        item_dict : Dict
+            An item descriptor dictionary, as output by 'op item list', or an item
+            descriptor object
+        """
+        for predicate in self._predicates:
+            if not predicate(item_dict):
+                return False
+        return True
+
+    def item_list_args(self) -> Dict:
+        """
+        Arguments for 'op item list' (see OP.item_list()) that return as few items as
+        possible without leaving out any that match, apart from the vault
+        """
+        tags = self.tags.pushdown_tags() if self.tags is not None else None
+        list_args = {
+            "categories": self.categories,
+            "include_archive": self.archived is not False,
+            "tags": sorted(tags) if tags else []
+        }
+        return list_args
+
+    @staticmethod
+    def _title_predicate(match_func: Callable) -> _ItemPredicate:
+        def _predicate(item_dict):
+            return match_func(item_dict.get("title", "")) is not None
+        return _predicate
+
+    @staticmethod
+    def _category_predicate(categories: List[str]) -> _ItemPredicate:
+        normalized = frozenset([_normalize_category(c) for c in categories])
+
+        def _predicate(item_dict):
+            category = item_dict.get("category", "")
+            return _normalize_category(category) in normalized
+        return _predicate
+
+    @staticmethod
+    def _tags_predicate(tags: OPTagExpression) -> _ItemPredicate:
+        def _predicate(item_dict):
+            return tags.matches(frozenset(item_dict.get("tags") or []))
+        return _predicate
+
+    @staticmethod
+    def _date_predicate(key: str,
+                        after: Optional[datetime.datetime],
+                        before: Optional[datetime.datetime]) -> _ItemPredicate:
+        after = _utc(after) if after is not None else None
+        before = _utc(before) if before is not None else None
+
+        def _predicate(item_dict):
+            date_str = item_dict.get(key)
+            if not date_str:
+                return False
+            date = fromisoformat_z(date_str)
+            if after is not None and date < after:
+                return False
+            if before is not None and date >= before:
+                return False
+            return True
+        return _predicate
+
+    @staticmethod
+    def _favorite_predicate(favorite: bool) -> _ItemPredicate:
+        def _predicate(item_dict):
+            return bool(item_dict.get("favorite", False)) == favorite
+        return _predicate
+
+    @staticmethod
+    def _archived_predicate(archived: bool) -> _ItemPredicate:
+        def _predicate(item_dict):
+            return (item_dict.get("state") == "ARCHIVED") == archived
+        return _predicate
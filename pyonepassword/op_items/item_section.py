@@ -1,7 +1,8 @@
 import copy
-from typing import List, Union
+from typing import List, Optional, Union
 
 from ..py_op_exceptions import OPInvalidItemException
+from ._label_index import _OPFieldIndex
 from .item_field_base import OPItemField
 
 
@@ -19,6 +20,8 @@ class OPSection(dict):
         # shadow fields map makes it easy to detect collisions
         # by looking up a field's ID to see if it's already been registered
         self._shadow_fields = {}
+        # label index, built on the first lookup by label
+        self._field_index: Optional[_OPFieldIndex] = None
 
     @property
     def section_id(self) -> str:
@@ -78,21 +81,16 @@ class OPSection(dict):
         else:
             self._shadow_fields[field_id] = field
         self.fields.append(field)
+        if self._field_index is not None:
+            self._field_index.add(field)
 
     def fields_by_label(self, label, case_sensitive=True) -> List[OPItemField]:
         """
         Returns all fields in a section matching the given label.
         Fields are not required to have unique labels, so there may be more than one match.
         """
-        matching_fields = []
-        f: OPItemField
-        for f in self.fields:
-            f_label = f.label
-            if not case_sensitive:
-                f_label = f_label.lower()
-                label = label.lower()
-            if f_label == label:
-                matching_fields.append(f)
+        matching_fields = self._get_field_index().lookup(
+            label, case_sensitive=case_sensitive)
         return matching_fields
 
     def first_field_by_label(self, label: str, case_sensitive=True):
@@ -103,3 +101,11 @@ class OPSection(dict):
         fields = self.fields_by_label(label, case_sensitive=case_sensitive)
         f = fields[0]
         return f
+
+    def _get_field_index(self) -> _OPFieldIndex:
+        fields = self.fields
+        # register_field() keeps the index up to date, but the field list may
+        # also have been modified directly
+        if self._field_index is None or len(self._field_index) != len(fields):
+            self._field_index = _OPFieldIndex(fields)
+        return self._field_index
@@ -1,4 +1,5 @@
-from typing import Set
+import threading
+from typing import Dict, Set, Tuple
 
 """
 Module for classes & functions related to item valiation policy.
@@ -15,20 +16,45 @@ per-class basis
 """
 
 
-class _OPItemValidationPolicy:
+class _OPPolicyMeta(type):
+    """
+    Metaclass for policy classes. Assigning any policy class attribute bumps the class's
+    generation, invalidating any verdicts cached under the previous generation
+
+    Changes made in place, such as adding to a set of classes, don't assign anything,
+    so those must bump the generation themselves
+    """
+    _generation: int
+
+    def __setattr__(cls, name, value):
+        super().__setattr__(name, value)
+        if name != "_generation":
+            super().__setattr__("_generation", cls._generation + 1)
+
+
+class _OPItemValidationPolicy(metaclass=_OPPolicyMeta):
     """
     Class representing the active policy whether a 1Password item object should
     enforce strict validation policy when processing a dictionary from JSON
+
+    Per-class verdicts are cached, so resolving the policy for an item is a single lookup.
+    Every change to the policy bumps a generation counter that invalidates the cache
     """
     _relaxed_item_classes: Set[type] = set()
     _relaxed_validation: bool = False
+    _generation: int = 0
+    # item class -> (generation, verdict)
+    _class_verdicts: Dict[type, Tuple[int, bool]] = {}
+    # serializes policy changes and cache misses
+    _lock = threading.Lock()
 
     @classmethod
     def _enable_relaxed_validation(cls) -> None:
         """
         Enable relaxed validation policy globally
         """
-        cls._relaxed_validation = True
+        with cls._lock:
+            cls._relaxed_validation = True
 
     @classmethod
     def _disable_relaxed_validation(cls) -> None:
@@ -37,7 +63,8 @@ class _OPItemValidationPolicy:
 
         Per-class relaxed validation will still apply
         """
-        cls._relaxed_validation = False
+        with cls._lock:
+            cls._relaxed_validation = False
 
     @classmethod
     def _get_relaxed_validation(cls, item_class: type = None) -> bool:
@@ -59,7 +86,9 @@ class _OPItemValidationPolicy:
         """
         global_relaxed = cls._relaxed_validation
 
-        class_relaxed = cls._get_relaxed_validation_for_class(item_class)
+        class_relaxed = False
+        if item_class is not None:
+            class_relaxed = cls._get_relaxed_validation_for_class(item_class)
 
         # Union of global and class policy
         relaxed = global_relaxed or class_relaxed
@@ -81,11 +110,18 @@ class _OPItemValidationPolicy:
         bool
             Whether relaxed validation is set for 'item_class'
         """
-        relaxed = False
-        # is obj_or_class, one of the classes (or a subclass of)
-        # for which validation is relaxed?
-        if issubclass(item_class, tuple(cls._relaxed_item_classes)):
-            relaxed = True
+        generation = cls._generation
+        verdict = cls._class_verdicts.get(item_class)
+        if verdict is not None and verdict[0] == generation:
+            return verdict[1]
+
+        with cls._lock:
+            relaxed = False
+            # is obj_or_class, one of the classes (or a subclass of)
+            # for which validation is relaxed?
+            if issubclass(item_class, tuple(cls._relaxed_item_classes)):
+                relaxed = True
+            cls._class_verdicts[item_class] = (cls._generation, relaxed)
         return relaxed
 
     @classmethod
@@ -98,7 +134,9 @@ class _OPItemValidationPolicy:
         item_class : type
             Any OPAbstractItem class
         """
-        cls._relaxed_item_classes.add(item_class)
+        with cls._lock:
+            cls._relaxed_item_classes.add(item_class)
+            cls._generation += 1
 
     @classmethod
     def _set_strict_validation_for_class(cls, item_class) -> None:
@@ -110,8 +148,10 @@ class _OPItemValidationPolicy:
         item_class : type
             Any OPAbstractItem class
         """
-        if item_class in cls._relaxed_item_classes:
-            cls._relaxed_item_classes.remove(item_class)
+        with cls._lock:
+            if item_class in cls._relaxed_item_classes:
+                cls._relaxed_item_classes.remove(item_class)
+                cls._generation += 1
 
 
 def enable_relaxed_validation() -> None:
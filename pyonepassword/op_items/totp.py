@@ -1,4 +1,177 @@
+import base64
+import binascii
+import datetime
+import hmac
+import threading
+import time
+import urllib.parse
+from typing import Callable, Optional, Union
+
 from ..json import safe_unjson
+from ..py_op_exceptions import OPInvalidTOTPException
+
+TOTPTime = Union[int, float, datetime.datetime]
+
+# otpauth:// 'algorithm' parameter values, and their hashlib names
+_TOTP_ALGORITHMS = {
+    "SHA1": "sha1",
+    "SHA256": "sha256",
+    "SHA512": "sha512"
+}
+
+
+def _decode_totp_secret(secret: str) -> bytes:
+    # Secrets are often shown in groups, and without padding, so strip spaces and
+    # re-pad before base32 decoding
+    secret = secret.replace(" ", "").upper()
+    missing_padding = len(secret) % 8
+    if missing_padding != 0:
+        secret += "=" * (8 - missing_padding)
+    try:
+        key = base64.b32decode(secret)
+    except binascii.Error as e:
+        raise OPInvalidTOTPException(
+            f"Invalid TOTP secret: base32 decoding {e}") from e
+    if not key:
+        raise OPInvalidTOTPException("Invalid TOTP secret: secret is empty")
+    return key
+
+
+def _unix_time(at: Optional[TOTPTime]) -> float:
+    if at is None:
+        return time.time()
+    if isinstance(at, datetime.datetime):
+        # naive datetimes are taken to be UTC
+        if at.tzinfo is None:
+            at = at.replace(tzinfo=datetime.timezone.utc)
+        return at.timestamp()
+    return float(at)
+
+
+class OPTOTPGenerator:
+    """
+    RFC 6238 TOTP code generator
+
+    Parameters
+    ----------
+    secret : str
+        The base32-encoded TOTP secret
+    digits : int, optional
+        The number of digits in each code, by default 6
+    period : int, optional
+        How long each code is valid, in seconds, by default 30
+    algorithm : str, optional
+        The HMAC hash algorithm: "SHA1", "SHA256", or "SHA512". By default "SHA1"
+
+    Raises
+    ------
+    OPInvalidTOTPException
+        If the secret can't be decoded, or any of the parameters is invalid
+    """
+    DEFAULT_DIGITS = 6
+    DEFAULT_PERIOD = 30
+    DEFAULT_ALGORITHM = "SHA1"
+
+    def __init__(self,
+                 secret: str,
+                 digits: int = DEFAULT_DIGITS,
+                 period: int = DEFAULT_PERIOD,
+                 algorithm: str = DEFAULT_ALGORITHM):
+        algorithm = algorithm.upper()
+        if algorithm not in _TOTP_ALGORITHMS:
+            raise OPInvalidTOTPException(
+                f"Unsupported TOTP algorithm: {algorithm}")
+        # beyond 10 digits, codes would just be zero-padded 31-bit integers
+        if not 1 <= digits <= 10:
+            raise OPInvalidTOTPException(f"Invalid TOTP digits: {digits}")
+        if period <= 0:
+            raise OPInvalidTOTPException(f"Invalid TOTP period: {period}")
+        self._key = _decode_totp_secret(secret)
+        self.digits = digits
+        self.period = period
+        self.algorithm = algorithm
+        self._digest = _TOTP_ALGORITHMS[algorithm]
+        self._modulus = 10 ** digits
+
+    @classmethod
+    def from_uri(cls, uri: str) -> "OPTOTPGenerator":
+        """
+        Create a generator from an otpauth:// URI, e.g.:
+            otpauth://totp/Example:alice%40example.com?secret=JBSWY3DPEHPK3PXP&digits=8
+
+        Raises
+        ------
+        OPInvalidTOTPException
+            If the URI isn't a valid otpauth://totp URI
+        """
+        parsed = urllib.parse.urlsplit(uri)
+        if parsed.scheme.lower() != "otpauth":
+            raise OPInvalidTOTPException(f"Not an otpauth URI: {parsed.scheme}")
+        if parsed.netloc.lower() != "totp":
+            raise OPInvalidTOTPException(
+                f"Unsupported OTP type: {parsed.netloc}")
+        params = urllib.parse.parse_qs(parsed.query)
+        secret = params.get("secret")
+        if not secret:
+            raise OPInvalidTOTPException("otpauth URI has no secret")
+        try:
+            digits = int(params.get("digits", [cls.DEFAULT_DIGITS])[0])
+            period = int(params.get("period", [cls.DEFAULT_PERIOD])[0])
+        except ValueError as e:
+            raise OPInvalidTOTPException(f"Invalid otpauth URI: {e}") from e
+        algorithm = params.get("algorithm", [cls.DEFAULT_ALGORITHM])[0]
+        return cls(secret[0], digits=digits, period=period, algorithm=algorithm)
+
+    @classmethod
+    def from_secret_or_uri(cls, secret_or_uri: str) -> "OPTOTPGenerator":
+        """
+        Create a generator from a TOTP field value, which may be either an otpauth://
+        URI or a bare base32 secret
+        """
+        if secret_or_uri is None:
+            raise OPInvalidTOTPException("TOTP field has no value")
+        secret_or_uri = secret_or_uri.strip()
+        if secret_or_uri.lower().startswith("otpauth:"):
+            return cls.from_uri(secret_or_uri)
+        return cls(secret_or_uri)
+
+    def counter(self, at: Optional[TOTPTime] = None) -> int:
+        """
+        The RFC 6238 time step for the given time
+        """
+        return int(_unix_time(at) // self.period)
+
+    def seconds_remaining(self, at: Optional[TOTPTime] = None) -> float:
+        """
+        How many seconds from the given time until the next code
+        """
+        return self.period - (_unix_time(at) % self.period)
+
+    def generate(self, at: Optional[TOTPTime] = None) -> str:
+        """
+        Generate the TOTP code for a given time
+
+        Parameters
+        ----------
+        at : Union[int, float, datetime.datetime], optional
+            A Unix timestamp or datetime to generate the code for, by default now.
+            Naive datetimes are taken to be UTC
+
+        Returns
+        -------
+        str
+            The zero-padded TOTP code
+        """
+        counter = self.counter(at)
+        mac = hmac.digest(self._key, counter.to_bytes(8, "big"), self._digest)
+        # RFC 4226 dynamic truncation
+        offset = mac[-1] & 0x0F
+        code = int.from_bytes(mac[offset:offset + 4], "big") & 0x7FFFFFFF
+        return str(code % self._modulus).zfill(self.digits)
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}(digits={self.digits}, "
+                f"period={self.period}, algorithm={self.algorithm!r})")
 
 
 class OPTOTPItem(dict):
@@ -39,3 +212,68 @@ class OPTOTPItem(dict):
     @property
     def reference(self) -> str:
         return self["reference"]
+
+    def generate(self, at: Optional[TOTPTime] = None) -> str:
+        """
+        Generate a TOTP code locally from this item's secret. See OPTOTPGenerator.generate()
+        """
+        return OPTOTPGenerator.from_secret_or_uri(self.value).generate(at)
+
+
+class OPTOTPProvider:
+    """
+    Generates TOTP codes locally from a secret fetched once from 1Password
+
+    The secret is fetched with 'fetch_func' when the provider is created, and codes are
+    then generated without running 'op'. Call refresh() if a code is rejected, e.g.,
+    because the secret was changed in 1Password. If a refresh fails, the stale secret is
+    discarded, and the next code() or seconds_remaining() call fetches it again
+
+    Obtain a provider from OP.totp_provider() rather than creating one directly
+    """
+
+    def __init__(self, fetch_func: Callable[[], OPTOTPItem]):
+        self._fetch_func = fetch_func
+        self._lock = threading.Lock()
+        self._generator: Optional[OPTOTPGenerator] = None
+        self.refresh()
+
+    @property
+    def generator(self) -> OPTOTPGenerator:
+        generator = self._generator
+        if generator is None:
+            generator = self.refresh()
+        return generator
+
+    def refresh(self) -> OPTOTPGenerator:
+        """
+        Fetch the secret from 1Password again
+
+        Raises
+        ------
+        OPInvalidTOTPException
+            If the fetched secret isn't a valid TOTP secret or otpauth URI
+        Any exception raised by the fetch, such as OPItemGetException
+        """
+        with self._lock:
+            try:
+                totp_item = self._fetch_func()
+                generator = OPTOTPGenerator.from_secret_or_uri(totp_item.value)
+            except Exception:
+                # don't keep generating codes from a secret known to be stale
+                self._generator = None
+                raise
+            self._generator = generator
+            return generator
+
+    def code(self, at: Optional[TOTPTime] = None) -> str:
+        """
+        Generate the TOTP code for a given time. See OPTOTPGenerator.generate()
+        """
+        return self.generator.generate(at)
+
+    def seconds_remaining(self, at: Optional[TOTPTime] = None) -> float:
+        """
+        How many seconds from the given time until the next code
+        """
+        return self.generator.seconds_remaining(at)
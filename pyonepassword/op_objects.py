@@ -1,14 +1,13 @@
 """
 Miscellaneous classes for objects return by 'op get' other than item or document objects
 """
-import json
 from datetime import datetime
 from json.decoder import JSONDecodeError
 from typing import Dict, List, TypeVar, Union
 
 from ._abc_meta import ABCMetaDict, enforcedmethod
 from ._datetime import fromisoformat_z
-from .json import safe_unjson
+from .json import loads, safe_unjson
 from .py_op_exceptions import OPBaseException
 
 
@@ -288,7 +287,7 @@ class OPUserDescriptorList(_OPDescriptorList[OPUserDescriptor]):
         super().__init__()
         user_list = []
         try:
-            user_list = json.loads(user_list_json)
+            user_list = loads(user_list_json)
         except JSONDecodeError as jdce:
             raise OPInvalidUserListException(
                 f"Failed to unserialize user json: {jdce}", user_list_json)
@@ -341,7 +340,7 @@ class OPGroupDescriptorList(_OPDescriptorList[OPGroupDescriptor]):
         super().__init__()
         group_list = []
         try:
-            group_list = json.loads(group_list_json)
+            group_list = loads(group_list_json)
         except JSONDecodeError as jdce:
             raise OPInvalidGroupListException(
                 f"Failed to unserialize user json: {jdce}", group_list_json) from jdce
@@ -419,7 +418,7 @@ class OPVaultDescriptorList(_OPDescriptorList[OPVaultDescriptor]):
         super().__init__()
         vault_list = []
         try:
-            vault_list = json.loads(vault_list_json)
+            vault_list = loads(vault_list_json)
         except JSONDecodeError as jdce:
             raise OPInvalidVaultListException(
                 f"Failed to unserialize vault list JSON: {jdce}", vault_list_json) from jdce
@@ -44,6 +44,22 @@ class OPCmdFailedException(OPBaseException):
         return cls(ope.err_output, ope.returncode)
 
 
+class OPCmdTimeoutException(OPBaseException):
+    """
+    Raised when an 'op' command is killed for running past its timeout or deadline
+
+    This is deliberately not an OPCmdFailedException, since 'op' didn't report a
+    failure, and the command may well succeed if retried
+    """
+    MSG = "'op' command timed out after %.3f seconds: %s"
+
+    def __init__(self, command: str, timeout: float, err_output: str = ""):
+        self.command = command
+        self.timeout = timeout
+        self.err_output = err_output
+        super().__init__(self.MSG % (timeout, command))
+
+
 class OPSigninException(OPCmdFailedException):
     MSG = "1Password sign-in failed."
 
@@ -170,6 +186,20 @@ class OPGroupListException(OPCmdFailedException):
         super().__init__(stderr_out, returncode)
 
 
+class OPInjectException(OPCmdFailedException):
+    MSG = "1Password 'inject' failed."
+
+    def __init__(self, stderr_out, returncode):
+        super().__init__(stderr_out, returncode)
+
+
+class OPReadException(OPCmdFailedException):
+    MSG = "1Password 'read' failed."
+
+    def __init__(self, stderr_out, returncode):
+        super().__init__(stderr_out, returncode)
+
+
 class OPItemCreateException(OPCmdFailedException):  # pragma: no coverage
     MSG = "1Password 'item create' failed."
 
@@ -213,3 +243,13 @@ class OPInvalidFieldException(OPBaseException):
 class OPUnknownAccountException(OPBaseException):
     def __init__(self, msg):
         super().__init__(msg)
+
+
+class OPResponseCacheException(OPBaseException):
+    def __init__(self, msg):
+        super().__init__(msg)
+
+
+class OPInvalidTOTPException(OPBaseException):
+    def __init__(self, msg):
+        super().__init__(msg)
@@ -1,26 +1,73 @@
+import datetime
 import fnmatch
+import hashlib
+import json
 import logging
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from json.decoder import JSONDecodeError
 from os import environ as env
-from typing import List, Optional, Type, Union
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Type,
+    Union,
+    overload
+)
 
+from ._datetime import fromisoformat_z
+from ._document_download import (
+    DOCUMENT_DOWNLOADED,
+    DOCUMENT_FAILED,
+    DOCUMENT_SKIPPED,
+    DocumentDestination,
+    OPDocumentDownload,
+    OPDocumentManifest,
+    OPDocumentManifestEntry,
+    _document_path,
+    _file_matches,
+    _new_hasher,
+    _write_document_chunks
+)
+from ._item_cache import OPItemCache, OPItemCacheRevalidation
+from ._py_op_cli import (
+    _ENVIRON_LOCK,
+    EXEC_MODE_ONE_SHOT,
+    ExecModeEnum,
+    _with_caller_deadline
+)
 from ._py_op_commands import (
     EXISTING_AUTH_IGNORE,
     ExistingAuthEnum,
     _OPCommandInterface
 )
 from ._py_op_deprecation import deprecated_kwargs
+from ._response_cache import OPResponseCache
 from .account import OPAccountList
+from .json import iter_concatenated_json, iter_json_array, safe_unjson
+from .op_items._item_descriptor_base import OPAbstractItemDescriptor
+from .op_items._item_descriptor_registry import OPItemDescriptorFactory
 from .op_items._item_list import OPItemList
 from .op_items._new_item import OPNewItemMixin
 from .op_items._op_item_type_registry import OPItemFactory
 from .op_items._op_items_base import OPAbstractItem
+from .op_items.compact_item import OPCompactItem
+from .op_items.document import OPDocumentItem
 from .op_items.generic_item import (
     _OPGenericItem,
     _OPGenericItemRelaxedValidation
 )
+from .op_items.item_query import OPItemQuery
 from .op_items.login import OPLoginItemNewPrimaryURL, OPLoginItemTemplate
 from .op_items.password_recipe import OPPasswordRecipe
-from .op_items.totp import OPTOTPItem
+from .op_items.totp import OPTOTPItem, OPTOTPProvider
+from .op_items.uuid import is_uuid
 from .op_objects import (
     OPGroup,
     OPGroupDescriptorList,
@@ -31,9 +78,11 @@ from .op_objects import (
 )
 from .py_op_exceptions import (
     OPCmdFailedException,
+    OPCmdTimeoutException,
     OPDocumentDeleteException,
     OPDocumentGetException,
     OPForgetException,
+    OPInjectException,
     OPInvalidDocumentException,
     OPInvalidItemException,
     OPItemDeleteException,
@@ -60,7 +109,12 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
                  password_prompt: bool = True,
                  vault: Optional[str] = None,
                  op_path: str = 'op',
-                 logger: Optional[logging.Logger] = None):
+                 logger: Optional[logging.Logger] = None,
+                 exec_mode: ExecModeEnum = EXEC_MODE_ONE_SHOT,
+                 pool_size: Optional[int] = None,
+                 item_cache: Optional[OPItemCache] = None,
+                 response_cache: Optional[OPResponseCache] = None,
+                 timeout: Optional[float] = None):
         """
         Create an OP object. The 1Password (non-initial) sign-in happens during object instantiation.
 
@@ -86,6 +140,28 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
             Optional path to the `op` command, if it's not at the default location
         logger : logging.Logger
             A logging object. If not provided a basic logger is created and used
+        exec_mode : ExecModeEnum, optional
+            How 'op' commands are executed
+            Valid values:
+              - EXEC_MODE_ONE_SHOT: Run each command as a fresh 'op' process in the calling thread (default)
+              - EXEC_MODE_POOLED: Dispatch each command to a bounded pool of persistent worker threads,
+                capping the number of concurrent 'op' processes
+            Per-command latency for either mode is available via OP.latency_stats()
+        pool_size : int, optional
+            Number of workers when exec_mode is EXEC_MODE_POOLED, by default 4
+        item_cache : OPItemCache, optional
+            If provided, items returned by item_get() are cached here, and repeated lookups
+            are served from the cache until they expire. Items that get created or deleted via
+            this object are automatically evicted
+        response_cache : OPResponseCache, optional
+            If provided, responses to read-only 'op' commands (item get, item list, vault list, etc.)
+            are cached on disk, where other processes using the same cache directory can reuse them.
+            Any item creation or deletion clears this account's cached responses
+        timeout : float, optional
+            If provided, the maximum number of seconds any single 'op' command run by this
+            object, including sign-in, may take. Commands that run longer are killed, and
+            OPCmdTimeoutException is raised. See also op_deadline(), which bounds the total
+            time of any number of commands
 
         Raises
         ------
@@ -106,9 +182,52 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
                          logger=logger,
                          op_path=op_path,
                          existing_auth=existing_auth,
-                         password_prompt=password_prompt)
-
-    def item_get(self, item_identifier, vault=None, include_archive=False, generic_okay=False, relaxed_validation=False) -> OPAbstractItem:
+                         password_prompt=password_prompt,
+                         exec_mode=exec_mode,
+                         pool_size=pool_size,
+                         response_cache=response_cache,
+                         timeout=timeout)
+        self._item_cache = item_cache
+
+    @property
+    def item_cache(self) -> Optional[OPItemCache]:
+        return self._item_cache
+
+    @overload
+    def item_get(self,
+                 item_identifier,
+                 vault=...,
+                 include_archive=...,
+                 generic_okay=...,
+                 relaxed_validation=...,
+                 compact: Literal[False] = ...) -> OPAbstractItem: ...
+
+    @overload
+    def item_get(self,
+                 item_identifier,
+                 vault=...,
+                 include_archive=...,
+                 generic_okay=...,
+                 relaxed_validation=...,
+                 *,
+                 compact: Literal[True]) -> OPCompactItem: ...
+
+    @overload
+    def item_get(self,
+                 item_identifier,
+                 vault=...,
+                 include_archive=...,
+                 generic_okay=...,
+                 relaxed_validation=...,
+                 compact: bool = ...) -> Union[OPAbstractItem, OPCompactItem]: ...
+
+    def item_get(self,
+                 item_identifier,
+                 vault=None,
+                 include_archive=False,
+                 generic_okay=False,
+                 relaxed_validation=False,
+                 compact: bool = False) -> Union[OPAbstractItem, OPCompactItem]:
         """
         Get an 'item' object from a 1Password vault.
         The returned object may be any of the item types extending OPAbstractItem.
@@ -136,6 +255,9 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
         relaxed_validation: bool, optional
             Whether to enable relaxed item validation for this query, in order to parse non-conformant data
             by default False
+        compact: bool, optional
+            Return a read-only OPCompactItem, which uses a fraction of the memory, rather than
+            one of the types listed above, by default False
         Note:
             If a non-unique item identifier is provided (e.g., item name/title), and there
             is more than one item that matches, OPItemGetException will be raised. Check the
@@ -153,16 +275,397 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
             If the 1Password command can't be found
         Returns
         -------
-        item: OPAbstractItem
-            An item object of one of the types listed above
+        item: OPAbstractItem or OPCompactItem
+            An item object of one of the types listed above, or a compact item
         """
 
+        cache_key = None
+        if self._item_cache is not None:
+            cache_key = OPItemCache.key(item_identifier,
+                                        vault=vault if vault else self.vault,
+                                        include_archive=include_archive,
+                                        relaxed_validation=relaxed_validation,
+                                        compact=compact)
+            op_item = self._item_cache.get(cache_key)
+            # a generic item may only be handed back to callers who are okay with one
+            if op_item is not None and (generic_okay or not self._is_generic_item(op_item)):
+                return op_item
+
+        # parse the undecoded output; the JSON codec handles bytes directly
         output = super()._item_get(item_identifier, vault=vault,
-                                   decode="utf-8", include_archive=include_archive)
+                                   decode=None, include_archive=include_archive)
         op_item = OPItemFactory.op_item(
-            output, generic_okay=generic_okay, relaxed_validation=relaxed_validation)
+            output, generic_okay=generic_okay, relaxed_validation=relaxed_validation, compact=compact)
+        if cache_key is not None:
+            self._item_cache.put(cache_key, op_item)
         return op_item
 
+    def item_cache_revalidate(self, vault: Optional[str] = None) -> OPItemCacheRevalidation:
+        """
+        Bring this object's item cache up to date using one 'op item list' per vault,
+        rather than one 'op item get' per cached item
+
+        Each cached item's version is compared to the version 'op item list' reports for it:
+        - Unchanged items stay cached, and their time-to-live starts over
+        - Items whose version changed are fetched again with 'op item get'
+        - Items that no longer exist (or were archived, if looked up without include_archive)
+          are evicted
+
+        Parameters
+        ----------
+        vault : str, optional
+            Only revalidate cached items from this vault (name or ID), by default all vaults
+
+        Raises
+        ------
+        OPItemListException
+            If listing one of the vaults fails
+        OPNotFoundException
+            If the 1Password command can't be found
+
+        Returns
+        -------
+        OPItemCacheRevalidation
+            Unique IDs of the items that were unchanged, updated, and removed.
+            If this object has no item cache, all three lists are empty
+        """
+        revalidation = OPItemCacheRevalidation([], [], [])
+        if self._item_cache is None:
+            return revalidation
+
+        # group cached entries by the vault their items live in. List each vault by the
+        # name it was looked up with where possible, falling back to its unique ID
+        by_vault: Dict[str, List] = {}
+        list_vault: Dict[str, str] = {}
+        list_archive: Dict[str, bool] = {}
+        for key, item in self._item_cache.entries(vault=vault):
+            vault_id = item.vault_id
+            by_vault.setdefault(vault_id, []).append((key, item))
+            if key.vault or vault_id not in list_vault:
+                list_vault[vault_id] = key.vault if key.vault else vault_id
+            list_archive[vault_id] = list_archive.get(
+                vault_id, False) or key.include_archive
+
+        for vault_id, entries in by_vault.items():
+            # a cached response would be no fresher than the items being revalidated
+            item_list_json = self._item_list(vault=list_vault[vault_id],
+                                             include_archive=list_archive[vault_id],
+                                             decode=None, refresh_cache=True)
+            item_list = OPItemList(item_list_json, generic_okay=True)
+            for key, item in entries:
+                descriptor = item_list.by_id(item.unique_id)
+                if descriptor is None or (descriptor.archived and not key.include_archive):
+                    self._item_cache.discard(key)
+                    revalidation.removed.append(item.unique_id)
+                elif descriptor.version == item.version:
+                    self._item_cache.put(key, item)
+                    revalidation.unchanged.append(item.unique_id)
+                else:
+                    try:
+                        output = super()._item_get(key.item_identifier, vault=key.vault,
+                                                   decode=None, include_archive=key.include_archive,
+                                                   refresh_cache=True)
+                    except OPItemGetException:
+                        self._item_cache.discard(key)
+                        revalidation.removed.append(item.unique_id)
+                        continue
+                    new_item = OPItemFactory.op_item(output,
+                                                     generic_okay=self._is_generic_item(
+                                                         item),
+                                                     relaxed_validation=key.relaxed_validation,
+                                                     compact=key.compact)
+                    self._item_cache.put(key, new_item)
+                    revalidation.updated.append(item.unique_id)
+
+        return revalidation
+
+    def item_get_many(self,
+                      item_identifiers: Iterable[str],
+                      vault=None,
+                      include_archive=False,
+                      generic_okay=False,
+                      relaxed_validation=False,
+                      max_workers: int = 8,
+                      compact=False) -> List[Union[OPAbstractItem, OPCompactItem, OPItemGetException, OPCmdTimeoutException]]:
+        """
+        Get multiple 'item' objects concurrently, using up to 'max_workers' simultaneous 'op item get'
+        commands. Each item is parsed the same as with OP.item_get()
+
+        NOTE: If this object was created with exec_mode=EXEC_MODE_POOLED, the number of concurrent
+        'op' processes is further capped by the pool size
+
+        Parameters
+        ----------
+        item_identifiers: Iterable[str]
+            Names or IDs of the items to look up
+        vault: str, optional
+            The name or ID of a vault to override the object's default vault, by default None
+        include_archive: bool, optional
+            Include items in the Archive, by default False
+        generic_okay: bool, optional
+            Instantiate unknown item types as _OPGenericItem rather than raise OPUnknownItemException
+        relaxed_validation: bool, optional
+            Whether to enable relaxed item validation for this query, in order to parse non-conformant data
+            by default False
+        max_workers: int, optional
+            Maximum number of items to fetch at once, by default 8
+        compact: bool, optional
+            Return read-only OPCompactItem objects, by default False
+
+        Raises
+        ------
+        OPInvalidItemException
+            If any item's JSON fails to decode
+        OPUnknownItemTypeException
+            If any item object returned by 1Password isn't a known type and generic_okay is False
+        OPNotFoundException
+            If the 1Password command can't be found
+
+        Returns
+        -------
+        results: List[Union[OPAbstractItem, OPItemGetException, OPCmdTimeoutException]]
+            One entry per identifier, in the same order as 'item_identifiers'. Each entry is either
+            the item object, or the OPItemGetException or OPCmdTimeoutException describing why
+            that item's lookup failed
+        """
+        def _get_one(item_identifier):
+            result: Union[OPAbstractItem, OPCompactItem,
+                          OPItemGetException, OPCmdTimeoutException]
+            try:
+                result = self.item_get(item_identifier,
+                                       vault=vault,
+                                       include_archive=include_archive,
+                                       generic_okay=generic_okay,
+                                       relaxed_validation=relaxed_validation,
+                                       compact=compact)
+            except (OPItemGetException, OPCmdTimeoutException) as e:
+                result = e
+            return result
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            # executor.map() yields results in input order
+            results = list(pool.map(_with_caller_deadline(_get_one), item_identifiers))
+        return results
+
+    def item_get_batch(self,
+                       descriptors_or_ids: Iterable[Union[OPAbstractItemDescriptor, str]],
+                       vault: Optional[str] = None,
+                       include_archive: bool = False,
+                       generic_okay: bool = False,
+                       relaxed_validation: bool = False) -> List[OPAbstractItem]:
+        """
+        Get many items with a single 'op item get' process, by passing the items to
+        'op item get -' on stdin, the way 'op item list --format json | op item get -' works
+
+        This is much cheaper than item_get() or item_get_many() for large numbers of items,
+        e.g., every item from an item_list(), since only one 'op' process is started.
+        Unlike item_get_many(), if any item can't be retrieved, the entire batch fails
+
+        Parameters
+        ----------
+        descriptors_or_ids : Iterable[Union[OPAbstractItemDescriptor, str]]
+            Items to get, as item descriptors (such as an OPItemList) or unique IDs. Item names
+            aren't supported
+        vault : str, optional
+            The name or ID of a vault to override the object's default vault, by default None
+        include_archive : bool, optional
+            Include items in the Archive, by default False
+        generic_okay : bool, optional
+            Instantiate unknown item types as _OPGenericItem rather than raise OPUnknownItemException
+        relaxed_validation : bool, optional
+            Whether to enable relaxed item validation for this query, in order to parse non-conformant data
+            by default False
+
+        Raises
+        ------
+        OPItemGetException
+            If the lookup fails for any reason during command execution
+        OPInvalidItemException
+            If the item JSON fails to decode
+        OPUnknownItemTypeException
+            If any item returned by 1Password isn't a known type and generic_okay is False
+        OPNotFoundException
+            If the 1Password command can't be found
+
+        Returns
+        -------
+        List[OPAbstractItem]
+            The item objects, in the order 'op' returns them
+        """
+        batch: List[Dict] = []
+        for descriptor_or_id in descriptors_or_ids:
+            if isinstance(descriptor_or_id, str):
+                batch.append({"id": descriptor_or_id})
+            else:
+                batch.append(descriptor_or_id)
+        if not batch:
+            return []
+
+        batch_json = json.dumps(batch)
+        output = self._item_get_multiple(batch_json, vault=vault,
+                                         decode="utf-8", include_archive=include_archive)
+        items = []
+        try:
+            for item_dict in iter_concatenated_json(output):
+                op_item = OPItemFactory.op_item(item_dict,
+                                                generic_okay=generic_okay,
+                                                relaxed_validation=relaxed_validation)
+                items.append(op_item)
+        except JSONDecodeError as jdce:
+            raise OPInvalidItemException(
+                f"Failed to unserialize item JSON: {jdce}") from jdce
+
+        if self._item_cache is not None:
+            for op_item in items:
+                cache_key = OPItemCache.key(op_item.unique_id,
+                                            vault=vault if vault else self.vault,
+                                            include_archive=include_archive,
+                                            relaxed_validation=relaxed_validation)
+                self._item_cache.put(cache_key, op_item)
+        return items
+
+    def item_get_fields(self,
+                        item_identifier: str,
+                        labels: Iterable[str],
+                        vault: Optional[str] = None,
+                        include_archive: bool = False) -> Dict[str, Optional[str]]:
+        """
+        Get the values of specific fields from an item, by field label
+
+        Only the requested fields are returned by 'op' (via 'op item get --fields'), and
+        only those fields are parsed. No item object is created, which makes this much cheaper
+        than item_get() for large items when only a few values are needed
+
+        Parameters
+        ----------
+        item_identifier : str
+            Name or ID of the item to look up
+        labels : Iterable[str]
+            Labels of the fields to get, e.g., ["username", "password"]. Labels may not
+            contain commas
+        vault : str, optional
+            The name or ID of a vault to override the object's default vault, by default None
+        include_archive : bool, optional
+            Include items in the Archive, by default False
+
+        Raises
+        ------
+        OPItemGetException
+            If the lookup fails for any reason during command execution
+        OPInvalidItemException
+            If the field JSON fails to decode
+        OPNotFoundException
+            If the 1Password command can't be found
+
+        Returns
+        -------
+        Dict[str, Optional[str]]
+            A mapping of requested label to field value, for each requested label that was
+            found. Labels are matched case-insensitively, but keyed as given. Fields with no
+            value map to None. If more than one field has the same label, the first one's
+            value is returned
+        """
+        labels = list(labels)
+        field_values: Dict[str, Optional[str]] = {}
+        if not labels:
+            return field_values
+
+        fields_arg = ",".join([f"label={label}" for label in labels])
+        output = super()._item_get(item_identifier, vault=vault, fields=fields_arg,
+                                   decode=None, include_archive=include_archive)
+        # 'op' prints nothing at all when none of the labels match
+        if not output.strip():
+            return field_values
+        try:
+            fields = safe_unjson(output)
+        except JSONDecodeError as jdce:
+            raise OPInvalidItemException(
+                f"Failed to unserialize field JSON: {jdce}") from jdce
+
+        # 'op' matches labels case-insensitively, so map each field back to the
+        # label the caller asked for, rather than the label as stored on the item
+        requested: Dict[str, str] = {}
+        for label in labels:
+            requested.setdefault(label.lower(), label)
+
+        # 'op' returns a single object when one field matches, and an array otherwise
+        if isinstance(fields, dict):
+            fields = [fields]
+        for field in fields:
+            label = requested.get(str(field.get("label", "")).lower())
+            if label is not None:
+                field_values.setdefault(label, field.get("value"))
+        return field_values
+
+    def read_references(self, references: Iterable[str], max_workers: int = 8) -> Dict[str, str]:
+        """
+        Resolve a batch of secret references (e.g., 'op://vault/item/field') to their values
+
+        All references are resolved with a single 'op inject' invocation. If that fails,
+        for example because one of the references is invalid, each reference is instead
+        resolved individually with 'op read', concurrently
+
+        Parameters
+        ----------
+        references : Iterable[str]
+            Secret references to resolve, e.g., from OPItemField.reference
+        max_workers : int, optional
+            Maximum number of concurrent 'op read' commands if falling back, by default 8
+
+        Raises
+        ------
+        OPReadException
+            If falling back to 'op read' and a reference can't be resolved
+        OPNotFoundException
+            If the 1Password command can't be found
+
+        Returns
+        -------
+        Dict[str, str]
+            A mapping of each reference to its value
+        """
+        # de-duplicate, preserving order
+        references = list(dict.fromkeys(references))
+        values: Optional[Dict[str, str]] = None
+        if len(references) > 1:
+            try:
+                values = self._read_references_injected(references)
+            except OPInjectException as e:
+                self.logger.debug(
+                    f"'op inject' failed, falling back to 'op read': {e.err_output}")
+
+        if values is None:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                results = list(pool.map(_with_caller_deadline(self._read), references))
+            values = dict(zip(references, results))
+        return values
+
+    def _read_references_injected(self, references: List[str]) -> Optional[Dict[str, str]]:
+        # Render a template where each reference is preceded by a numbered marker,
+        # then split the rendered output on those markers. The marker is derived from
+        # the references so the same batch always produces the same template
+        digest = hashlib.sha256("\n".join(references).encode("utf-8")).hexdigest()
+        boundary = f"--pyop-{digest[:32]}--"
+        template_parts = []
+        for i, ref in enumerate(references):
+            template_parts.append(f"{boundary}{i}{boundary}{{{{ {ref} }}}}")
+        template_parts.append(f"{boundary}end{boundary}")
+        template = "".join(template_parts)
+
+        output = self._inject(template)
+        marker_pattern = re.compile(re.escape(boundary) + r"(\d+|end)" + re.escape(boundary))
+        # ['', '0', value_0, '1', value_1, ..., 'end', trailing]
+        parts = marker_pattern.split(output)
+        markers = parts[1::2]
+        expected_markers = [str(i) for i in range(len(references))] + ["end"]
+        if parts[0] or markers != expected_markers:
+            # a secret value must have contained something that looked like a marker,
+            # so the output can't be reliably split
+            self.logger.debug("Unable to split 'op inject' output")
+            return None
+        values = dict(zip(references, parts[2::2]))
+        return values
+
     def item_get_totp(self, item_identifier: str, vault=None) -> OPTOTPItem:
         """
         Get a TOTP code from the item specified by name or UUID.
@@ -199,6 +702,43 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
         totp = OPTOTPItem(output)
         return totp
 
+    def totp_provider(self, item_identifier: str, vault=None) -> OPTOTPProvider:
+        """
+        Get a provider that generates TOTP codes for the item specified by name or UUID
+        locally, without running 'op' for each code
+
+        The item's TOTP secret is fetched once, with item_get_totp(), and codes are then
+        computed in-process, according to the secret's otpauth:// URI parameters, if any.
+        Call OPTOTPProvider.refresh() to fetch the secret again, e.g., if a code is
+        rejected
+
+        Parameters
+        ----------
+        item_identifier: str
+            Name or ID of the item to look up
+        vault: str, optional
+            The name or ID of a vault to override the object's default vault
+
+        Raises
+        ------
+        OPItemGetException
+            If the lookup fails for any reason during command execution
+        OPInvalidTOTPException
+            If the item's TOTP secret isn't a valid base32 secret or otpauth:// URI
+        OPNotFoundException
+            If the 1Password command can't be found
+
+        Returns
+        -------
+        totp_provider: OPTOTPProvider
+            A provider of TOTP codes for the item
+        """
+        def _fetch():
+            return self.item_get_totp(item_identifier, vault=vault)
+
+        provider = OPTOTPProvider(_fetch)
+        return provider
+
     def user_get(self, user_name_or_id: str) -> OPUser:
         """
         Return the details for the user specified by name or UUID.
@@ -219,7 +759,7 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
         user: OPuser
             An object representing the details of the requested user
         """
-        user_json = super()._user_get(user_name_or_id)
+        user_json = super()._user_get(user_name_or_id, decode=None)
         user = OPUser(user_json)
         return user
 
@@ -249,7 +789,7 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
         user_list: Union[str, OPUserDescriptorList]
 
         user_list = self._user_list(
-            group_name_or_id=group_name_or_id, vault=vault_name_or_id)
+            group_name_or_id=group_name_or_id, vault=vault_name_or_id, decode=None)
         user_list = OPUserDescriptorList(user_list)
         return user_list
 
@@ -274,7 +814,7 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
         vault: OPVault
             An object representing the details of the requested vault
         """
-        vault_json = super()._vault_get(vault_name_or_id, decode="utf-8")
+        vault_json = super()._vault_get(vault_name_or_id, decode=None)
         vault = OPVault(vault_json)
         return vault
 
@@ -302,7 +842,7 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
             An object representing a list of vault descriptors
         """
         vault_list_json = super()._vault_list(
-            group_name_or_id=group_name_or_id, user_name_or_id=user_name_or_id)
+            group_name_or_id=group_name_or_id, user_name_or_id=user_name_or_id, decode=None)
         vault_list = OPVaultDescriptorList(vault_list_json)
         return vault_list
 
@@ -327,7 +867,7 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
         user: OPGroup
             An object representing the details of the requested group
         """
-        group_json = super()._group_get(group_name_or_id, decode="utf-8")
+        group_json = super()._group_get(group_name_or_id, decode=None)
         group = OPGroup(group_json)
         return group
 
@@ -356,7 +896,7 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
         """
         group_list: Union[str, OPGroupDescriptorList]
         group_list = self._group_list(
-            user_name_or_id=user_name_or_id, vault=vault)
+            user_name_or_id=user_name_or_id, vault=vault, decode=None)
         group_list = OPGroupDescriptorList(group_list)
         return group_list
 
@@ -473,6 +1013,99 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
         file_name, document bytes: Tuple[str, bytes]
             A tuple consisting of the filename and bytes of the specified document
         """
+        # both the item (for its file name) and the document bytes are needed, so
+        # download the document while the item is looked up, rather than afterward
+        cancelled = threading.Event()
+
+        def _download() -> Optional[bytes]:
+            chunks = self._document_get_stream(document_name_or_id, vault=vault,
+                                               include_archive=include_archive)
+            document_chunks = []
+            try:
+                for chunk in chunks:
+                    if cancelled.is_set():
+                        return None
+                    document_chunks.append(chunk)
+            finally:
+                # kills 'op' if the download was abandoned
+                chunks.close()
+            return b"".join(document_chunks)
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            document_future = pool.submit(_with_caller_deadline(_download))
+            try:
+                try:
+                    file_name = self.item_get_filename(
+                        document_name_or_id, vault=vault, include_archive=include_archive, relaxed_validation=relaxed_validation)
+                except AttributeError as ae:
+                    raise OPInvalidDocumentException(
+                        "Item has no 'fileName' attribute") from ae
+                except OPCmdFailedException as ocfe:
+                    raise OPDocumentGetException.from_opexception(ocfe) from ocfe
+            except BaseException:
+                # the document would just be discarded, so don't wait for all of it
+                cancelled.set()
+                raise
+
+            try:
+                document_bytes = document_future.result()
+            except OPCmdFailedException as ocfe:
+                raise OPDocumentGetException.from_opexception(ocfe) from ocfe
+
+        return (file_name, document_bytes)
+
+    def document_get_to(self,
+                        document_name_or_id: str,
+                        dest: DocumentDestination,
+                        vault: Optional[str] = None,
+                        include_archive: bool = False,
+                        relaxed_validation: bool = False,
+                        digest_algorithm: Optional[str] = "sha256") -> OPDocumentDownload:
+        """
+        Download a document object from a 1Password vault by name or UUID, streaming its
+        bytes to a file or file-like object rather than holding them in memory
+
+        The document is written in chunks as 'op' outputs it, so memory use is the same
+        regardless of the document's size. A digest of its bytes is computed as they're
+        written
+
+        Parameters
+        ----------
+        document_name_or_id : str
+            The item to look up
+        dest : Union[str, os.PathLike, BinaryIO]
+            A path to write the document to, or a writable binary file-like object. A path
+            is only created or replaced once the entire document has been downloaded, and
+            the file is readable only by the current user
+        vault: str, optional
+            The name or ID of a vault to override the object's default vault
+        include_archive: bool, optional
+            Include items in the Archive, by default False
+        relaxed_validation: bool, optional
+            Whether to enable relaxed item validation for this query, in order to parse non-conformant data
+            by default False
+        digest_algorithm: str, optional
+            Name of the hashlib algorithm to compute the document's digest with, or None
+            to skip computing a digest, by default "sha256"
+
+        Raises
+        ------
+        OPInvalidDocumentException
+            If the retrieved item isn't a document object or lacks a documents expected attributes
+        OPDocumentGetException
+            If document lookup fails for any reason during command execution. If 'dest' is
+            a file-like object, part of the document may already have been written to it
+        OPNotFoundException
+            If the 1Password command can't be found
+        ValueError
+            If 'digest_algorithm' isn't a known algorithm
+
+        Returns
+        -------
+        OPDocumentDownload
+            The document's file name, size in bytes, and hex digest
+        """
+        hasher = _new_hasher(digest_algorithm)
         try:
             file_name = self.item_get_filename(
                 document_name_or_id, vault=vault, include_archive=include_archive, relaxed_validation=relaxed_validation)
@@ -482,18 +1115,121 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
         except OPCmdFailedException as ocfe:
             raise OPDocumentGetException.from_opexception(ocfe) from ocfe
 
-        try:
-            document_bytes = super()._document_get(document_name_or_id,
-                                                   vault=vault, include_archive=include_archive)
-        except OPCmdFailedException as ocfe:
-            raise OPDocumentGetException.from_opexception(ocfe) from ocfe
+        chunks = super()._document_get_stream(document_name_or_id,
+                                              vault=vault, include_archive=include_archive)
+        size = _write_document_chunks(chunks, dest, hasher)
+        digest = hasher.hexdigest() if hasher is not None else None
+        return OPDocumentDownload(file_name, size, digest)
+
+    def document_get_many(self,
+                          dest_dir: str,
+                          vault: Optional[str] = None,
+                          include_archive: bool = False,
+                          relaxed_validation: bool = False,
+                          max_workers: int = 8,
+                          digest_algorithm: str = "sha256") -> OPDocumentManifest:
+        """
+        Back up every document in a vault to a directory, downloading up to 'max_workers'
+        documents at once
 
-        return (file_name, document_bytes)
+        Each document is streamed to '<dest_dir>/<unique ID>/<file name>', the same as
+        with document_get_to(), so memory use doesn't depend on document sizes, and files
+        are only replaced once completely downloaded. A manifest of the backup is saved to
+        the directory. A document is skipped rather than downloaded again if its file is
+        already present, with the size 1Password reports and the digest recorded in the
+        manifest
+
+        A document that fails to download, including one whose download times out, or
+        whose file can't be written, doesn't stop the rest from being downloaded. Instead,
+        the failure is recorded in the returned manifest
+
+        Parameters
+        ----------
+        dest_dir : str
+            Directory to back documents up to. It's created if necessary
+        vault : str, optional
+            The name or ID of a vault to override the object's default vault
+        include_archive : bool, optional
+            Include documents in the Archive, by default False
+        relaxed_validation: bool, optional
+            Whether to enable relaxed item validation for this query, in order to parse non-conformant data
+            by default False
+        max_workers : int, optional
+            Maximum number of documents to download at once, by default 8
+        digest_algorithm : str, optional
+            Name of the hashlib algorithm used for document digests, by default "sha256"
+
+        Raises
+        ------
+        OPItemListException
+            If listing the vault's documents fails
+        OPNotFoundException
+            If the 1Password command can't be found
+        ValueError
+            If 'digest_algorithm' isn't a known algorithm
+
+        Returns
+        -------
+        OPDocumentManifest
+            Whether each document was downloaded, skipped, or failed, along with its
+            path relative to 'dest_dir', size, and digest
+        """
+        _new_hasher(digest_algorithm)
+        os.makedirs(dest_dir, exist_ok=True)
+        stored = OPDocumentManifest.load_stored(dest_dir, digest_algorithm)
+        documents = self.item_list(categories=["Document"],
+                                   include_archive=include_archive,
+                                   vault=vault)
+
+        def _get_one(descriptor: OPAbstractItemDescriptor) -> OPDocumentManifestEntry:
+            unique_id = descriptor.unique_id
+            try:
+                item = self.item_get(unique_id, vault=vault, include_archive=include_archive,
+                                     relaxed_validation=relaxed_validation)
+                if not isinstance(item, OPDocumentItem):
+                    raise OPInvalidDocumentException(
+                        "Item has no 'fileName' attribute")
+                if not item.files:
+                    raise OPInvalidDocumentException("Document item has no files")
+                file_name = item.file_name
+                size = item.files[0].size
+                path = _document_path(unique_id, file_name)
+                full_path = os.path.join(dest_dir, path)
+
+                stored_entry = stored.get(unique_id, {})
+                if stored_entry.get("path") == path and \
+                        _file_matches(full_path, size, stored_entry.get("digest"), digest_algorithm):
+                    return OPDocumentManifestEntry(unique_id, descriptor.title, descriptor.version,
+                                                   DOCUMENT_SKIPPED, file_name=file_name, path=path,
+                                                   size=size, digest=stored_entry["digest"])
+
+                os.makedirs(os.path.dirname(full_path), exist_ok=True)
+                hasher = _new_hasher(digest_algorithm)
+                chunks = self._document_get_stream(unique_id, vault=vault,
+                                                   include_archive=include_archive)
+                size = _write_document_chunks(chunks, full_path, hasher)
+            except (OPCmdFailedException, OPCmdTimeoutException, OPInvalidItemException, OSError) as e:
+                return OPDocumentManifestEntry(unique_id, descriptor.title, descriptor.version,
+                                               DOCUMENT_FAILED, error=e)
+            return OPDocumentManifestEntry(unique_id, descriptor.title, descriptor.version,
+                                           DOCUMENT_DOWNLOADED, file_name=file_name, path=path,
+                                           size=size, digest=hasher.hexdigest())
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            # executor.map() yields results in input order
+            entries = list(pool.map(_with_caller_deadline(_get_one), documents))
+
+        manifest = OPDocumentManifest(dest_dir, digest_algorithm, entries)
+        manifest.save(stored)
+        return manifest
 
     def document_delete(self, document_identifier: str, vault: Optional[str] = None, archive: bool = False, relaxed_validation: bool = False) -> str:
         """
         Delete a document object based on document name or unique identifier
 
+        A name is first looked up with 'op item get' to find the document's unique ID.
+        A unique ID is passed straight to 'op document delete'
+
         Parameters
         ----------
         document_identifier : str
@@ -525,20 +1261,25 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
         else:
             generic_item_class = _OPGenericItem
 
-        try:
-            output = super()._item_get(document_identifier, vault=vault)
-            item = generic_item_class(output)
-        except OPItemGetException as e:
-            raise OPDocumentDeleteException.from_opexception(e)
-        # we want to return the explicit ID even if we were
-        # given an document name or other identifier
-        # that way the caller knows exactly what got deleted
-        # can match it up with what they expected to be deleted, if desired
-        document_id = item.unique_id
+        if is_uuid(document_identifier):
+            # 'op' looks unique IDs up directly, so there's nothing to resolve
+            document_id = document_identifier
+        else:
+            try:
+                output = super()._item_get(document_identifier, vault=vault)
+                item = generic_item_class(output)
+            except OPItemGetException as e:
+                raise OPDocumentDeleteException.from_opexception(e)
+            # we want to return the explicit ID even if we were
+            # given an document name or other identifier
+            # that way the caller knows exactly what got deleted
+            # can match it up with what they expected to be deleted, if desired
+            document_id = item.unique_id
 
         # 'op document delete' doesn't have any stdout, so we're not
         # capturing any here
         self._document_delete(document_id, vault=vault, archive=archive)
+        self._evict_cached_item(document_id, document_identifier)
 
         return document_id
 
@@ -579,7 +1320,7 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
             An object representing a list of user descriptors
         """
         item_list_json = self._item_list(
-            categories, include_archive, tags, vault)
+            categories, include_archive, tags, vault, decode=None)
         item_list = OPItemList(item_list_json, generic_okay=generic_okay)
 
         if title_glob:
@@ -590,6 +1331,138 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
             item_list = OPItemList(_list)
         return item_list
 
+    def item_query(self,
+                   query: OPItemQuery,
+                   generic_okay=True,
+                   max_workers: int = 8) -> OPItemList:
+        """
+        Return a list of the items matching a query
+
+        Criteria 'op item list' supports (categories, tags, vault, and including the
+        Archive) are passed to 'op', and the rest are checked against each item's
+        descriptor dictionary before any descriptor objects are created. If the query
+        has more than one vault, the vaults are listed concurrently
+
+        Parameters
+        ----------
+        query : OPItemQuery
+            The query to run
+        generic_okay : bool, optional
+            Instantiate unknown item types as _OPGenericItem rather than raise OPUnknownItemException
+        max_workers : int, optional
+            Maximum number of vaults to list at once, by default 8
+
+        Raises
+        ------
+        OPItemListException
+            If listing any of the vaults fails
+        OPUnknownItemTypeException
+            If a matching item descriptor isn't a known type and generic_okay is False
+        OPNotFoundException
+            If the 1Password command can't be found
+
+        Returns
+        -------
+        OPItemList
+            The matching items, from all of the query's vaults
+        """
+        list_args = query.item_list_args()
+
+        def _list_vault(vault):
+            output = self._item_list(vault=vault, decode=None, **list_args)
+            return [item_dict for item_dict in safe_unjson(output) if query.matches(item_dict)]
+
+        vaults = query.vaults if query.vaults else [None]
+        if len(vaults) == 1:
+            results = [_list_vault(vaults[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                results = list(pool.map(_with_caller_deadline(_list_vault), vaults))
+
+        # the same vault may have been given by both name and ID
+        matching: Dict[str, Dict] = {}
+        for item_dicts in results:
+            for item_dict in item_dicts:
+                matching.setdefault(item_dict["id"], item_dict)
+        item_list = OPItemList(list(matching.values()),
+                               generic_okay=generic_okay)
+        return item_list
+
+    def iter_item_list(self,
+                       categories=[],
+                       include_archive=False,
+                       tags=[],
+                       title_glob=None,
+                       updated_since: Optional[datetime.datetime] = None,
+                       vault=None,
+                       generic_okay=True) -> Iterator[OPAbstractItemDescriptor]:
+        """
+        Iterate over the items in an account, yielding each item descriptor as
+        'op item list' outputs it
+
+        Unlike item_list(), the list is never held in memory all at once: output is parsed
+        as it's read from 'op', and each item is filtered before its descriptor is
+        created. Memory use stays flat however many items the account has. Items are
+        yielded in the order 'op' returns them, which is not sorted, and the response
+        cache isn't used
+
+        NOTE: If this object was created with exec_mode=EXEC_MODE_POOLED, 'op item list'
+        still runs in the calling thread, and doesn't count toward the pool size's limit on
+        concurrent 'op' processes. Holding a pool slot for as long as the caller iterates
+        would deadlock callers that run other commands, e.g., item_get(), while iterating
+
+        Parameters
+        ----------
+        categories: List[str], optional
+            A list of category names to restrict list to
+        include_archive: bool, optional
+            Include items in the Archive in the list
+        tags: List[str], optional
+            A list of tags to restrict list to
+        title_glob: str, optional
+            a shell-style glob pattern to match against item titles. If provided,
+            only matching items are yielded
+            by default None
+        updated_since: datetime.datetime, optional
+            If provided, only items updated at or after this time are yielded. A naive
+            datetime is taken to be UTC
+            by default None
+        vault: str, optional
+            The name or ID of a vault to override the object's default vault
+        generic_okay: bool, optional
+            Instantiate unknown item types as _OPGenericItem rather than raise OPUnknownItemException
+
+        Raises
+        ------
+        OPItemListException
+            If the item list operation fails for any reason during command execution.
+            Since 'op' output is consumed as it's produced, this may be raised after
+            some items have already been yielded
+        OPUnknownItemTypeException
+            If an item descriptor isn't a known type and generic_okay is False
+        OPNotFoundException
+            If the 1Password command can't be found
+
+        Yields
+        ------
+        OPAbstractItemDescriptor
+            Each matching item descriptor
+        """
+        if updated_since is not None and updated_since.tzinfo is None:
+            updated_since = updated_since.replace(tzinfo=datetime.timezone.utc)
+
+        # categories and tags are filtered by 'op' itself
+        chunks = self._item_list_stream(
+            categories, include_archive, tags, vault)
+        for item_dict in iter_json_array(chunks):
+            if title_glob and not fnmatch.fnmatch(item_dict.get("title", ""), title_glob):
+                continue
+            if updated_since is not None:
+                updated_at = fromisoformat_z(item_dict["updated_at"])
+                if updated_at < updated_since:
+                    continue
+            yield OPItemDescriptorFactory.item_descriptor(item_dict, generic_okay=generic_okay)
+
     # TODO: Item creation is hard to test in an automated way since it results in changed
     #   state. There are operations during item creation that expect state to change from
     #   before to after item creation
@@ -641,6 +1514,9 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
         result_str = super()._item_create(
             new_item, password_recipe=password_recipe, vault=vault)
         op_item = OPItemFactory.op_item(result_str)
+        if self._item_cache is not None:
+            # a cached lookup by this title may now be ambiguous
+            self._item_cache.invalidate(op_item.title)
         return op_item
 
     def login_item_create(self,
@@ -730,6 +1606,9 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
             is more than one item that matches, OPItemDeleteException will be raised. Check the
             error message in OPItemDeleteException.err_output for details
 
+            Any other identifier is first looked up with 'op item get' to find the item's
+            unique ID. A unique ID is passed straight to 'op item delete'
+
         Raises
         ------
         OPItemDeleteException
@@ -751,20 +1630,25 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
         else:
             generic_item_class = _OPGenericItem
 
-        try:
-            output = super()._item_get(item_identifier, vault=vault)
-            item = generic_item_class(output)
-        except OPItemGetException as e:
-            raise OPItemDeleteException.from_opexception(e)
-        # we want to return the explicit ID even if we were
-        # given an item title or other identifier
-        # that way the caller knows exactly what got deleted
-        # can match it up with what they expected to be deleted, if desired
-        item_id = item.unique_id
+        if is_uuid(item_identifier):
+            # 'op' looks unique IDs up directly, so there's nothing to resolve
+            item_id = item_identifier
+        else:
+            try:
+                output = super()._item_get(item_identifier, vault=vault)
+                item = generic_item_class(output)
+            except OPItemGetException as e:
+                raise OPItemDeleteException.from_opexception(e)
+            # we want to return the explicit ID even if we were
+            # given an item title or other identifier
+            # that way the caller knows exactly what got deleted
+            # can match it up with what they expected to be deleted, if desired
+            item_id = item.unique_id
 
         # 'op item delete' doesn't have any stdout, so we're not
         # capturing any here
         self._item_delete(item_id, vault=vault, archive=archive)
+        self._evict_cached_item(item_id, item_identifier)
 
         return item_id
 
@@ -851,9 +1735,22 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
                 raise OPItemDeleteMultipleException.from_opexception(
                     ope, deleted_items)
             deleted_items.extend(batch)
+            for deleted in batch:
+                self._evict_cached_item(deleted.unique_id)
 
         return deleted_items
 
+    def _evict_cached_item(self, *item_identifiers: str):
+        if self._item_cache is not None:
+            for item_identifier in item_identifiers:
+                self._item_cache.invalidate(item_identifier)
+
+    @staticmethod
+    def _is_generic_item(item: Union[OPAbstractItem, OPCompactItem]) -> bool:
+        if isinstance(item, OPCompactItem):
+            return item.generic
+        return isinstance(item, _OPGenericItem)
+
     def signed_in_accounts(self, decode="utf-8") -> OPAccountList:
         account_list_json = super()._signed_in_accounts(self.op_path, decode=decode)
         account_list = OPAccountList(account_list_json)
@@ -930,7 +1827,5 @@ class OP(_OPCommandInterface, PyOPAboutMixin):
     def _sanitize(self):  # pragma: no coverage
         self._token = None
         if self._sess_var:
-            try:
-                env.pop(self._sess_var)
-            except KeyError:
-                pass
+            with _ENVIRON_LOCK:
+                env.pop(self._sess_var, None)
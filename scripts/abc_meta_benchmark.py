@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark descriptor list construction with and without ABCMetaDict's cached
+enforced-method verdicts
+
+Builds an OPItemList of 'count' item descriptors, replicated from a mock-op
+'op item list' response, first checking enforced methods on every instantiation
+as ABCMetaDict used to, then using the cached per-class verdict
+"""
+import copy
+import os
+import sys
+import timeit
+from argparse import ArgumentParser, Namespace
+
+# isort: split
+parent_path = os.path.dirname(
+    os.path.dirname(
+        os.path.abspath(__file__)
+    )
+)
+
+if parent_path not in sys.path:
+    sys.path.append(parent_path)
+
+from pyonepassword._abc_meta import (  # noqa: E402
+    ABCMetaDict,
+    _enforced_methods
+)
+from pyonepassword.api.object_types import OPItemList  # noqa: E402
+from pyonepassword.json import safe_unjson  # noqa: E402
+
+DEFAULT_ITEM_LIST_RESPONSE = os.path.join(parent_path, "tests", "config", "mock-op",
+                                          "responses", "item-list-vault-test-data", "output")
+
+
+def abc_meta_benchmark_parse_args() -> Namespace:
+    parser = ArgumentParser()
+    parser.add_argument("--count", type=int, default=10_000,
+                        help="Number of item descriptors per list")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="Number of lists to build per measurement")
+    parser.add_argument("--item-list-response", default=DEFAULT_ITEM_LIST_RESPONSE,
+                        help="'op item list' JSON output to replicate descriptors from")
+    parsed = parser.parse_args()
+    return parsed
+
+
+def make_descriptor_dicts(response_path, count):
+    with open(response_path, "rb") as f:
+        template = safe_unjson(f.read())
+    descriptor_dicts = []
+    for i in range(count):
+        descriptor_dict = copy.deepcopy(template[i % len(template)])
+        descriptor_dict["id"] = f"{descriptor_dict['id']}{i}"
+        descriptor_dicts.append(descriptor_dict)
+    return descriptor_dicts
+
+
+def _uncached_call(cls, *args, **kwargs):
+    # ABCMetaDict.__call__() before verdicts were cached
+    enforced = _enforced_methods(cls)
+    if enforced:
+        raise TypeError(f"Can't instantiate abstract class {cls.__name__}")
+    return super(ABCMetaDict, cls).__call__(*args, **kwargs)
+
+
+def measure(descriptor_dicts, repeat):
+    seconds = min(timeit.repeat(lambda: OPItemList(descriptor_dicts),
+                                number=1, repeat=repeat))
+    return seconds
+
+
+def main():
+    args = abc_meta_benchmark_parse_args()
+    descriptor_dicts = make_descriptor_dicts(
+        args.item_list_response, args.count)
+
+    cached_call = ABCMetaDict.__call__
+    ABCMetaDict.__call__ = _uncached_call
+    try:
+        before = measure(descriptor_dicts, args.repeat)
+    finally:
+        ABCMetaDict.__call__ = cached_call
+    after = measure(descriptor_dicts, args.repeat)
+
+    print(f"{args.count} item descriptors per list")
+    for label, seconds in [("uncached", before), ("cached", after)]:
+        print(f"{label:<9} {seconds:>8.4f}s {args.count / seconds:>12.0f} descriptors/s")
+    print(f"speedup   {before / after:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
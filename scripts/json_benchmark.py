@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of JSON decoding over the mock-op response corpus
+
+For each available JSON codec, time decoding every JSON response
+- after decoding it to str first, as pyonepassword used to
+- directly from the bytes 'op' wrote to stdout
+"""
+import os
+import sys
+import timeit
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+
+# isort: split
+parent_path = os.path.dirname(
+    os.path.dirname(
+        os.path.abspath(__file__)
+    )
+)
+
+if parent_path not in sys.path:
+    sys.path.append(parent_path)
+
+from pyonepassword.api.parsing import (  # noqa: E402
+    available_json_codecs,
+    set_json_codec
+)
+from pyonepassword.json import safe_unjson  # noqa: E402
+
+DEFAULT_RESPONSE_DIR = Path(parent_path, "tests", "config",
+                            "mock-op", "responses")
+
+
+def json_benchmark_parse_args() -> Namespace:
+    parser = ArgumentParser()
+    parser.add_argument("--response-dir", default=str(DEFAULT_RESPONSE_DIR),
+                        help="Directory of mock-op responses")
+    parser.add_argument("--iterations", type=int, default=20,
+                        help="Number of passes over the corpus per measurement")
+    parsed = parser.parse_args()
+    return parsed
+
+
+def load_corpus(response_dir):
+    corpus = []
+    for dirpath, _, filenames in os.walk(response_dir):
+        if "output" not in filenames:
+            continue
+        with open(os.path.join(dirpath, "output"), "rb") as f:
+            output = f.read()
+        try:
+            safe_unjson(output)
+        except ValueError:
+            # not every response is JSON
+            continue
+        corpus.append(output)
+    return corpus
+
+
+def decode_str(corpus):
+    for output in corpus:
+        safe_unjson(output.decode("utf-8"))
+
+
+def decode_bytes(corpus):
+    for output in corpus:
+        safe_unjson(output)
+
+
+def main():
+    args = json_benchmark_parse_args()
+    corpus = load_corpus(args.response_dir)
+    total_bytes = sum([len(output) for output in corpus])
+    print(f"{len(corpus)} JSON responses, {total_bytes} bytes")
+    print(f"{'codec':<8} {'path':<6} {'seconds':>10} {'MB/s':>8}")
+    for codec_name in available_json_codecs():
+        set_json_codec(codec_name)
+        for path, func in [("str", decode_str), ("bytes", decode_bytes)]:
+            seconds = min(timeit.repeat(lambda: func(corpus),
+                                        number=args.iterations, repeat=3))
+            mb_per_sec = (total_bytes * args.iterations / seconds) / 1e6
+            print(f"{codec_name:<8} {path:<6} {seconds:>10.4f} {mb_per_sec:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
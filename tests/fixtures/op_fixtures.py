@@ -5,7 +5,13 @@ from pathlib import Path
 
 from pytest import fixture
 
-from pyonepassword import OP, logging
+from pyonepassword import OP, AsyncOP, logging
+from pyonepassword.api.cache import (
+    OPItemCache,
+    OPResponseCache,
+    clear_facts_cache
+)
+from pyonepassword.api.constants import EXEC_MODE_POOLED
 from pyonepassword.api.exceptions import OPCmdFailedException
 
 from .expected_account_data import ExpectedAccountData
@@ -54,6 +60,8 @@ from .valid_op_cli_config import (
 TEST_DATA_VAULT = "Test Data"
 OP_MASTER_PASSWORD = "made-up-password"
 ACCOUNT_ID = "5GHHPJK5HZC5BAT7WDUXW57G44"
+# default per-command timeout for OP objects that have one, long enough for sign-in
+OP_TIMEOUT = 3.0
 
 
 @fixture(autouse=True, scope='function')
@@ -69,6 +77,18 @@ def save_restore_env():
     os.environ.update(orig_env)
 
 
+@fixture(autouse=True, scope="function")
+def fresh_facts_cache():
+    """
+    Facts such as 'op --version' are cached process-wide, keyed by the 'op' binary.
+    Tests swap mock-op response directories without changing the binary, so each test
+    needs to start with an empty facts cache
+    """
+    clear_facts_cache()
+    yield
+    clear_facts_cache()
+
+
 @fixture(autouse=True, scope="function")
 def temp_home():
     """
@@ -180,18 +200,26 @@ def setup_stateful_item_delete_multiple_title_glob():
     # temp_dir will get cleaned up once we return
 
 
-def _get_signed_in_op(account_id, default_vault=None):
+def _get_signed_in_op(account_id, default_vault=None, **op_kwargs):
     logger = logging.console_logger("pytest", logging.DEBUG)
     _setup_normal_env()
     try:
         op = OP(vault=default_vault, account=account_id,
-                password=OP_MASTER_PASSWORD, op_path='mock-op', logger=logger)
+                password=OP_MASTER_PASSWORD, op_path='mock-op', logger=logger, **op_kwargs)
     except OPCmdFailedException as e:
         print(f"OP() failed: {e.err_output}")
         raise e
     return op
 
 
+def _get_signed_in_async_op(account_id, default_vault=None, **op_kwargs):
+    logger = logging.console_logger("pytest", logging.DEBUG)
+    _setup_normal_env()
+    op = AsyncOP(vault=default_vault, account=account_id,
+                 password=OP_MASTER_PASSWORD, op_path='mock-op', logger=logger, **op_kwargs)
+    return op
+
+
 @fixture
 def setup_normal_op_env():
     _setup_normal_env()
@@ -244,6 +272,59 @@ def signed_in_op():
     return op
 
 
+@fixture
+def signed_in_async_op():
+    op = _get_signed_in_async_op(ACCOUNT_ID, max_concurrency=2)
+    return op
+
+
+@fixture
+def signed_in_op_pooled():
+    op = _get_signed_in_op(ACCOUNT_ID, exec_mode=EXEC_MODE_POOLED, pool_size=2)
+    return op
+
+
+@fixture
+def signed_in_op_timeout():
+    op = _get_signed_in_op(ACCOUNT_ID, timeout=OP_TIMEOUT)
+    return op
+
+
+@fixture
+def signed_in_async_op_timeout():
+    op = _get_signed_in_async_op(
+        ACCOUNT_ID, max_concurrency=2, timeout=OP_TIMEOUT)
+    return op
+
+
+@fixture
+def signed_in_op_item_cache():
+    op = _get_signed_in_op(ACCOUNT_ID, item_cache=OPItemCache())
+    return op
+
+
+@fixture
+def signed_in_op_response_cache(tmp_path):
+    op = _get_signed_in_op(
+        ACCOUNT_ID, response_cache=OPResponseCache(str(tmp_path), allow_plaintext=True))
+    return op
+
+
+@fixture
+def signed_in_op_item_and_response_cache(tmp_path):
+    op = _get_signed_in_op(
+        ACCOUNT_ID, item_cache=OPItemCache(), response_cache=OPResponseCache(str(tmp_path), allow_plaintext=True))
+    return op
+
+
+@fixture
+def signed_in_op_response_cache_2(tmp_path):
+    # a second, independent OP object sharing the same cache directory
+    op = _get_signed_in_op(
+        ACCOUNT_ID, response_cache=OPResponseCache(str(tmp_path), allow_plaintext=True))
+    return op
+
+
 @fixture
 def expected_data():
     data = ExpectedData()
@@ -5,6 +5,7 @@ from typing import Dict, Union
 
 import pytest
 
+from pyonepassword._abc_meta import enforcedmethod
 from pyonepassword.op_items._item_descriptor_base import (
     OPAbstractItemDescriptor
 )
@@ -63,3 +64,61 @@ def test_abc_meta_03(valid_data: ValidData):
 
     # No error/exception should be raised, since enforced methods have been implemented
     OPConcreteItem(item_dict)
+
+
+def test_abc_meta_04(valid_data: ValidData):
+    """
+    Test:
+      - instantiating a concrete subclass, then removing its implementation of the enforced method
+      - restoring the implementation
+
+    Verify:
+        - The first instantiation succeeds
+        - The cached verdict is invalidated when the class is modified, and TypeError is raised
+        - Instantiation succeeds again after the method is restored
+    """
+    class OPConcreteItem(OPAbstractItem):
+
+        def __init__(self, item_dict_or_json: Union[Dict, str]):
+            super().__init__(item_dict_or_json)
+
+    item_dict = valid_data.data_for_name(VALID_INPUT_ITEM)
+    init_method = OPConcreteItem.__init__
+    OPConcreteItem(item_dict)
+
+    del OPConcreteItem.__init__
+    with pytest.raises(TypeError):
+        OPConcreteItem(item_dict)
+
+    OPConcreteItem.__init__ = init_method
+    OPConcreteItem(item_dict)
+
+
+def test_abc_meta_05(valid_data: ValidData):
+    """
+    Test:
+      - instantiating a concrete subclass of a concrete subclass, after its base class
+        is modified to add a new enforced method
+
+    Verify:
+        - TypeError is raised, since a modification to a base class invalidates
+          cached verdicts for its subclasses
+    """
+    class OPConcreteItem(OPAbstractItem):
+
+        def __init__(self, item_dict_or_json: Union[Dict, str]):
+            super().__init__(item_dict_or_json)
+
+    class OPConcreteItemSubclass(OPConcreteItem):
+        pass
+
+    item_dict = valid_data.data_for_name(VALID_INPUT_ITEM)
+    OPConcreteItemSubclass(item_dict)
+
+    @enforcedmethod
+    def new_enforced_method(self):
+        pass  # pragma: no coverage
+
+    OPConcreteItem.new_enforced_method = new_enforced_method
+    with pytest.raises(TypeError):
+        OPConcreteItemSubclass(item_dict)
@@ -0,0 +1,154 @@
+"""
+Tests for the asyncio API, AsyncOP
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pyonepassword.api.exceptions import (
+    OPDocumentGetException,
+    OPInvalidDocumentException,
+    OPItemGetException
+)
+from pyonepassword.api.object_types import OPLoginItem
+
+from .test_support.util import digest
+
+if TYPE_CHECKING:
+    from pyonepassword import OP, AsyncOP
+
+# ensure HOME env variable is set, and there's a valid op config present
+pytestmark = pytest.mark.usefixtures("valid_op_cli_config_homedir")
+
+
+def test_async_item_get_01(signed_in_async_op: AsyncOP, expected_login_item_data):
+    """
+    Test:
+      - Getting an item via AsyncOP.item_get()
+
+    Verify:
+      - The item matches the expected login item data
+    """
+    item_name = "Example Login 1"
+    vault = "Test Data"
+    expected = expected_login_item_data.data_for_login(item_name)
+    result = asyncio.run(signed_in_async_op.item_get(item_name, vault=vault))
+    assert isinstance(result, OPLoginItem)
+    assert result.username == expected.username
+
+
+def test_async_item_get_02(signed_in_async_op: AsyncOP):
+    """
+    Test:
+      - Getting a nonexistent item via AsyncOP.item_get()
+
+    Verify:
+      - OPItemGetException is raised
+    """
+    with pytest.raises(OPItemGetException):
+        asyncio.run(signed_in_async_op.item_get("Invalid Item"))
+
+
+def test_async_item_get_03(signed_in_async_op: AsyncOP, signed_in_op: OP):
+    """
+    Test:
+      - Getting several items concurrently via asyncio.gather(), with more items than
+        the object's max concurrency
+
+    Verify:
+      - Each item matches the item returned by OP.item_get()
+    """
+    vault = "Test Data"
+    identifiers = ["Example Login 1", "Example Server",
+                   "Example Password", "Example Credit Card"]
+
+    async def _get_all():
+        coros = [signed_in_async_op.item_get(i, vault=vault)
+                 for i in identifiers]
+        return await asyncio.gather(*coros)
+
+    results = asyncio.run(_get_all())
+    for identifier, result in zip(identifiers, results):
+        assert result == signed_in_op.item_get(identifier, vault=vault)
+
+
+def test_async_item_list_01(signed_in_async_op: AsyncOP, signed_in_op: OP):
+    vault = "Test Data"
+    result = asyncio.run(signed_in_async_op.item_list(vault=vault))
+    assert result == signed_in_op.item_list(vault=vault)
+
+
+def test_async_vault_list_01(signed_in_async_op: AsyncOP, signed_in_op: OP):
+    result = asyncio.run(signed_in_async_op.vault_list())
+    assert result == signed_in_op.vault_list()
+
+
+def test_async_item_get_totp_01(signed_in_async_op: AsyncOP, signed_in_op: OP):
+    item_name = "Login With TOTP"
+    vault = "Test Data"
+    result = asyncio.run(
+        signed_in_async_op.item_get_totp(item_name, vault=vault))
+    assert result.totp == signed_in_op.item_get_totp(
+        item_name, vault=vault).totp
+
+
+def test_async_document_get_01(signed_in_async_op: AsyncOP, expected_document_data):
+    item_name = "Example Login 2 - 1200px-SpongeBob_SquarePants_character.svg.png.webp"
+    vault = "Test Data"
+    expected = expected_document_data.data_for_document(item_name)
+    filename, data = asyncio.run(
+        signed_in_async_op.document_get(item_name, vault=vault))
+    assert filename == expected.filename
+    assert digest(data) == expected.digest
+
+
+def test_async_document_get_02(signed_in_async_op: AsyncOP, expected_document_data):
+    """
+    Test:
+      - Getting a document whose item exists but whose bytes are missing
+
+    Verify:
+      - OPDocumentGetException is raised with the expected return code
+    """
+    item_name = "Example Attached File 2"
+    expected = expected_document_data.data_for_document(item_name)
+    with pytest.raises(OPDocumentGetException) as exc_info:
+        asyncio.run(signed_in_async_op.document_get(item_name))
+    assert exc_info.value.returncode == expected.returncode
+
+
+def test_async_document_get_03(signed_in_async_op: AsyncOP):
+    """
+    Test:
+      - Getting a document from an item that isn't a document
+
+    Verify:
+      - OPInvalidDocumentException is raised
+    """
+    with pytest.raises(OPInvalidDocumentException):
+        asyncio.run(signed_in_async_op.document_get("Not A Document"))
+
+
+def test_async_multiple_loops_01(signed_in_async_op: AsyncOP):
+    """
+    Test:
+      - Running more concurrent queries than max_concurrency in one event loop, then
+        again in a second event loop
+
+    Verify:
+      - Both loops' queries succeed, since each loop gets its own semaphore
+    """
+    item_name = "Example Login 1"
+    vault = "Test Data"
+
+    async def _get_several():
+        return await asyncio.gather(*[signed_in_async_op.item_get(item_name, vault=vault)
+                                      for _ in range(4)])
+
+    first = asyncio.run(_get_several())
+    second = asyncio.run(_get_several())
+    assert first == second
+    assert len(first) == 4
@@ -0,0 +1,141 @@
+"""
+Test cases for compact, read-only item objects
+"""
+from __future__ import annotations
+
+import copy
+import pickle
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from .fixtures.non_comformant_data import NonConformantData
+    from .fixtures.valid_data import ValidData
+
+from pyonepassword.api.exceptions import (
+    OPFieldNotFoundException,
+    OPItemFieldCollisionException,
+    OPSectionCollisionException
+)
+from pyonepassword.api.object_types import (
+    OPCompactItem,
+    OPCompactSection,
+    OPLoginItem
+)
+from pyonepassword.op_items._op_item_type_registry import OPItemFactory
+
+# ensure HOME env variable is set, and there's a valid op config present
+pytestmark = pytest.mark.usefixtures("valid_op_cli_config_homedir")
+
+SECTION_ID = "vh4wk7qyw46urc7wuwczzhpm7u"
+FIELD_ID = "ikr76mnggw767qwqoel624oqv4"
+
+
+def test_compact_item_01(valid_data: ValidData):
+    """
+    Verify:
+        - to_dict() reproduces the original item dictionary
+        - fields and sections look up the same values as a regular item
+    """
+    item_dict = valid_data.data_for_name("example-login-with-fields")
+    login_item = OPLoginItem(copy.deepcopy(item_dict))
+    compact = OPItemFactory.op_item(copy.deepcopy(item_dict), compact=True)
+
+    assert isinstance(compact, OPCompactItem)
+    assert compact.to_dict() == item_dict
+    assert compact.unique_id == login_item.unique_id
+    assert compact.vault.unique_id == login_item.vault.unique_id
+    assert compact.field_value_by_id(
+        FIELD_ID) == login_item.field_value_by_id(FIELD_ID)
+    assert compact.section_by_id(SECTION_ID).label == \
+        login_item.section_by_id(SECTION_ID).label
+
+
+def test_compact_item_02(valid_data: ValidData):
+    """
+    Verify:
+        - a section's fields are the same objects as the item's fields, not copies
+        - each field shares the item's section object
+        - labels and IDs are interned
+    """
+    item_dict = valid_data.data_for_name("example-login-with-fields")
+    compact_1 = OPCompactItem(copy.deepcopy(item_dict))
+    compact_2 = OPCompactItem(copy.deepcopy(item_dict))
+
+    section = compact_1.section_by_id(SECTION_ID)
+    assert isinstance(section, OPCompactSection)
+    assert section.fields
+    for field in section.fields:
+        assert field in compact_1.fields
+        assert field.section is section
+
+    field_1 = compact_1.field_by_id(FIELD_ID)
+    field_2 = compact_2.field_by_id(FIELD_ID)
+    assert field_1.label is field_2.label
+    assert field_1.field_id is field_2.field_id
+
+
+def test_compact_item_03(valid_data: ValidData):
+    """
+    Verify compact items are read-only, and can't grow new attributes
+    """
+    item_dict = valid_data.data_for_name("example-login-with-fields")
+    compact = OPCompactItem(item_dict)
+    with pytest.raises(AttributeError):
+        compact.title = "New title"
+    with pytest.raises(AttributeError):
+        compact.new_attribute = 1
+    with pytest.raises(AttributeError):
+        compact.field_by_id(FIELD_ID).value = "new value"
+
+
+def test_compact_item_04(valid_data: ValidData):
+    """
+    Verify:
+        - looking up a nonexistent field raises OPFieldNotFoundException
+        - compact items survive a pickle round trip
+    """
+    item_dict = valid_data.data_for_name("example-login-with-fields")
+    compact = OPCompactItem(item_dict)
+    with pytest.raises(OPFieldNotFoundException):
+        compact.field_by_id("no-such-field")
+
+    unpickled = pickle.loads(pickle.dumps(compact))
+    assert unpickled.to_dict() == compact.to_dict()
+
+
+@pytest.mark.parametrize("entry_name, exception",
+                         [("login-duplicate-section", OPSectionCollisionException),
+                          ("login-duplicate-field", OPItemFieldCollisionException)])
+def test_compact_item_05(entry_name, exception, non_conformant_data: NonConformantData):
+    """
+    Verify non-conformant data is rejected the same as for regular items,
+    unless relaxed validation is requested
+    """
+    item_json = non_conformant_data.data_for_name(entry_name)
+    with pytest.raises(exception):
+        OPItemFactory.op_item(item_json, compact=True)
+    compact = OPItemFactory.op_item(
+        item_json, relaxed_validation=True, compact=True)
+    assert isinstance(compact, OPCompactItem)
+
+
+def test_compact_item_06(valid_data: ValidData):
+    """
+    Verify case-insensitive lookups by label skip sections and fields that have no label,
+    rather than raising
+    """
+    item_dict = copy.deepcopy(
+        valid_data.data_for_name("example-login-with-fields"))
+    for section_dict in item_dict["sections"]:
+        section_dict.pop("label", None)
+    unlabeled_field = dict(item_dict["fields"][0])
+    unlabeled_field.pop("label", None)
+    unlabeled_field["id"] = "unlabeled-field"
+    item_dict["fields"].append(unlabeled_field)
+    compact = OPCompactItem(item_dict)
+    assert compact.sections_by_label("no such section", case_sensitive=False) == []
+    assert compact.fields_by_label("username", case_sensitive=False)
+    section = compact.section_by_id(SECTION_ID)
+    assert section.fields_by_label("no such field", case_sensitive=False) == []
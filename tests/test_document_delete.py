@@ -68,6 +68,19 @@ def test_document_delete_03(signed_in_op: OP, expected_document_data: ExpectedDo
     assert sha256_digest == expected.digest
 
 
+def test_document_delete_04(signed_in_op: OP, expected_document_data: ExpectedDocumentData):
+    """
+    Test deleting a document by its unique ID, which doesn't need to be looked up first
+    """
+    document_name = "delete this document"
+    vault = "Test Data"
+    expected = expected_document_data.data_for_document(document_name)
+    expected_document_id = expected.item_id
+    result = signed_in_op.document_delete(expected_document_id, vault=vault)
+    assert result == expected_document_id
+    assert "item get" not in signed_in_op.latency_stats()
+
+
 def test_document_delete_non_existent_01(signed_in_op: OP):
     """
     Test deleting a non-existent document
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import io
+import os
+import stat
+import time
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -7,11 +11,16 @@ if TYPE_CHECKING:
 
 import pytest
 
+from pyonepassword._py_op_commands import _OPCommandInterface
 from pyonepassword.api.exceptions import (
     OPDocumentGetException,
     OPInvalidDocumentException
 )
-from pyonepassword.api.object_types import OPDocumentFile, OPDocumentItem
+from pyonepassword.api.object_types import (
+    OPDocumentDownload,
+    OPDocumentFile,
+    OPDocumentItem
+)
 
 from .test_support.util import digest
 
@@ -61,3 +70,96 @@ def test_document_get03(signed_in_op: OP, expected_document_data):
 def test_document_get_wrong_item_type_01(signed_in_op: OP):
     with pytest.raises(OPInvalidDocumentException):
         signed_in_op.document_get("Not A Document")
+
+
+def test_document_get_wrong_item_type_02(signed_in_op: OP, monkeypatch):
+    """
+    Test:
+      - Getting a document whose item lookup fails while the document is downloading
+
+    Verify:
+      - The exception is raised without waiting for the download to finish
+      - The download is abandoned
+    """
+    closed = []
+
+    def _endless_stream(*args, **kwargs):
+        try:
+            while True:
+                time.sleep(0.01)
+                yield b"x" * 1024
+        finally:
+            closed.append(True)
+
+    monkeypatch.setattr(signed_in_op, "_document_get_stream", _endless_stream)
+    with pytest.raises(OPInvalidDocumentException):
+        signed_in_op.document_get("Not A Document")
+    assert closed
+
+
+def test_document_get_to_01(signed_in_op: OP, expected_document_data, tmp_path):
+    """
+    Stream a document to a path
+    """
+    item_name = "Example Login 2 - 1200px-SpongeBob_SquarePants_character.svg.png.webp"
+    vault = "Test Data"
+    expected = expected_document_data.data_for_document(item_name)
+    dest = tmp_path / "document.webp"
+    result = signed_in_op.document_get_to(item_name, dest, vault=vault)
+    assert isinstance(result, OPDocumentDownload)
+    assert result.file_name == expected.filename
+    assert result.size == expected.size
+    assert result.digest == expected.digest
+    assert digest(dest.read_bytes()) == expected.digest
+    assert stat.S_IMODE(os.stat(dest).st_mode) == 0o600
+    # nothing left behind but the document
+    assert os.listdir(tmp_path) == ["document.webp"]
+
+
+def test_document_get_to_02(signed_in_op: OP, expected_document_data):
+    """
+    Stream a document to a file-like object, without computing a digest
+    """
+    item_name = "Example Login 2 - 1200px-SpongeBob_SquarePants_character.svg.png.webp"
+    vault = "Test Data"
+    expected = expected_document_data.data_for_document(item_name)
+    dest = io.BytesIO()
+    result = signed_in_op.document_get_to(
+        item_name, dest, vault=vault, digest_algorithm=None)
+    assert result.digest is None
+    assert result.size == expected.size
+    assert digest(dest.getvalue()) == expected.digest
+
+
+def test_document_get_to_03(signed_in_op: OP, tmp_path):
+    """
+    A failed download doesn't create the destination file
+    """
+    dest = tmp_path / "document"
+    with pytest.raises(OPDocumentGetException):
+        signed_in_op.document_get_to("Invalid Document", dest)
+    with pytest.raises(OPInvalidDocumentException):
+        signed_in_op.document_get_to("Not A Document", dest)
+    assert os.listdir(tmp_path) == []
+
+
+def test_document_get_to_04(signed_in_op: OP):
+    with pytest.raises(ValueError):
+        signed_in_op.document_get_to("Invalid Document", io.BytesIO(),
+                                     digest_algorithm="no-such-algorithm")
+
+
+@pytest.mark.parametrize("chunks,expected",
+                         [([b"abc\n"], b"abc"),
+                          ([b"abc", b"\n"], b"abc"),
+                          ([b"ab", b"c\n", b""], b"abc"),
+                          ([b"a", b"b", b"\n", b"c"], b"ab\nc"),
+                          ([b"\n\n"], b"\n"),
+                          ([b"abc"], b"abc"),
+                          ([], b"")])
+def test_document_trim_stream_01(chunks, expected):
+    """
+    The erroneous trailing newline is dropped however the document is chunked
+    """
+    trimmed = b"".join(_OPCommandInterface._trim_document_stream(iter(chunks)))
+    assert trimmed == expected
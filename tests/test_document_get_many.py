@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pyonepassword import OP
+
+import pytest
+
+from pyonepassword.api.constants import (
+    DOCUMENT_DOWNLOADED,
+    DOCUMENT_FAILED,
+    DOCUMENT_SKIPPED
+)
+from pyonepassword.api.exceptions import OPItemGetException
+from pyonepassword.api.object_types import OPDocumentManifest
+
+from .test_support.util import digest
+
+pytestmark = pytest.mark.usefixtures("valid_op_cli_config_homedir")
+
+SPONGEBOB_ID = "caveh7ghsffalokofr3o6qbfjy"
+SPONGEBOB_TITLE = "Example Login 2 - 1200px-SpongeBob_SquarePants_character.svg.png.webp"
+LOGO_ID = "ue6i3anfk7vdzf6vntruaunbuy"
+
+
+def _entries_by_id(manifest: OPDocumentManifest):
+    return {entry.unique_id: entry for entry in manifest.entries}
+
+
+def test_document_get_many_01(signed_in_op: OP, expected_document_data, tmp_path):
+    """
+    Back up a vault's documents to a directory. A document that fails doesn't
+    prevent the others from being downloaded
+    """
+    expected = expected_document_data.data_for_document(SPONGEBOB_TITLE)
+    manifest = signed_in_op.document_get_many(
+        str(tmp_path), vault="Test Data", max_workers=2)
+    entries = _entries_by_id(manifest)
+    assert set(entries) == {SPONGEBOB_ID, LOGO_ID}
+
+    entry = entries[SPONGEBOB_ID]
+    assert entry.status == DOCUMENT_DOWNLOADED
+    assert manifest.downloaded == [entry]
+    assert entry.file_name == expected.filename
+    assert entry.path == os.path.join(SPONGEBOB_ID, expected.filename)
+    assert entry.size == expected.size
+    assert entry.digest == expected.digest
+    document_bytes = (tmp_path / entry.path).read_bytes()
+    assert digest(document_bytes) == expected.digest
+
+    failed = entries[LOGO_ID]
+    assert failed.status == DOCUMENT_FAILED
+    assert manifest.failed == [failed]
+    assert isinstance(failed.error, OPItemGetException)
+
+    stored = json.loads((tmp_path / OPDocumentManifest.FILE_NAME).read_text())
+    assert stored["digest_algorithm"] == "sha256"
+    assert list(stored["documents"]) == [SPONGEBOB_ID]
+    assert stored["documents"][SPONGEBOB_ID]["digest"] == expected.digest
+
+
+def test_document_get_many_02(signed_in_op: OP, tmp_path):
+    """
+    Unchanged documents are skipped on a later backup, and changed files are
+    downloaded again
+    """
+    signed_in_op.document_get_many(str(tmp_path), vault="Test Data")
+    manifest = signed_in_op.document_get_many(
+        str(tmp_path), vault="Test Data")
+    entry = _entries_by_id(manifest)[SPONGEBOB_ID]
+    assert entry.status == DOCUMENT_SKIPPED
+    assert manifest.skipped == [entry]
+    assert "document get" in signed_in_op.latency_stats()
+    assert signed_in_op.latency_stats()["document get"].count == 1
+
+    # same size, different contents
+    path = tmp_path / entry.path
+    document_bytes = bytearray(path.read_bytes())
+    document_bytes[0] ^= 0xff
+    path.write_bytes(document_bytes)
+    manifest = signed_in_op.document_get_many(
+        str(tmp_path), vault="Test Data")
+    entry = _entries_by_id(manifest)[SPONGEBOB_ID]
+    assert entry.status == DOCUMENT_DOWNLOADED
+    assert digest(path.read_bytes()) == entry.digest
+
+
+def test_document_get_many_03(signed_in_op: OP, tmp_path):
+    """
+    A manifest made with a different digest algorithm can't be used to skip documents
+    """
+    signed_in_op.document_get_many(str(tmp_path), vault="Test Data")
+    manifest = signed_in_op.document_get_many(str(tmp_path), vault="Test Data",
+                                              digest_algorithm="sha512")
+    entry = _entries_by_id(manifest)[SPONGEBOB_ID]
+    assert entry.status == DOCUMENT_DOWNLOADED
+    assert len(entry.digest) == 128
+
+
+def test_document_get_many_04(signed_in_op: OP, tmp_path):
+    """
+    A document whose file can't be written is recorded as failed, rather than
+    stopping the backup
+    """
+    # a file where the document's directory should be
+    (tmp_path / SPONGEBOB_ID).write_bytes(b"")
+    manifest = signed_in_op.document_get_many(
+        str(tmp_path), vault="Test Data", max_workers=2)
+    entry = _entries_by_id(manifest)[SPONGEBOB_ID]
+    assert entry.status == DOCUMENT_FAILED
+    assert isinstance(entry.error, OSError)
@@ -1,9 +1,12 @@
 import pyonepassword.api.authentication
+import pyonepassword.api.cache
 import pyonepassword.api.constants
 import pyonepassword.api.decorators
 import pyonepassword.api.descriptor_types
 import pyonepassword.api.exceptions
 import pyonepassword.api.object_types
+import pyonepassword.api.parsing
+import pyonepassword.api.query
 import pyonepassword.api.validation
 
 """
@@ -22,6 +25,17 @@ def test_authentication_exports():
         assert symbol in authentication_all
 
 
+def test_cache_exports():
+    """
+    Verify all symbols in pyonepassword.api.cache are properly re-exported
+    """
+    cache_all = pyonepassword.api.cache.__all__
+    for symbol in dir(pyonepassword.api.cache):
+        if symbol.startswith("__"):
+            continue
+        assert symbol in cache_all
+
+
 def test_constants_exports():
     """
     Verify all symbols in pyonepassword.api.constants are properly re-exported
@@ -33,6 +47,19 @@ def test_constants_exports():
         assert symbol in constants_all
 
 
+def test_constants_password_recipes():
+    """
+    Verify the predefined password recipes are still exported from
+    pyonepassword.api.constants
+    """
+    from pyonepassword.api.constants import (
+        LETTERS_DIGITS_25,
+        LETTERS_DIGITS_SYMBOLS_20
+    )
+    assert LETTERS_DIGITS_25 is not None
+    assert LETTERS_DIGITS_SYMBOLS_20 is not None
+
+
 def test_decorators_exports():
     """
     Verify all symbols in pyonepassword.api.decorators are properly re-exported
@@ -77,6 +104,27 @@ def test_object_types_exports():
         assert symbol in object_types_all
 
 
+def test_parsing_exports():
+    """
+    Verify all symbols in pyonepassword.api.parsing are properly re-exported
+    """
+    parsing_all = pyonepassword.api.parsing.__all__
+    for symbol in dir(pyonepassword.api.parsing):
+        if symbol.startswith("__"):
+            continue
+        assert symbol in parsing_all
+
+
+def test_query_exports():
+    """
+    Verify all symbols in pyonepassword.api.query are properly re-exported
+    """
+    query_all = pyonepassword.api.query.__all__
+    for symbol in dir(pyonepassword.api.query):
+        if symbol.startswith("__"):
+            continue
+        assert symbol in query_all
+
 def test_object_validation_exports():
     """
     Verify all synmbols in pyonepassword.api.validation are properly re-exported
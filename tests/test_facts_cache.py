@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pyonepassword._facts_cache import _OPFactsCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pyonepassword import OP
+
+# ensure HOME env variable is set, and there's a valid op config present
+pytestmark = pytest.mark.usefixtures("valid_op_cli_config_homedir")
+
+
+def test_facts_cache_01(tmp_path: Path):
+    """
+    Test:
+      - Looking up a fact keyed by a file's identity before and after the file changes
+
+    Verify:
+      - The fact is computed once while the file is unchanged
+      - It's computed again after the file is modified
+    """
+    facts = _OPFactsCache()
+    path = tmp_path / "op"
+    path.write_text("v1")
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return path.read_text()
+
+    assert facts.fact("version", facts.file_identity(path), compute) == "v1"
+    assert facts.fact("version", facts.file_identity(path), compute) == "v1"
+    assert len(calls) == 1
+
+    path.write_text("v22")
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert facts.fact("version", facts.file_identity(path), compute) == "v22"
+    assert len(calls) == 2
+
+
+def test_facts_cache_02(tmp_path: Path):
+    """
+    Test:
+      - Looking up a fact for a file that doesn't exist
+
+    Verify:
+      - The fact is computed every time, and never cached
+    """
+    facts = _OPFactsCache()
+    identity = facts.file_identity(tmp_path / "no-such-file")
+    assert identity is None
+    calls = []
+    facts.fact("version", identity, lambda: calls.append(1))
+    facts.fact("version", identity, lambda: calls.append(1))
+    assert len(calls) == 2
+
+
+def test_facts_cache_op_01(signed_in_op: OP, signed_in_op_pooled: OP):
+    """
+    Test:
+      - Creating a second OP object after facts were gathered by the first
+
+    Verify:
+      - The second object doesn't run 'op --version' or 'op account list'
+      - Both objects agree on the CLI version
+    """
+    assert "--version" in signed_in_op.latency_stats()
+    stats = signed_in_op_pooled.latency_stats()
+    assert "--version" not in stats
+    assert "account list" not in stats
+    assert signed_in_op_pooled._cli_version == signed_in_op._cli_version
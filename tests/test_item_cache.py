@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pyonepassword.api.cache import OPItemCache
+from pyonepassword.api.object_types import OPLoginItem
+
+if TYPE_CHECKING:
+    from pyonepassword import OP
+
+    from .fixtures.valid_data import ValidData
+
+# ensure HOME env variable is set, and there's a valid op config present
+pytestmark = pytest.mark.usefixtures("valid_op_cli_config_homedir")
+
+
+def _login_item(valid_data: ValidData) -> OPLoginItem:
+    valid_item_dict = valid_data.data_for_name("example-login-with-fields")
+    return OPLoginItem(valid_item_dict)
+
+
+def test_item_cache_01(valid_data: ValidData):
+    """
+    Test:
+      - Caching an item and looking it up by the same key
+
+    Verify:
+      - The identical object is returned
+      - A key differing only by vault misses
+    """
+    cache = OPItemCache()
+    item = _login_item(valid_data)
+    key = OPItemCache.key("Example Login with Fields", vault="Test Data")
+    cache.put(key, item)
+    assert cache.get(key) is item
+    assert cache.get(OPItemCache.key("Example Login with Fields")) is None
+
+
+def test_item_cache_02(valid_data: ValidData):
+    """
+    Test:
+      - Looking up an item after its TTL has passed
+
+    Verify:
+      - The lookup misses, and the expired entry is dropped
+    """
+    cache = OPItemCache(ttl=0.01)
+    key = OPItemCache.key("Example Login with Fields")
+    cache.put(key, _login_item(valid_data))
+    time.sleep(0.02)
+    assert cache.get(key) is None
+    assert len(cache) == 0
+
+
+def test_item_cache_03(valid_data: ValidData):
+    """
+    Test:
+      - Caching more items than 'max_entries'
+
+    Verify:
+      - The least recently used entry is evicted
+    """
+    cache = OPItemCache(max_entries=2)
+    item = _login_item(valid_data)
+    key_1 = OPItemCache.key("item 1")
+    key_2 = OPItemCache.key("item 2")
+    key_3 = OPItemCache.key("item 3")
+    cache.put(key_1, item)
+    cache.put(key_2, item)
+    # touch key_1 so key_2 is now the least recently used
+    cache.get(key_1)
+    cache.put(key_3, item)
+    assert cache.get(key_1) is item
+    assert cache.get(key_2) is None
+    assert cache.get(key_3) is item
+
+
+def test_item_cache_04(valid_data: ValidData):
+    """
+    Test:
+      - Invalidating by unique ID an item that was cached by title
+
+    Verify:
+      - The entry is evicted, and the number evicted is returned
+    """
+    cache = OPItemCache()
+    item = _login_item(valid_data)
+    cache.put(OPItemCache.key(item.title), item)
+    assert cache.invalidate("no such item") == 0
+    assert cache.invalidate(item.unique_id) == 1
+    assert len(cache) == 0
+
+
+def test_item_cache_05():
+    """
+    Test:
+      - Creating a cache with 'max_entries' less than 1
+
+    Verify:
+      - ValueError is raised
+    """
+    with pytest.raises(ValueError):
+        OPItemCache(max_entries=0)
+
+
+def test_item_cache_op_01(signed_in_op_item_cache: OP):
+    """
+    Test:
+      - Getting the same item twice via OP.item_get() with an item cache
+
+    Verify:
+      - The second call is served from the cache without running 'op'
+    """
+    op = signed_in_op_item_cache
+    item_1 = op.item_get("Example Login 1", vault="Test Data")
+    count = op.latency_stats()["item get"].count
+    item_2 = op.item_get("Example Login 1", vault="Test Data")
+    assert item_2 is item_1
+    assert op.latency_stats()["item get"].count == count
+    assert len(op.item_cache) == 1
+
+
+def test_item_cache_op_02(signed_in_op_item_cache: OP):
+    """
+    Test:
+      - Deleting an item that's in the item cache
+
+    Verify:
+      - The cached item is evicted
+    """
+    op = signed_in_op_item_cache
+    login_name = "Delete Me Unique"
+    vault = "Test Data"
+    op.item_get(login_name, vault=vault)
+    assert len(op.item_cache) == 1
+    op.item_delete(login_name, vault=vault)
+    assert len(op.item_cache) == 0
+
+
+def test_item_cache_revalidate_01(signed_in_op_item_cache: OP):
+    """
+    Test:
+      - Revalidating an item cache holding one unchanged item, one stale item,
+        and one item that no longer exists
+
+    Verify:
+      - Only the stale item is fetched again, and only one 'item list' is run
+      - The item that no longer exists is evicted
+      - The unchanged item stays cached as the same object
+    """
+    op = signed_in_op_item_cache
+    vault = "Test Data"
+    server = op.item_get("Example Server", vault=vault)
+    login = op.item_get("Example Login 1", vault=vault)
+    # make the cached login look out of date
+    login["version"] = login.version - 1
+
+    gone_dict = dict(server)
+    gone_dict["id"] = "aaaaaaaaaaaaaaaaaaaaaaaaaa"
+    gone = type(server)(gone_dict)
+    gone_key = OPItemCache.key("Gone Item", vault=vault)
+    op.item_cache.put(gone_key, gone)
+
+    get_count = op.latency_stats()["item get"].count
+    result = op.item_cache_revalidate()
+
+    assert result.unchanged == [server.unique_id]
+    assert result.updated == [login.unique_id]
+    assert result.removed == [gone.unique_id]
+    assert op.latency_stats()["item get"].count == get_count + 1
+    assert op.latency_stats()["item list"].count == 1
+    assert op.item_cache.get(gone_key) is None
+    assert op.item_get("Example Server", vault=vault) is server
+    updated_login = op.item_get("Example Login 1", vault=vault)
+    assert updated_login is not login
+    assert updated_login.version == login.version + 1
+
+
+def test_item_cache_revalidate_02(signed_in_op_item_cache: OP):
+    """
+    Test:
+      - Revalidating an empty item cache
+
+    Verify:
+      - No 'op' commands are run, and nothing is reported
+    """
+    op = signed_in_op_item_cache
+    result = op.item_cache_revalidate()
+    assert result == ([], [], [])
+    assert "item list" not in op.latency_stats()
+
+
+def test_item_cache_revalidate_03(signed_in_op_item_and_response_cache: OP):
+    """
+    Test:
+      - Revalidating an item cache on an object that also has a response cache,
+        after the vault's item list has been cached
+
+    Verify:
+      - 'item list' is run again rather than served from the response cache
+    """
+    op = signed_in_op_item_and_response_cache
+    vault = "Test Data"
+    op.item_get("Example Server", vault=vault)
+    op.item_list(vault=vault)
+    op.item_list(vault=vault)
+    assert op.latency_stats()["item list"].count == 1
+
+    result = op.item_cache_revalidate()
+    assert len(result.unchanged) == 1
+    assert op.latency_stats()["item list"].count == 2
@@ -60,6 +60,19 @@ def test_item_delete_03(signed_in_op: OP, expected_login_item_data: ExpectedLogi
     assert result.unique_id == expected_item_id
 
 
+def test_item_delete_04(signed_in_op: OP, expected_login_item_data: ExpectedLoginItemData):
+    """
+    Test deleting an item by its unique ID, which doesn't need to be looked up first
+    """
+    login_name = "Delete Me Unique"
+    vault = "Test Data"
+    expected = expected_login_item_data.data_for_login(login_name)
+    expected_item_id = expected.unique_id
+    result = signed_in_op.item_delete(expected_item_id, vault=vault)
+    assert result == expected_item_id
+    assert "item get" not in signed_in_op.latency_stats()
+
+
 def test_item_delete_non_existent_01(signed_in_op: OP):
     """
     Test deleting a non-existent item
@@ -248,3 +248,49 @@ def test_item_lookup_field_03(valid_data: ValidData, expected_login_item_data):
         field_label_lower, case_sensitive=False)
 
     assert result.value == expected_field.value
+
+
+def test_item_lookup_field_04(valid_data: ValidData):
+    """
+    Test field lookup by purpose
+
+    Create:
+        - a login item with fields and sections
+        - look up fields via fields_by_purpose()
+    Verify:
+        - the "USERNAME" and "PASSWORD" purposes each return their field
+        - an unused purpose returns an empty list
+    """
+    valid_item_dict = valid_data.data_for_name("example-login-with-fields")
+    result_login_item = OPLoginItem(valid_item_dict)
+
+    username_fields = result_login_item.fields_by_purpose("USERNAME")
+    password_fields = result_login_item.fields_by_purpose("PASSWORD")
+    assert [f.field_id for f in username_fields] == ["username"]
+    assert [f.field_id for f in password_fields] == ["password"]
+    assert result_login_item.fields_by_purpose("NO_SUCH_PURPOSE") == []
+
+
+def test_item_lookup_field_05(valid_data: ValidData):
+    """
+    Test case-sensitive and case-insensitive field lookups return
+    all matching fields in item order
+
+    Create:
+        - a login item with two fields labeled "Example Field"
+    Verify:
+        - case-sensitive lookup with a differently-cased label finds nothing
+        - case-insensitive lookup finds both fields, in order
+        - modifying the returned list doesn't affect subsequent lookups
+    """
+    field_label = "Example Field"
+    valid_item_dict = valid_data.data_for_name("example-login-with-fields")
+    result_login_item = OPLoginItem(valid_item_dict)
+
+    assert result_login_item.fields_by_label(field_label.upper()) == []
+    result = result_login_item.fields_by_label(
+        field_label.upper(), case_sensitive=False)
+    assert [f.field_id for f in result] == ["ikr76mnggw767qwqoel624oqv4",
+                                            "zyhpoqkrwjtrq6qh5vhwylh6ie"]
+    result.clear()
+    assert len(result_login_item.fields_by_label(field_label)) == 2
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pyonepassword.api.object_types import (
+    OPLoginItem,
+    OPPasswordItem,
+    OPServerItem
+)
+from pyonepassword.json import iter_concatenated_json
+
+if TYPE_CHECKING:
+    from pyonepassword import OP
+
+# ensure HOME env variable is set, and there's a valid op config present
+pytestmark = pytest.mark.usefixtures("valid_op_cli_config_homedir")
+
+VAULT = "Test Data"
+TITLES = ["Example Login 1", "Example Password", "Example Server"]
+
+
+def test_item_get_batch_01(signed_in_op: OP):
+    """
+    Test:
+      - Getting every item from an item list with one 'op item get -'
+
+    Verify:
+      - Each item is the expected type, and matches the same item from OP.item_get()
+      - Only one 'op item get' is run for the whole batch
+    """
+    item_list = signed_in_op.item_list(vault=VAULT)
+    descriptors = [d for d in item_list if d.title in TITLES]
+    items = signed_in_op.item_get_batch(descriptors, vault=VAULT)
+    assert signed_in_op.latency_stats()["item get"].count == 1
+
+    assert [type(item) for item in items] == [
+        OPLoginItem, OPPasswordItem, OPServerItem]
+    for item in items:
+        assert item == signed_in_op.item_get(item.title, vault=VAULT)
+
+
+def test_item_get_batch_02(signed_in_op: OP):
+    """
+    Test:
+      - Getting items by unique ID with one 'op item get -'
+
+    Verify:
+      - The items with those IDs are returned
+    """
+    item_list = signed_in_op.item_list(vault=VAULT)
+    item_ids = [d.unique_id for d in item_list if d.title in TITLES]
+    items = signed_in_op.item_get_batch(item_ids, vault=VAULT)
+    assert [item.unique_id for item in items] == item_ids
+
+
+def test_item_get_batch_03(signed_in_op: OP):
+    """
+    Test:
+      - Getting an empty batch of items
+
+    Verify:
+      - An empty list is returned without running 'op'
+    """
+    assert signed_in_op.item_get_batch([]) == []
+    assert "item get" not in signed_in_op.latency_stats()
+
+
+def test_iter_concatenated_json_01():
+    """
+    Test:
+      - Decoding back-to-back JSON objects with and without whitespace between them
+
+    Verify:
+      - Each object is yielded in order
+    """
+    stream = '{"a": 1}{"b": [2, 3]}\n\n  {"c": "}{"}\n'
+    assert list(iter_concatenated_json(stream)) == [
+        {"a": 1}, {"b": [2, 3]}, {"c": "}{"}]
+    assert list(iter_concatenated_json("  \n")) == []
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pyonepassword import OP
+
+from pyonepassword.api.object_types import OPCompactItem, OPLoginItem
+
+# ensure HOME env variable is set, and there's a valid op config present
+pytestmark = pytest.mark.usefixtures("valid_op_cli_config_homedir")
+
+
+def test_item_get_compact_01(signed_in_op: OP, expected_login_item_data):
+    """
+    Verify:
+        - item_get(compact=True) returns an OPCompactItem
+        - its username, password, and primary URL match the expected values
+    """
+    item_name = "Example Login 1"
+    vault = "Test Data"
+    expected = expected_login_item_data.data_for_login(item_name)
+    result = signed_in_op.item_get(item_name, vault=vault, compact=True)
+    assert isinstance(result, OPCompactItem)
+    assert result.field_value_by_id("username") == expected.username
+    assert result.field_value_by_id("password") == expected.password
+    assert result.primary_url.href == expected.primary_url.href
+
+
+def test_item_get_compact_02(signed_in_op: OP):
+    """
+    Verify a compact item's to_dict() can be used to create a regular item object
+    equal to the one returned by item_get()
+    """
+    item_name = "Example Login 1"
+    vault = "Test Data"
+    compact = signed_in_op.item_get(item_name, vault=vault, compact=True)
+    login_item = signed_in_op.item_get(item_name, vault=vault)
+    assert OPLoginItem(compact.to_dict()) == login_item
+
+
+def test_item_get_compact_03(signed_in_op_item_cache: OP):
+    """
+    Verify compact and regular items are cached separately
+    """
+    item_name = "Example Login 1"
+    vault = "Test Data"
+    compact = signed_in_op_item_cache.item_get(
+        item_name, vault=vault, compact=True)
+    login_item = signed_in_op_item_cache.item_get(item_name, vault=vault)
+    assert isinstance(login_item, OPLoginItem)
+    assert signed_in_op_item_cache.item_get(
+        item_name, vault=vault, compact=True) is compact
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pyonepassword._py_op_commands import _OPCommandInterface
+
+if TYPE_CHECKING:
+    from pyonepassword import OP
+
+    from ..fixtures.expected_login import ExpectedLoginItemData
+
+# ensure HOME env variable is set, and there's a valid op config present
+pytestmark = pytest.mark.usefixtures("valid_op_cli_config_homedir")
+
+
+def test_item_get_fields_01(signed_in_op: OP, expected_login_item_data: ExpectedLoginItemData):
+    """
+    Test:
+      - Getting two fields from a login item by label
+
+    Verify:
+      - Both labels map to the expected values
+    """
+    item_name = "Example Login 1"
+    expected = expected_login_item_data.data_for_login(item_name)
+    result = signed_in_op.item_get_fields(
+        item_name, ["username", "password"], vault="Test Data")
+    assert result == {"username": expected.username,
+                      "password": expected.password}
+
+
+def test_item_get_fields_02(signed_in_op: OP, expected_login_item_data: ExpectedLoginItemData):
+    """
+    Test:
+      - Getting a single field from a login item by label, where 'op' returns
+        an object rather than an array
+
+    Verify:
+      - The label maps to the expected value
+    """
+    item_name = "Example Login 1"
+    expected = expected_login_item_data.data_for_login(item_name)
+    result = signed_in_op.item_get_fields(
+        item_name, ["username"], vault="Test Data")
+    assert result == {"username": expected.username}
+
+
+def test_item_get_fields_03(signed_in_op: OP):
+    """
+    Test:
+      - Getting no fields
+
+    Verify:
+      - An empty mapping is returned without running 'op item get'
+    """
+    result = signed_in_op.item_get_fields("Example Login 1", [])
+    assert result == {}
+    assert "item get" not in signed_in_op.latency_stats()
+
+
+def test_item_get_fields_04(signed_in_op: OP, monkeypatch):
+    """
+    Test:
+      - Getting fields whose labels differ in case from the labels on the item
+
+    Verify:
+      - Results are keyed by the requested labels, not the item's labels
+    """
+    output = (b'[{"id": "username", "label": "Username", "value": "bob"},'
+              b' {"id": "password", "label": "PASSWORD", "value": "hunter2"}]')
+    monkeypatch.setattr(_OPCommandInterface, "_item_get",
+                        lambda *args, **kwargs: output)
+    result = signed_in_op.item_get_fields(
+        "Example Login 1", ["username", "Password"])
+    assert result == {"username": "bob", "Password": "hunter2"}
+
+
+def test_item_get_fields_05(signed_in_op: OP, monkeypatch):
+    """
+    Test:
+      - Getting fields where none of the labels match, so 'op' prints nothing
+
+    Verify:
+      - An empty mapping is returned
+    """
+    monkeypatch.setattr(_OPCommandInterface, "_item_get",
+                        lambda *args, **kwargs: b"\n")
+    result = signed_in_op.item_get_fields("Example Login 1", ["no such field"])
+    assert result == {}
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pyonepassword import OP
+
+from pyonepassword.api.exceptions import (
+    OPCmdTimeoutException,
+    OPItemGetException
+)
+from pyonepassword.api.object_types import (
+    OPLoginItem,
+    OPPasswordItem,
+    OPSecureNoteItem
+)
+
+# ensure HOME env variable is set, and there's a valid op config present
+pytestmark = pytest.mark.usefixtures("valid_op_cli_config_homedir")
+
+
+def test_item_get_many_01(signed_in_op: OP, expected_login_item_data):
+    """
+    Test:
+      - Getting several items at once, one of which doesn't exist
+
+    Verify:
+      - Results are returned in the same order as the identifiers
+      - The missing item is returned as an OPItemGetException rather than raised
+    """
+    item_uuid = "nok7367v4vbsfgg2fczwu4ei44"
+    identifiers = [item_uuid, "Invalid Item", "Example Secure Note 2"]
+    expected = expected_login_item_data.data_for_login(item_uuid)
+
+    results = signed_in_op.item_get_many(identifiers, max_workers=2)
+    assert len(results) == 3
+    assert isinstance(results[0], OPLoginItem)
+    assert results[0].username == expected.username
+    assert isinstance(results[1], OPItemGetException)
+    assert isinstance(results[2], OPSecureNoteItem)
+
+
+def test_item_get_many_02(signed_in_op: OP):
+    """
+    Test:
+      - Getting items at once, each with the same vault override
+
+    Verify:
+      - Each result matches the same item fetched with OP.item_get()
+    """
+    vault = "Test Data"
+    identifiers = ["Example Login 1", "Example Server", "Example Password"]
+    results = signed_in_op.item_get_many(identifiers, vault=vault)
+    for identifier, result in zip(identifiers, results):
+        assert result == signed_in_op.item_get(identifier, vault=vault)
+
+
+def test_item_get_many_03(signed_in_op: OP, monkeypatch):
+    """
+    Test:
+      - Getting several items at once, one of which times out
+
+    Verify:
+      - The timed out item is returned as an OPCmdTimeoutException rather than raised
+      - The other items are still returned
+    """
+    timed_out = "Example Server"
+    item_get = signed_in_op.item_get
+
+    def _item_get(identifier, *args, **kwargs):
+        if identifier == timed_out:
+            raise OPCmdTimeoutException("op item get", 1.0)
+        return item_get(identifier, *args, **kwargs)
+
+    monkeypatch.setattr(signed_in_op, "item_get", _item_get)
+    identifiers = ["Example Login 1", timed_out, "Example Password"]
+    results = signed_in_op.item_get_many(identifiers, vault="Test Data")
+    assert isinstance(results[0], OPLoginItem)
+    assert isinstance(results[1], OPCmdTimeoutException)
+    assert isinstance(results[2], OPPasswordItem)
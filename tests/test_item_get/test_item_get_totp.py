@@ -14,7 +14,7 @@ if TYPE_CHECKING:
     from pyonepassword import OP
 
 from pyonepassword.api.exceptions import OPItemGetException
-from pyonepassword.api.object_types import OPTOTPItem
+from pyonepassword.api.object_types import OPTOTPGenerator, OPTOTPItem
 
 # ensure HOME env variable is set, and there's a valid op config present
 pytestmark = pytest.mark.usefixtures("valid_op_cli_config_homedir")
@@ -81,3 +81,39 @@ def test_item_get_totp_invalid_01(signed_in_op: OP):
     vault = "Test Data"
     with pytest.raises(OPItemGetException):
         signed_in_op.item_get_totp(login_name, vault=vault)
+
+
+def test_totp_provider_01(signed_in_op: OP, expected_totp_data: ExpectedTOTPData):
+    """
+    Test that a TOTP provider generates codes from the item's secret, and only runs
+    'op item get' once, however many codes are generated
+    """
+    login_name = "Login With TOTP"
+    expected: ExpectedTOTP
+
+    expected = expected_totp_data.totp_data_for_login(login_name)
+    provider = signed_in_op.totp_provider(login_name, vault="Test Data")
+    expected_generator = OPTOTPGenerator(expected.value)
+    for at in [0, 59, 1_111_111_109, 2_000_000_000]:
+        assert provider.code(at) == expected_generator.generate(at)
+    assert len(provider.code()) == 6
+    assert signed_in_op.latency_stats()["item get"].count == 1
+
+
+def test_totp_provider_02(signed_in_op: OP):
+    """
+    Test that refreshing a TOTP provider fetches the secret again
+    """
+    login_name = "Login With TOTP"
+    provider = signed_in_op.totp_provider(login_name, vault="Test Data")
+    code = provider.code(59)
+    provider.refresh()
+    assert provider.code(59) == code
+    assert signed_in_op.latency_stats()["item get"].count == 2
+
+
+def test_totp_provider_invalid_01(signed_in_op: OP):
+    login_name = "Invalid TOTP Login"
+    vault = "Test Data"
+    with pytest.raises(OPItemGetException):
+        signed_in_op.totp_provider(login_name, vault=vault)
@@ -0,0 +1,190 @@
+"""
+Test cases for lazy section & field map construction on item objects
+"""
+from __future__ import annotations
+
+import copy
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from .fixtures.expected_login import ExpectedLogin, ExpectedLoginItemData
+    from .fixtures.non_comformant_data import NonConformantData
+    from .fixtures.valid_data import ValidData
+
+from pyonepassword.api.exceptions import (
+    OPInvalidItemException,
+    OPItemFieldCollisionException,
+    OPSectionCollisionException
+)
+from pyonepassword.api.object_types import (
+    OPLoginItem,
+    OPLoginItemRelaxedValidation,
+    OPPasswordItem
+)
+from pyonepassword.api.parsing import (
+    disable_lazy_item_maps,
+    enable_lazy_item_maps,
+    get_lazy_item_maps,
+    set_eager_item_maps_for_class,
+    set_lazy_item_maps_for_class
+)
+from pyonepassword.op_items.item_parsing_policy import _OPItemParsingPolicy
+
+# ensure HOME env variable is set, and there's a valid op config present
+pytestmark = pytest.mark.usefixtures("valid_op_cli_config_homedir")
+
+
+@pytest.fixture(autouse=True)
+def init_item_parsing_policy():
+    lazy_classes = set(_OPItemParsingPolicy._lazy_item_classes)
+    lazy_flag = _OPItemParsingPolicy._lazy_maps
+
+    yield  # clean up after each test
+
+    _OPItemParsingPolicy._lazy_item_classes = lazy_classes
+    _OPItemParsingPolicy._lazy_maps = lazy_flag
+
+
+def test_lazy_item_maps_policy_01():
+    """
+    Verify:
+        - lazy maps are disabled by default
+        - enabling globally applies to all item classes
+        - disabling globally works
+    """
+    assert not get_lazy_item_maps()
+    enable_lazy_item_maps()
+    assert get_lazy_item_maps()
+    assert get_lazy_item_maps(item_class=OPLoginItem)
+    disable_lazy_item_maps()
+    assert not get_lazy_item_maps(item_class=OPLoginItem)
+
+
+def test_lazy_item_maps_policy_02():
+    """
+    Verify:
+        - lazy maps can be enabled per-class, including subclasses
+        - they can be disabled for that class again
+    """
+    set_lazy_item_maps_for_class(OPLoginItem)
+    assert not get_lazy_item_maps()
+    assert get_lazy_item_maps(item_class=OPLoginItemRelaxedValidation)
+    set_eager_item_maps_for_class(OPLoginItem)
+    assert not get_lazy_item_maps(item_class=OPLoginItem)
+
+
+def test_lazy_item_maps_01(valid_data: ValidData):
+    """
+    Create:
+        - A login item with lazy maps enabled
+
+    Verify:
+        - No section or field maps are built on creation
+        - Looking up a field by ID builds the field map but not the section map
+        - The field value matches that of an eagerly built item
+    """
+    field_id = "ikr76mnggw767qwqoel624oqv4"
+    item_dict = valid_data.data_for_name("example-login-with-fields")
+    eager_item = OPLoginItem(copy.deepcopy(item_dict))
+    set_lazy_item_maps_for_class(OPLoginItem)
+    login_item = OPLoginItem(copy.deepcopy(item_dict))
+    assert login_item._field_map is None
+    assert login_item._section_map is None
+
+    assert login_item.field_value_by_id(field_id) == eager_item.field_value_by_id(field_id)
+    assert login_item._field_map is not None
+    assert login_item._section_map is None
+
+
+def test_lazy_item_maps_02(valid_data: ValidData):
+    """
+    Create:
+        - An eager login item
+        - A lazy login item from the same data
+
+    Verify:
+        - The lazy item compares equal to the eager item, without building its maps
+        - The lazy item's sections hold the same registered fields as the eager item's
+    """
+    item_dict = valid_data.data_for_name("example-login-with-fields")
+    section_id = "vh4wk7qyw46urc7wuwczzhpm7u"
+    field_label = "Example Field"
+    eager_item = OPLoginItem(copy.deepcopy(item_dict))
+    enable_lazy_item_maps()
+    lazy_item = OPLoginItem(copy.deepcopy(item_dict))
+    assert lazy_item._section_map is None
+
+    assert lazy_item == eager_item
+    assert lazy_item._section_map is None
+    assert lazy_item._field_map is None
+    eager_section = eager_item.section_by_id(section_id)
+    lazy_section = lazy_item.section_by_id(section_id)
+    assert lazy_section.fields == eager_section.fields
+    assert lazy_section.first_field_by_label(field_label).value == \
+        eager_section.first_field_by_label(field_label).value
+
+
+@pytest.mark.parametrize("entry_name, exception",
+                         [("login-duplicate-section", OPSectionCollisionException),
+                          ("login-duplicate-field", OPItemFieldCollisionException),
+                          ("login-field-missing-id", OPInvalidItemException)])
+def test_lazy_item_maps_03(entry_name, exception, non_conformant_data: NonConformantData):
+    """
+    Verify non-conformant data raises the same exception on creation of a lazy item
+    as it does for an eager item
+    """
+    enable_lazy_item_maps()
+    item_json = non_conformant_data.data_for_name(entry_name)
+    with pytest.raises(exception):
+        OPLoginItem(item_json)
+
+
+def test_lazy_item_maps_04(non_conformant_data: NonConformantData, expected_login_item_data: ExpectedLoginItemData):
+    """
+    Create:
+        - A lazy, relaxed validation login item from data with duplicate sections
+
+    Verify:
+        - Creation succeeds, and fields & sections can be accessed
+    """
+    expected_login: ExpectedLogin = expected_login_item_data.data_for_login(
+        "Login Item Duplicate Sections")
+    enable_lazy_item_maps()
+    login_json = non_conformant_data.data_for_name("login-duplicate-section")
+    login_item = OPLoginItemRelaxedValidation(login_json)
+    assert login_item.password == expected_login.password
+    assert len(login_item.sections) > 0
+
+
+def test_lazy_item_maps_05():
+    """
+    Create:
+        - An eager password item from data with no sections
+        - A lazy password item from the same data
+
+    Verify:
+        - The lazy item compares equal to the eager item, both before and after
+          its field map is built
+    """
+    item_dict = {"id": "mn4yqf4ehgzhw5fvcsh6xhwgmu",
+                 "title": "Example Password",
+                 "version": 1,
+                 "vault": {"id": "yhdg6ovhkjcfhn3u25cp2bnl6e", "name": "Test Data"},
+                 "category": "PASSWORD",
+                 "last_edited_by": "RAXCWKNRRNGL7I3KSZOH5ERLHI",
+                 "created_at": "2022-06-01T00:00:00Z",
+                 "updated_at": "2022-06-01T00:00:00Z",
+                 "fields": [{"id": "password",
+                             "type": "CONCEALED",
+                             "purpose": "PASSWORD",
+                             "label": "password",
+                             "value": "example password"}]}
+    eager_item = OPPasswordItem(copy.deepcopy(item_dict))
+    enable_lazy_item_maps()
+    lazy_item = OPPasswordItem(copy.deepcopy(item_dict))
+    assert lazy_item == eager_item
+    assert lazy_item.password == eager_item.password
+    assert lazy_item == eager_item
+    assert lazy_item.sections == []
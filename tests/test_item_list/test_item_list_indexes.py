@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import copy
+import pickle
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pyonepassword import OP
+
+from pyonepassword.api.object_types import OPItemList
+
+# ensure HOME env variable is set, and there's a valid op config present
+pytestmark = pytest.mark.usefixtures("valid_op_cli_config_homedir")
+
+TEST_DATA_VAULT_ID = "gshlsjsajnawtnjynzgwmiebge"
+
+
+def test_item_list_indexes_01(signed_in_op: OP):
+    """
+    Look up every item in the list by unique ID and by title, and check the
+    results agree with a linear scan
+    """
+    items: OPItemList = signed_in_op.item_list(vault="Test Data")
+    for item in items:
+        assert items.by_id(item.unique_id) is item
+        expected = [i for i in items if i.title == item.title]
+        assert items.by_title(item.title) == expected
+    assert items.by_id("no-such-item-id") is None
+    assert items.by_title("No Such Item") == []
+
+
+def test_item_list_indexes_02(signed_in_op: OP):
+    """
+    Case-insensitive title lookups match titles differing only in case
+    """
+    items: OPItemList = signed_in_op.item_list(vault="Test Data")
+    result = items.by_title("DELETE ME", case_sensitive=False)
+    assert len(result) == 2
+    assert items.by_title("DELETE ME") == []
+
+
+def test_item_list_indexes_03(signed_in_op: OP):
+    """
+    Look up items by category and by vault
+    """
+    items: OPItemList = signed_in_op.item_list(vault="Test Data")
+    servers = items.by_category("SERVER")
+    assert [i.title for i in servers] == [
+        "Example Server", "Example Server 2", "Example Server 3"]
+    assert items.in_vault(TEST_DATA_VAULT_ID) == list(items)
+    assert items.in_vault("no-such-vault-id") == []
+
+
+def test_item_list_indexes_04(signed_in_op: OP):
+    """
+    Look up items by tag
+    """
+    items: OPItemList = signed_in_op.item_list(
+        vault="Test Data", tags=["example-tag-1", "example-tag-2"])
+    tagged_2 = items.with_tag("example-tag-2")
+    assert [i.title for i in tagged_2] == ["Login Item with 2 Tags"]
+    for item in items.with_tag("example-tag-1"):
+        assert "example-tag-1" in item.tags
+    assert items.with_tag("no-such-tag") == []
+
+
+def test_item_list_indexes_05(signed_in_op: OP):
+    """
+    Modifying the list after a lookup is reflected in subsequent lookups
+    """
+    items: OPItemList = signed_in_op.item_list(vault="Test Data")
+    item = items.by_title("Example Login 1")[0]
+
+    items.remove(item)
+    assert items.by_id(item.unique_id) is None
+    assert items.by_title("Example Login 1") == []
+
+    items.append(item)
+    assert items.by_id(item.unique_id) is item
+
+    del items[-1]
+    assert items.by_id(item.unique_id) is None
+
+    items += [item]
+    assert items.by_id(item.unique_id) is item
+
+    items *= 2
+    assert items.by_title("Example Login 1") == [item, item]
+
+
+def test_item_list_indexes_06(signed_in_op: OP):
+    """
+    Copies of a list have indexes independent from the original's
+    """
+    items: OPItemList = signed_in_op.item_list(vault="Test Data")
+    item = items[0]
+    assert items.by_id(item.unique_id) is item
+
+    items_copy = copy.copy(items)
+    items_copy.pop(0)
+    assert items_copy.by_id(item.unique_id) is None
+    assert items.by_id(item.unique_id) is item
+
+    unpickled = pickle.loads(pickle.dumps(items))
+    assert unpickled.by_id(item.unique_id) == item
+
+
+def test_item_list_sort_01(signed_in_op: OP):
+    """
+    Items are sorted by title, then unique ID
+    """
+    items: OPItemList = signed_in_op.item_list(vault="Test Data")
+    keys = [(i.title, i.unique_id) for i in items]
+    assert keys == sorted(keys)
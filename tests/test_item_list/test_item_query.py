@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import datetime
+import re
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pyonepassword import OP
+
+from pyonepassword.api.exceptions import OPItemListException
+from pyonepassword.api.object_types import OPItemList
+from pyonepassword.api.query import OPItemQuery, OPTag, OPTagExpression
+
+# ensure HOME env variable is set, and there's a valid op config present
+pytestmark = pytest.mark.usefixtures("valid_op_cli_config_homedir")
+
+
+def _item_dict(title="Example", category="LOGIN", tags=None, favorite=False, state=None,
+               updated_at="2022-06-01T00:00:00Z", created_at="2021-01-01T00:00:00Z"):
+    item_dict = {"id": "abc", "title": title, "category": category,
+                 "updated_at": updated_at, "created_at": created_at,
+                 "vault": {"id": "xyz", "name": "Test Data"}}
+    if tags is not None:
+        item_dict["tags"] = tags
+    if favorite:
+        item_dict["favorite"] = True
+    if state:
+        item_dict["state"] = state
+    return item_dict
+
+
+def test_item_query_matches_01():
+    """
+    Title glob and regex
+    """
+    query = OPItemQuery(title_glob="Example *", title_regex=r"\d$")
+    assert query.matches(_item_dict(title="Example Login 1"))
+    assert not query.matches(_item_dict(title="Example Login"))
+    assert not query.matches(_item_dict(title="example Login 1"))
+
+    query = OPItemQuery(title_regex=re.compile("login", re.IGNORECASE))
+    assert query.matches(_item_dict(title="Example Login"))
+
+
+def test_item_query_matches_02():
+    """
+    Categories match regardless of how they're spelled
+    """
+    query = OPItemQuery(categories=["Login", "API Credential"])
+    assert query.matches(_item_dict(category="LOGIN"))
+    assert query.matches(_item_dict(category="API_CREDENTIAL"))
+    assert not query.matches(_item_dict(category="PASSWORD"))
+
+
+def test_item_query_matches_03():
+    """
+    Tag expressions, and what can be pushed down to 'op'
+    """
+    expr = (OPTag("prod") | OPTag("staging")) & ~OPTag("deprecated")
+    query = OPItemQuery(tags=expr)
+    assert query.matches(_item_dict(tags=["prod"]))
+    assert query.matches(_item_dict(tags=["staging", "web"]))
+    assert not query.matches(_item_dict(tags=["prod", "deprecated"]))
+    assert not query.matches(_item_dict())
+    assert query.item_list_args()["tags"] == ["prod", "staging"]
+
+    query = OPItemQuery(tags=OPTag("prod") & OPTag("web") & OPTag("db"))
+    assert query.matches(_item_dict(tags=["prod", "web", "db"]))
+    assert not query.matches(_item_dict(tags=["prod", "web"]))
+    assert len(query.item_list_args()["tags"]) == 1
+
+    # 'op' can't express "not", so nothing is pushed down
+    query = OPItemQuery(tags=OPTag("prod") | ~OPTag("web"))
+    assert query.item_list_args()["tags"] == []
+
+    # a list of tags means any of them, as with 'op item list --tags'
+    query = OPItemQuery(tags=["prod", "web"])
+    assert query.matches(_item_dict(tags=["web"]))
+    assert query.item_list_args()["tags"] == ["prod", "web"]
+
+
+def test_item_query_matches_04():
+    """
+    Date ranges, favorite, and archived
+    """
+    query = OPItemQuery(updated_after=datetime.datetime(2022, 1, 1),
+                        updated_before=datetime.datetime(2022, 6, 1, tzinfo=datetime.timezone.utc))
+    assert query.matches(_item_dict(updated_at="2022-01-01T00:00:00Z"))
+    assert not query.matches(_item_dict(updated_at="2022-06-01T00:00:00Z"))
+    assert not query.matches(_item_dict(updated_at="2021-12-31T23:59:59Z"))
+
+    query = OPItemQuery(created_before=datetime.datetime(2021, 1, 2),
+                        favorite=True)
+    assert query.matches(_item_dict(favorite=True))
+    assert not query.matches(_item_dict(favorite=False))
+
+    assert not OPItemQuery().matches(_item_dict(state="ARCHIVED"))
+    assert not OPItemQuery().item_list_args()["include_archive"]
+    query = OPItemQuery(archived=True)
+    assert query.matches(_item_dict(state="ARCHIVED"))
+    assert not query.matches(_item_dict())
+    assert query.item_list_args()["include_archive"]
+    query = OPItemQuery(archived=None)
+    assert query.matches(_item_dict(state="ARCHIVED"))
+    assert query.matches(_item_dict())
+    assert query.item_list_args()["include_archive"]
+
+
+def test_item_query_tag_expression_01():
+    """
+    OPTagExpression is abstract, and can't be used directly
+    """
+    with pytest.raises(TypeError):
+        OPTagExpression()
+
+
+def test_item_query_01(signed_in_op: OP):
+    """
+    Categories are pushed down to 'op', and the title regex applied to the results
+    """
+    query = OPItemQuery(vaults=["Test Data"], categories=["login", "identity"],
+                        title_regex=r"^Example")
+    result: OPItemList = signed_in_op.item_query(query)
+    titles = [item.title for item in result]
+    assert titles == sorted(titles)
+    assert "Example Identity" in titles
+    assert "Example Login" in titles
+    for item in result:
+        assert item.category in ["LOGIN", "IDENTITY"]
+        assert item.title.startswith("Example")
+
+
+def test_item_query_02(signed_in_op: OP):
+    """
+    Tags are pushed down to 'op', and the full expression applied to the results
+    """
+    query = OPItemQuery(vaults=["Test Data"],
+                        tags=(OPTag("example-tag-1") | OPTag("example-tag-2")) & ~OPTag("example-tag-2"))
+    result: OPItemList = signed_in_op.item_query(query)
+    assert [item.title for item in result] == ["Login Item with 1 Tag"]
+
+
+def test_item_query_03(signed_in_op: OP):
+    """
+    Only archived items
+    """
+    query = OPItemQuery(vaults=["Test Data"], archived=True)
+    result: OPItemList = signed_in_op.item_query(query)
+    assert len(result) == 4
+    for item in result:
+        assert item.archived
+
+
+def test_item_query_04(signed_in_op: OP):
+    """
+    Multiple vaults are listed concurrently and their results combined
+    """
+    query = OPItemQuery(vaults=["Test Data", "Test Data 3"],
+                        title_glob="Example Login*")
+    result: OPItemList = signed_in_op.item_query(query)
+    vault_names = set([item.vault.name for item in result])
+    assert vault_names == {"Test Data", "Test Data 3"}
+    expected = signed_in_op.item_list(vault="Test Data", title_glob="Example Login*")
+    expected.extend(signed_in_op.item_list(
+        vault="Test Data 3", title_glob="Example Login*"))
+    assert len(result) == len(expected)
+
+
+def test_item_query_invalid_vault_01(signed_in_op: OP):
+    query = OPItemQuery(vaults=["Test Data", "Invalid Vault"])
+    with pytest.raises(OPItemListException):
+        signed_in_op.item_query(query)
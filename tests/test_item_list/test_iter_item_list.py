@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import datetime
+import fnmatch
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pyonepassword import OP
+
+from pyonepassword.api.exceptions import OPItemListException
+from pyonepassword.api.object_types import OPItemList
+
+# ensure HOME env variable is set, and there's a valid op config present
+pytestmark = pytest.mark.usefixtures("valid_op_cli_config_homedir")
+
+
+def test_iter_item_list_01(signed_in_op: OP):
+    """
+    Iterating yields the same descriptors as item_list(), in op's (unsorted) order
+    """
+    items: OPItemList = signed_in_op.item_list(vault="Test Data")
+    iterated = list(signed_in_op.iter_item_list(vault="Test Data"))
+    assert len(iterated) == len(items)
+    assert sorted(iterated, key=lambda i: (i.title, i.unique_id)) == list(items)
+    for descriptor in iterated:
+        assert type(descriptor) is type(items.by_id(descriptor.unique_id))
+
+
+def test_iter_item_list_02(signed_in_op: OP):
+    """
+    Filter by title glob
+    """
+    title_glob = "Example Login*"
+    items: OPItemList = signed_in_op.item_list(
+        vault="Test Data", title_glob=title_glob)
+    iterated = list(signed_in_op.iter_item_list(
+        vault="Test Data", title_glob=title_glob))
+    assert len(iterated) > 0
+    assert sorted([i.unique_id for i in iterated]) == sorted(
+        [i.unique_id for i in items])
+    for descriptor in iterated:
+        assert fnmatch.fnmatch(descriptor.title, title_glob)
+
+
+def test_iter_item_list_03(signed_in_op: OP):
+    """
+    Filter by update time, with both aware and naive datetimes
+    """
+    updated_since = datetime.datetime(
+        2022, 6, 1, tzinfo=datetime.timezone.utc)
+    items: OPItemList = signed_in_op.item_list(vault="Test Data")
+    expected = sorted(
+        [i.unique_id for i in items if i.updated_at >= updated_since])
+
+    iterated = signed_in_op.iter_item_list(
+        vault="Test Data", updated_since=updated_since)
+    assert sorted([i.unique_id for i in iterated]) == expected
+
+    iterated = signed_in_op.iter_item_list(
+        vault="Test Data", updated_since=updated_since.replace(tzinfo=None))
+    assert sorted([i.unique_id for i in iterated]) == expected
+    assert 0 < len(expected) < len(items)
+
+
+def test_iter_item_list_04(signed_in_op: OP):
+    """
+    Categories and tags are passed to 'op'
+    """
+    iterated = list(signed_in_op.iter_item_list(
+        vault="Test Data", categories=["login", "identity"]))
+    assert len(iterated) > 0
+    assert set([i.category for i in iterated]) == {"LOGIN", "IDENTITY"}
+
+    iterated = list(signed_in_op.iter_item_list(
+        vault="Test Data", tags=["example-tag-2"]))
+    assert [i.title for i in iterated] == ["Login Item with 2 Tags"]
+
+
+def test_iter_item_list_05(signed_in_op: OP):
+    """
+    Stopping iteration early is fine, and doesn't affect later calls
+    """
+    iterator = signed_in_op.iter_item_list(vault="Test Data")
+    first = next(iterator)
+    iterator.close()
+    assert first.unique_id == next(
+        signed_in_op.iter_item_list(vault="Test Data")).unique_id
+
+
+def test_iter_item_list_invalid_vault_01(signed_in_op: OP):
+    with pytest.raises(OPItemListException):
+        list(signed_in_op.iter_item_list(vault="Invalid Vault"))
@@ -147,3 +147,32 @@ def test_item_section_04(valid_data: ValidData, expected_login_item_data: Expect
 
     assert isinstance(result, OPSection)
     assert result.label == expected_section.label
+
+
+def test_item_section_05(valid_data: ValidData):
+    """
+    Test a section's label lookups stay consistent as fields are registered
+
+    Create:
+      - A login item object with fields and sections
+      - Look up a field on a section by label, so the section's label index is built
+      - Register a new field on the section
+    Verify:
+      - the new field is found by case-sensitive and case-insensitive label lookups
+    """
+    section_id = "vh4wk7qyw46urc7wuwczzhpm7u"
+    new_field_dict = {"id": "new_field_id",
+                      "type": "STRING",
+                      "label": "New Field",
+                      "value": "new field value"}
+    valid_item_dict = valid_data.data_for_name("example-login-with-fields")
+    result_login_item = OPLoginItem(valid_item_dict)
+    section = result_login_item.section_by_id(section_id)
+
+    assert section.fields_by_label("New Field") == []
+    section.register_field(new_field_dict)
+
+    result = section.first_field_by_label("New Field")
+    assert result.value == "new field value"
+    result = section.first_field_by_label("new field", case_sensitive=False)
+    assert result.field_id == "new_field_id"
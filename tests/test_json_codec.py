@@ -0,0 +1,129 @@
+"""
+Test cases for the pluggable JSON codec layer
+"""
+from __future__ import annotations
+
+import json
+from json.decoder import JSONDecodeError
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pyonepassword import OP
+
+from pyonepassword.api.object_types import OPItemList, OPLoginItem
+from pyonepassword.api.parsing import (
+    OPJSONCodec,
+    available_json_codecs,
+    get_json_codec,
+    set_json_codec
+)
+from pyonepassword.json import iter_json_array, safe_unjson
+
+# ensure HOME env variable is set, and there's a valid op config present
+pytestmark = pytest.mark.usefixtures("valid_op_cli_config_homedir")
+
+EXAMPLE_OBJ = {"id": "abc", "title": "Café", "tags": ["a", "b"], "version": 2}
+
+
+@pytest.fixture(autouse=True)
+def restore_json_codec():
+    saved_codec = get_json_codec()
+    yield
+    set_json_codec(saved_codec)
+
+
+@pytest.fixture(params=available_json_codecs())
+def json_codec(request) -> OPJSONCodec:
+    codec = set_json_codec(request.param)
+    return codec
+
+
+def test_json_codec_01():
+    """
+    Verify:
+        - the standard library codec is always available
+        - it is the default only if nothing faster is available
+    """
+    available = available_json_codecs()
+    assert "json" in available
+    assert set_json_codec(None).NAME == available[0]
+
+
+def test_json_codec_02(json_codec: OPJSONCodec):
+    """
+    Verify every available codec decodes str, bytes, bytearray, and memoryview alike
+    """
+    json_str = json.dumps(EXAMPLE_OBJ)
+    json_bytes = json_str.encode("utf-8")
+    for data in [json_str, json_bytes, bytearray(json_bytes), memoryview(json_bytes)]:
+        assert safe_unjson(data) == EXAMPLE_OBJ
+
+
+def test_json_codec_03(json_codec: OPJSONCodec):
+    """
+    Verify every available codec raises JSONDecodeError for invalid JSON
+    """
+    with pytest.raises(JSONDecodeError):
+        safe_unjson(b"{not json")
+
+
+def test_json_codec_04(json_codec: OPJSONCodec):
+    """
+    Verify every available codec's output is identical to the 'json' module's,
+    with and without indentation
+    """
+    for indent in [None, 2, 4]:
+        assert json_codec.dumps(EXAMPLE_OBJ, indent=indent) == \
+            json.dumps(EXAMPLE_OBJ, indent=indent)
+
+
+def test_json_codec_05():
+    """
+    Verify an unavailable codec can't be set
+    """
+    with pytest.raises(ValueError):
+        set_json_codec("no-such-codec")
+
+
+def test_json_codec_06(signed_in_op: OP, json_codec: OPJSONCodec, expected_login_item_data):
+    """
+    Verify items and item lists parsed from undecoded 'op' output are correct
+    with every available codec, and item lists serialize the same with every codec
+    """
+    item_name = "Example Login 1"
+    vault = "Test Data"
+    expected = expected_login_item_data.data_for_login(item_name)
+    result = signed_in_op.item_get(item_name, vault=vault)
+    assert isinstance(result, OPLoginItem)
+    assert result.username == expected.username
+
+    items: OPItemList = signed_in_op.item_list(vault=vault)
+    assert items.serialize() == json.dumps(items)
+    items_copy = OPItemList(json.loads(items.serialize()))
+    assert [i.unique_id for i in items_copy] == [i.unique_id for i in items]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64, 1_000_000])
+def test_iter_json_array_01(chunk_size):
+    """
+    Elements are decoded correctly no matter where chunk boundaries fall,
+    including inside strings, escapes, and multibyte characters
+    """
+    array = [{"title": "a \"quoted\" ] } , [ { title", "n": [1, [2, {}]]},
+             "café \\", 3, None, [], {"k": "v"}]
+    data = json.dumps(array, indent=2, ensure_ascii=False).encode("utf-8")
+    chunks = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+    assert list(iter_json_array(chunks)) == array
+
+
+def test_iter_json_array_02():
+    assert list(iter_json_array([b" [ ] ", b"\n"])) == []
+    assert list(iter_json_array([b""])) == []
+
+
+@pytest.mark.parametrize("data", [b"[1,,2]", b"[1,]", b"[1", b"{}", b"[1] 2", b"[1}", b'["a]'])
+def test_iter_json_array_invalid_01(data):
+    with pytest.raises(JSONDecodeError):
+        list(iter_json_array([data]))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 import pytest
@@ -11,7 +12,10 @@ from pyonepassword.api.exceptions import (
     OPInvalidItemException,
     OPSectionCollisionException
 )
-from pyonepassword.api.object_types import OPLoginItem
+from pyonepassword.api.object_types import (
+    OPLoginItem,
+    OPLoginItemRelaxedValidation
+)
 from pyonepassword.api.validation import (
     disable_relaxed_validation,
     enable_relaxed_validation,
@@ -137,3 +141,55 @@ def test_item_class_relaxed_validation_03(non_conformant_data: NonConformantData
     # verify OPLoginItem can no longer be created from non-conformant data
     with pytest.raises(OPInvalidItemException):
         OPLoginItem(login_dict)
+
+
+def test_item_class_relaxed_validation_04():
+    """
+    Test the cached per-class verdict follows policy changes
+
+    Verify:
+        - The verdict for a subclass is cached after the first lookup
+        - Setting relaxed validation on its base class changes the subclass's verdict
+        - Directly replacing the set of relaxed classes also changes the verdict
+    """
+    generation = _OPItemValidationPolicy._generation
+    assert not get_relaxed_validation_for_class(OPLoginItemRelaxedValidation)
+    assert OPLoginItemRelaxedValidation in _OPItemValidationPolicy._class_verdicts
+
+    set_relaxed_validation_for_class(OPLoginItem)
+    assert _OPItemValidationPolicy._generation > generation
+    assert get_relaxed_validation_for_class(OPLoginItemRelaxedValidation)
+
+    _OPItemValidationPolicy._relaxed_item_classes = set()
+    assert not get_relaxed_validation_for_class(OPLoginItemRelaxedValidation)
+
+
+def test_item_class_relaxed_validation_05():
+    """
+    Test concurrent policy changes and lookups
+
+    Verify:
+        - No lookup raises while another thread adds and removes classes
+        - Once all threads are done, the verdict reflects the final policy
+    """
+    item_classes = list(OPItemFactory._TYPE_REGISTRY.values())
+
+    def _toggle():
+        for _ in range(200):
+            for item_class in item_classes:
+                set_relaxed_validation_for_class(item_class)
+                set_strict_validation_for_class(item_class)
+
+    def _lookup():
+        for _ in range(200):
+            for item_class in item_classes:
+                get_relaxed_validation(item_class=item_class)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(_toggle), pool.submit(_lookup),
+                   pool.submit(_lookup), pool.submit(_lookup)]
+        for future in futures:
+            future.result()
+
+    for item_class in item_classes:
+        assert not get_relaxed_validation_for_class(item_class)
@@ -0,0 +1,165 @@
+"""
+Tests for 'op' command execution modes and latency statistics
+"""
+# __future__.annotations, and typing.TYPE_CHECKING
+# enable anything imported for type hinting to disappear at run time
+from __future__ import annotations
+
+import gc
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pyonepassword._op_cli_argv import _OPArgv
+from pyonepassword._py_op_cli import (
+    _new_executor,
+    _OPCLIExecutor,
+    _OPPooledCLIExecutor
+)
+from pyonepassword.api.constants import EXEC_MODE_ONE_SHOT, EXEC_MODE_POOLED
+
+from .fixtures.op_fixtures import ACCOUNT_ID, _get_signed_in_op
+
+if TYPE_CHECKING:
+    from pyonepassword import OP
+
+
+def _python_argv(code: str):
+    # a plain argv list, since _OPArgv always prepends 'op' style global args
+    return [sys.executable, "-c", code]
+
+
+def test_executor_one_shot_01():
+    """
+    Test:
+      - Running a command through the default one-shot executor
+
+    Verify:
+      - stdout is captured
+      - latency is recorded for the command
+    """
+    executor = _OPCLIExecutor()
+    argv = _python_argv("print('hello')")
+    completed = executor.run(argv, stdout=-1)
+    assert completed.stdout.rstrip() == b"hello"
+    stats = executor.latency_stats()
+    assert len(stats) == 1
+    latency = list(stats.values())[0]
+    assert latency.count == 1
+    assert latency.min == latency.max == latency.mean
+
+
+def test_executor_pooled_01():
+    """
+    Test:
+      - Running several commands concurrently through a pooled executor
+
+    Verify:
+      - Every command's output is returned to its own caller
+      - All commands are recorded under the same command name
+    """
+    executor = _OPPooledCLIExecutor(pool_size=2)
+    results = {}
+
+    def _run(i):
+        argv = _python_argv(f"print({i})")
+        results[i] = executor.run(argv, stdout=-1).stdout
+
+    threads = [threading.Thread(target=_run, args=(i,)) for i in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    executor.shutdown()
+
+    for i in range(6):
+        assert results[i].rstrip() == str(i).encode("utf-8")
+    stats = executor.latency_stats()
+    assert sum([latency.count for latency in stats.values()]) == 6
+
+
+def test_executor_command_name_01():
+    """
+    Test:
+      - Deriving a latency key from an _OPArgv
+
+    Verify:
+      - The key is the command and subcommand
+    """
+    argv = _OPArgv.item_get_argv("op", "Example Login")
+    assert _OPCLIExecutor.command_name(argv) == "item get"
+    argv = _OPArgv.cli_version_argv("op")
+    assert _OPCLIExecutor.command_name(argv) == "--version"
+
+
+def test_new_executor_01():
+    assert _new_executor(EXEC_MODE_ONE_SHOT).EXEC_MODE == EXEC_MODE_ONE_SHOT
+    pooled = _new_executor(EXEC_MODE_POOLED, pool_size=1)
+    assert pooled.EXEC_MODE == EXEC_MODE_POOLED
+    pooled.shutdown()
+
+
+@pytest.mark.usefixtures("valid_op_cli_config_homedir")
+def test_op_pooled_item_get_01(signed_in_op_pooled: OP, signed_in_op: OP):
+    """
+    Test:
+      - Getting an item via an OP object in pooled execution mode
+
+    Verify:
+      - The item matches the one fetched in one-shot mode
+      - 'item get' latency is reported for both objects
+    """
+    item_name = "Example Login 1"
+    vault = "Test Data"
+    pooled_item = signed_in_op_pooled.item_get(item_name, vault=vault)
+    one_shot_item = signed_in_op.item_get(item_name, vault=vault)
+    assert pooled_item == one_shot_item
+    assert signed_in_op_pooled.exec_mode == EXEC_MODE_POOLED
+    assert signed_in_op.exec_mode == EXEC_MODE_ONE_SHOT
+    assert signed_in_op_pooled.latency_stats()["item get"].count == 1
+    assert signed_in_op.latency_stats()["item get"].count == 1
+
+
+def _op_worker_threads():
+    return [t for t in threading.enumerate() if t.name.startswith("op-worker")]
+
+
+@pytest.mark.usefixtures("valid_op_cli_config_homedir")
+def test_op_pooled_close_01(signed_in_op_pooled: OP):
+    """
+    Test:
+      - Closing an OP object in pooled execution mode, via a 'with' block
+
+    Verify:
+      - The pool's worker threads have exited
+      - Closing again is harmless
+    """
+    worker_count = len(_op_worker_threads())
+    with signed_in_op_pooled:
+        signed_in_op_pooled.item_get("Example Login 1", vault="Test Data")
+    assert len(_op_worker_threads()) == worker_count - 2
+    signed_in_op_pooled.close()
+
+
+@pytest.mark.usefixtures("valid_op_cli_config_homedir")
+def test_op_pooled_gc_01():
+    """
+    Test:
+      - Discarding an OP object in pooled execution mode without closing it
+
+    Verify:
+      - The pool's worker threads exit once the object is garbage collected
+    """
+    worker_count = len(_op_worker_threads())
+    op = _get_signed_in_op(ACCOUNT_ID, exec_mode=EXEC_MODE_POOLED, pool_size=2)
+    assert len(_op_worker_threads()) == worker_count + 2
+    del op
+    gc.collect()
+    for _ in range(100):
+        if len(_op_worker_threads()) == worker_count:
+            break
+        time.sleep(0.05)
+    assert len(_op_worker_threads()) == worker_count
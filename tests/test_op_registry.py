@@ -0,0 +1,119 @@
+import os
+
+import pytest
+
+from pyonepassword import OPRegistry
+from pyonepassword._py_op_cli import _environ_snapshot
+
+# ensure HOME env variable is set, and there's a valid op config present
+pytestmark = pytest.mark.usefixtures("valid_op_cli_config_homedir")
+
+ACCOUNT_ID = "5GHHPJK5HZC5BAT7WDUXW57G44"
+
+
+def _whoami_count(op):
+    latency = op.latency_stats().get("whoami")
+    return latency.count if latency else 0
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_op_registry_01():
+    """
+    Test:
+      - Getting an OP object from a registry twice for the same key
+
+    Verify:
+      - The same object is returned
+      - Sign-in isn't verified again the second time
+    """
+    registry = OPRegistry()
+    op_1 = registry.get(account=ACCOUNT_ID, op_path="mock-op")
+    whoami_count = _whoami_count(op_1)
+    op_2 = registry.get(account=ACCOUNT_ID, op_path="mock-op")
+    assert op_2 is op_1
+    assert _whoami_count(op_2) == whoami_count
+    assert len(registry) == 1
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_op_registry_02():
+    """
+    Test:
+      - Getting OP objects from a registry for two different vaults
+
+    Verify:
+      - A different object is returned for each vault
+    """
+    registry = OPRegistry()
+    op_1 = registry.get(account=ACCOUNT_ID, op_path="mock-op")
+    op_2 = registry.get(account=ACCOUNT_ID, op_path="mock-op",
+                        vault="Test Data")
+    assert op_2 is not op_1
+    assert op_2.vault == "Test Data"
+    assert len(registry) == 2
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_op_registry_03():
+    """
+    Test:
+      - Getting a registered OP object after a command reported it wasn't signed in
+
+    Verify:
+      - Sign-in is verified again, and since it's still valid, the same object is returned
+    """
+    registry = OPRegistry()
+    op_1 = registry.get(account=ACCOUNT_ID, op_path="mock-op")
+    whoami_count = _whoami_count(op_1)
+    # simulate a command having failed with a "not signed in" error
+    op_1._signin_stale = True
+    op_2 = registry.get(account=ACCOUNT_ID, op_path="mock-op")
+    assert op_2 is op_1
+    assert _whoami_count(op_2) == whoami_count + 1
+    assert not op_2.signin_stale
+
+
+@pytest.mark.usefixtures("setup_normal_op_env")
+def test_op_registry_04():
+    """
+    Test:
+      - Getting a registered OP object from a registry with a reverify interval of 0
+
+    Verify:
+      - Sign-in is verified again on every get
+    """
+    registry = OPRegistry(reverify_interval=0)
+    op = registry.get(account=ACCOUNT_ID, op_path="mock-op")
+    whoami_count = _whoami_count(op)
+    registry.get(account=ACCOUNT_ID, op_path="mock-op")
+    registry.get(account=ACCOUNT_ID, op_path="mock-op")
+    assert _whoami_count(op) == whoami_count + 2
+
+
+def test_op_registry_05():
+    """
+    Test:
+      - Removing an object from a registry
+
+    Verify:
+      - Removing a key that isn't registered returns None
+    """
+    registry = OPRegistry()
+    assert registry.remove(account=ACCOUNT_ID, op_path="mock-op") is None
+    assert len(registry) == 0
+
+
+def test_environ_snapshot_01():
+    """
+    Test:
+      - Taking a snapshot of the environment to pass to 'op'
+
+    Verify:
+      - os.environ is copied, so later changes don't affect the snapshot
+      - Any other mapping is passed through as-is
+    """
+    snapshot = _environ_snapshot(os.environ)
+    assert snapshot is not os.environ
+    assert snapshot == dict(os.environ)
+    env = {"OP_SESSION_TEST": "token"}
+    assert _environ_snapshot(env) is env
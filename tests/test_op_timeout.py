@@ -0,0 +1,284 @@
+"""
+Tests for 'op' command timeouts and deadlines
+"""
+# __future__.annotations, and typing.TYPE_CHECKING
+# enable anything imported for type hinting to disappear at run time
+from __future__ import annotations
+
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pyonepassword import op_deadline
+from pyonepassword._op_cli_argv import _OPArgv
+from pyonepassword._py_op_cli import (
+    _OPCLIExecute,
+    _OPPooledCLIExecutor,
+    _with_caller_deadline
+)
+from pyonepassword.api.exceptions import (
+    OPCmdFailedException,
+    OPCmdTimeoutException
+)
+
+if TYPE_CHECKING:
+    from pyonepassword import OP, AsyncOP
+
+# ensure HOME env variable is set, and there's a valid op config present
+pytestmark = pytest.mark.usefixtures("valid_op_cli_config_homedir")
+
+
+def _python_argv(code: str) -> _OPArgv:
+    # no command, so the argv is just the interpreter and its arguments
+    return _OPArgv(sys.executable, "", ["-c", code])
+
+
+def _sleep_argv(seconds: float, pid_path=None) -> _OPArgv:
+    code = ""
+    if pid_path:
+        code += f"import os; open({str(pid_path)!r}, 'w').write(str(os.getpid())); "
+    code += f"import time; time.sleep({seconds})"
+    return _python_argv(code)
+
+
+def _assert_killed(pid_path):
+    pid = int(pid_path.read_text())
+    with pytest.raises(ProcessLookupError):
+        os.kill(pid, 0)
+
+
+def test_op_timeout_01(tmp_path):
+    """
+    Test:
+      - Running a command that outlives its per-call timeout
+
+    Verify:
+      - OPCmdTimeoutException is raised promptly
+      - It isn't an OPCmdFailedException
+      - The command's process was killed and reaped
+    """
+    pid_path = tmp_path / "pid"
+    start = time.monotonic()
+    with pytest.raises(OPCmdTimeoutException) as exc_info:
+        _OPCLIExecute._run(_sleep_argv(60, pid_path), timeout=0.5)
+    assert time.monotonic() - start < 10
+    assert not isinstance(exc_info.value, OPCmdFailedException)
+    assert exc_info.value.timeout == pytest.approx(0.5, abs=0.1)
+    _assert_killed(pid_path)
+
+
+def test_op_timeout_02():
+    """
+    Test:
+      - Running a command that finishes within its timeout
+
+    Verify:
+      - Its output is returned as usual
+    """
+    output = _OPCLIExecute._run(_python_argv("print('hello')"),
+                                capture_stdout=True, decode="utf-8", timeout=30)
+    assert output.rstrip() == "hello"
+
+
+def test_op_deadline_01():
+    """
+    Test:
+      - Running several commands within an op_deadline() they collectively exceed
+
+    Verify:
+      - The commands that fit run normally, and the one running at the deadline
+        times out
+      - Commands started after the deadline time out immediately
+    """
+    with op_deadline(1.5):
+        _OPCLIExecute._run(_sleep_argv(0.1))
+        with pytest.raises(OPCmdTimeoutException):
+            _OPCLIExecute._run(_sleep_argv(60))
+        start = time.monotonic()
+        with pytest.raises(OPCmdTimeoutException):
+            _OPCLIExecute._run(_sleep_argv(0))
+        assert time.monotonic() - start < 1
+    # outside the deadline, commands are unbounded again
+    _OPCLIExecute._run(_sleep_argv(0))
+
+
+def test_op_deadline_02():
+    """
+    Test:
+      - Nesting a longer op_deadline() inside a shorter one, and a per-call timeout
+        longer than the deadline
+
+    Verify:
+      - The shorter, enclosing deadline still applies
+    """
+    with op_deadline(0.5):
+        with op_deadline(60):
+            with pytest.raises(OPCmdTimeoutException) as exc_info:
+                _OPCLIExecute._run(_sleep_argv(60), timeout=60)
+    assert exc_info.value.timeout < 1
+
+
+def test_op_deadline_03():
+    with pytest.raises(ValueError):
+        with op_deadline(0):
+            pass
+
+
+def test_op_deadline_04():
+    """
+    Test:
+      - Running a command in a worker thread, wrapped with _with_caller_deadline()
+
+    Verify:
+      - The caller's deadline applies in the worker thread
+    """
+    with op_deadline(0.5):
+        run = _with_caller_deadline(_OPCLIExecute._run)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(run, _sleep_argv(60))
+        with pytest.raises(OPCmdTimeoutException):
+            future.result(timeout=30)
+
+
+def test_op_deadline_pooled_01():
+    """
+    Test:
+      - Running a command through a pooled executor past its deadline
+
+    Verify:
+      - The command is killed, and the executor raises subprocess.TimeoutExpired, which
+        _run_raw() turns into OPCmdTimeoutException
+    """
+    executor = _OPPooledCLIExecutor(pool_size=1)
+    try:
+        with pytest.raises(subprocess.TimeoutExpired):
+            executor.run(_sleep_argv(60), deadline=time.monotonic() + 0.5)
+        # the worker is free again afterward
+        completed = executor.run(_python_argv("print(1)"), stdout=-1,
+                                 deadline=time.monotonic() + 30)
+        assert completed.stdout.rstrip() == b"1"
+    finally:
+        executor.shutdown()
+
+
+def test_op_deadline_pooled_02():
+    """
+    Test:
+      - Submitting a command to a pooled executor whose only worker is busy, with a
+        deadline that passes while the command is queued
+
+    Verify:
+      - subprocess.TimeoutExpired is raised at the deadline, rather than once the
+        worker is free
+    """
+    executor = _OPPooledCLIExecutor(pool_size=1)
+    try:
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            busy = pool.submit(executor.run, _sleep_argv(3),
+                               deadline=time.monotonic() + 30)
+            # let the first command reach the worker
+            time.sleep(0.5)
+            start = time.monotonic()
+            with pytest.raises(subprocess.TimeoutExpired):
+                executor.run(_sleep_argv(0), deadline=time.monotonic() + 0.5)
+            assert time.monotonic() - start < 2
+            busy.result(timeout=30)
+    finally:
+        executor.shutdown()
+
+
+def test_op_timeout_stream_01(tmp_path):
+    """
+    Test:
+      - Streaming the output of a command that stalls partway through
+
+    Verify:
+      - Output produced before the stall is yielded
+      - OPCmdTimeoutException is raised, and the process killed
+    """
+    pid_path = tmp_path / "pid"
+    code = (f"import os, sys, time; open({str(pid_path)!r}, 'w').write(str(os.getpid())); "
+            "sys.stdout.write('partial'); sys.stdout.flush(); time.sleep(60)")
+    chunks = []
+    with pytest.raises(OPCmdTimeoutException):
+        for chunk in _OPCLIExecute._run_stream(_python_argv(code), timeout=0.5):
+            chunks.append(chunk)
+    assert b"".join(chunks) == b"partial"
+    _assert_killed(pid_path)
+
+
+def test_op_timeout_stream_02():
+    """
+    Test:
+      - Streaming the output of a command that finishes within its timeout
+
+    Verify:
+      - All output is yielded, and no exception is raised
+    """
+    chunks = list(_OPCLIExecute._run_stream(
+        _python_argv("print('done')"), timeout=30))
+    assert b"".join(chunks).rstrip() == b"done"
+
+
+def test_op_timeout_default_01(signed_in_op_timeout: OP):
+    """
+    Test:
+      - Running a command via an OP object created with a default timeout
+
+    Verify:
+      - The default timeout applies to commands given no timeout of their own
+    """
+    assert signed_in_op_timeout.timeout == 3.0
+    start = time.monotonic()
+    with pytest.raises(OPCmdTimeoutException):
+        signed_in_op_timeout._run(_sleep_argv(60))
+    elapsed = time.monotonic() - start
+    assert 2.5 < elapsed < 30
+
+
+def test_op_timeout_default_02(signed_in_op: OP):
+    """
+    Test:
+      - Checking the timeout of an OP object created without one
+
+    Verify:
+      - There's no default timeout
+    """
+    assert signed_in_op.timeout is None
+
+
+def test_op_timeout_async_01(signed_in_async_op_timeout: AsyncOP):
+    """
+    Test:
+      - Running a command via an AsyncOP object past a per-call timeout
+
+    Verify:
+      - OPCmdTimeoutException is raised
+    """
+    async def _run():
+        await signed_in_async_op_timeout._arun(_sleep_argv(60), timeout=0.5)
+
+    with pytest.raises(OPCmdTimeoutException):
+        asyncio.run(_run())
+
+
+def test_op_timeout_async_02(signed_in_async_op_timeout: AsyncOP):
+    """
+    Test:
+      - Running a command via an AsyncOP object within an op_deadline()
+
+    Verify:
+      - The deadline applies to async commands too
+    """
+    async def _run():
+        with op_deadline(0.5):
+            await signed_in_async_op_timeout._arun(_sleep_argv(60))
+
+    with pytest.raises(OPCmdTimeoutException):
+        asyncio.run(_run())
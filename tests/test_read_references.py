@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pyonepassword.api.exceptions import OPReadException
+
+if TYPE_CHECKING:
+    from pyonepassword import OP
+
+    from .fixtures.expected_login import ExpectedLoginItemData
+
+# ensure HOME env variable is set, and there's a valid op config present
+pytestmark = pytest.mark.usefixtures("valid_op_cli_config_homedir")
+
+USERNAME_REF = "op://Test Data/Example Login 1/username"
+PASSWORD_REF = "op://Test Data/Example Login 1/password"
+INVALID_REF = "op://Test Data/Example Login 1/no-such-field"
+
+
+def test_read_references_01(signed_in_op: OP, expected_login_item_data: ExpectedLoginItemData):
+    """
+    Test:
+      - Resolving two secret references at once
+
+    Verify:
+      - Each reference maps to its expected value
+      - Only one 'op inject' is run, and no 'op read'
+    """
+    expected = expected_login_item_data.data_for_login("Example Login 1")
+    result = signed_in_op.read_references(
+        [USERNAME_REF, PASSWORD_REF, USERNAME_REF])
+    assert result == {USERNAME_REF: expected.username,
+                      PASSWORD_REF: expected.password}
+    stats = signed_in_op.latency_stats()
+    assert stats["inject"].count == 1
+    assert "read" not in stats
+
+
+def test_read_references_02(signed_in_op: OP, expected_login_item_data: ExpectedLoginItemData):
+    """
+    Test:
+      - Resolving a single secret reference
+
+    Verify:
+      - It's resolved with 'op read' rather than 'op inject'
+    """
+    expected = expected_login_item_data.data_for_login("Example Login 1")
+    result = signed_in_op.read_references([USERNAME_REF])
+    assert result == {USERNAME_REF: expected.username}
+    assert "inject" not in signed_in_op.latency_stats()
+
+
+def test_read_references_03(signed_in_op: OP):
+    """
+    Test:
+      - Resolving a batch of secret references where one is invalid
+
+    Verify:
+      - After 'op inject' fails, each reference is tried with 'op read'
+      - OPReadException is raised for the invalid reference
+    """
+    with pytest.raises(OPReadException) as exc_info:
+        signed_in_op.read_references([USERNAME_REF, INVALID_REF])
+    assert "no-such-field" in exc_info.value.err_output
+    stats = signed_in_op.latency_stats()
+    assert stats["inject"].count == 1
+    assert stats["read"].count == 2
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import os
+import stat
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pyonepassword.api.cache import (
+    OPFernetKeyProvider,
+    OPResponseCache,
+    OPResponseCacheKeyProvider
+)
+from pyonepassword.api.exceptions import OPResponseCacheException
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pyonepassword import OP
+
+# ensure HOME env variable is set, and there's a valid op config present
+pytestmark = pytest.mark.usefixtures("valid_op_cli_config_homedir")
+
+ARGV = ["op", "--format", "json", "item", "get", "Example Login 1"]
+ACCOUNT = "account-uuid/user-uuid"
+RESPONSE = b'{"id": "nnotgv5xwrhjbdj6bt3rugrijy"}'
+
+
+class _ReversingKeyProvider(OPResponseCacheKeyProvider):
+    # stand-in for a real cipher: stored bytes differ from the response
+    MAGIC = b"reversed:"
+
+    def encrypt(self, plaintext: bytes) -> bytes:
+        return self.MAGIC + plaintext[::-1]
+
+    def decrypt(self, ciphertext: bytes) -> bytes:
+        if not ciphertext.startswith(self.MAGIC):
+            raise ValueError("not encrypted by this provider")
+        return ciphertext[len(self.MAGIC):][::-1]
+
+
+def test_response_cache_01(tmp_path: Path):
+    """
+    Test:
+      - Caching a response and reading it back
+
+    Verify:
+      - The same bytes are returned
+      - The cache file is readable and writable only by its owner
+      - The same argv for a different account misses
+    """
+    cache = OPResponseCache(str(tmp_path), allow_plaintext=True)
+    cache.put(ARGV, ACCOUNT, RESPONSE)
+    assert cache.get(ARGV, ACCOUNT) == RESPONSE
+
+    mode = stat.S_IMODE(os.stat(cache.cache_path(ARGV, ACCOUNT)).st_mode)
+    assert mode == 0o600
+    assert cache.get(ARGV, "other-account/user-uuid") is None
+
+
+def test_response_cache_02(tmp_path: Path):
+    """
+    Test:
+      - Reading a response after the cache's TTL has passed
+
+    Verify:
+      - The lookup misses, and the expired file is removed
+    """
+    cache = OPResponseCache(str(tmp_path), ttl=0.01, allow_plaintext=True)
+    cache.put(ARGV, ACCOUNT, RESPONSE)
+    time.sleep(0.02)
+    assert cache.get(ARGV, ACCOUNT) is None
+    assert not os.path.exists(cache.cache_path(ARGV, ACCOUNT))
+
+
+def test_response_cache_03(tmp_path: Path):
+    """
+    Test:
+      - Caching a response with a key provider that transforms responses
+
+    Verify:
+      - The response isn't stored as-is on disk
+      - It reads back correctly through the same provider
+      - A response the provider can't decrypt is treated as a miss, and removed
+    """
+    cache = OPResponseCache(
+        str(tmp_path), key_provider=_ReversingKeyProvider())
+    cache.put(ARGV, ACCOUNT, RESPONSE)
+    with open(cache.cache_path(ARGV, ACCOUNT), "rb") as f:
+        assert f.read() != RESPONSE
+    assert cache.get(ARGV, ACCOUNT) == RESPONSE
+
+    plain_cache = OPResponseCache(str(tmp_path), allow_plaintext=True)
+    plain_cache.put(ARGV, ACCOUNT, RESPONSE)
+    assert cache.get(ARGV, ACCOUNT) is None
+    assert not os.path.exists(cache.cache_path(ARGV, ACCOUNT))
+
+
+def test_response_cache_04(tmp_path: Path):
+    """
+    Test:
+      - Clearing one account's responses
+
+    Verify:
+      - Only that account's responses are removed
+    """
+    cache = OPResponseCache(str(tmp_path), allow_plaintext=True)
+    other_account = "other-account/user-uuid"
+    cache.put(ARGV, ACCOUNT, RESPONSE)
+    cache.put(ARGV, other_account, RESPONSE)
+    assert cache.clear(account=ACCOUNT) == 1
+    assert cache.get(ARGV, ACCOUNT) is None
+    assert cache.get(ARGV, other_account) == RESPONSE
+
+
+def test_response_cache_05():
+    """
+    Test:
+      - Creating an OPFernetKeyProvider without the 'cryptography' package
+
+    Verify:
+      - OPResponseCacheException is raised
+    """
+    try:
+        import cryptography  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        pytest.skip("'cryptography' is installed")
+    with pytest.raises(OPResponseCacheException):
+        OPFernetKeyProvider(b"0" * 44)
+
+
+def test_response_cache_plaintext_01(tmp_path: Path):
+    """
+    Test:
+      - Creating a response cache that would store responses in plaintext, without
+        allowing it
+
+    Verify:
+      - OPResponseCacheException is raised, whether or not a non-encrypting key
+        provider is given
+    """
+    with pytest.raises(OPResponseCacheException):
+        OPResponseCache(str(tmp_path))
+    with pytest.raises(OPResponseCacheException):
+        OPResponseCache(str(tmp_path), key_provider=OPResponseCacheKeyProvider())
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions only")
+def test_response_cache_dir_01(tmp_path: Path):
+    """
+    Test:
+      - Opening a response cache in an existing directory others can access
+
+    Verify:
+      - The directory's mode is tightened to 0700
+    """
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    os.chmod(cache_dir, 0o755)
+    OPResponseCache(str(cache_dir), allow_plaintext=True)
+    assert stat.S_IMODE(os.stat(cache_dir).st_mode) == 0o700
+
+
+@pytest.mark.skipif(not hasattr(os, "geteuid") or os.geteuid() != 0,
+                    reason="changing a directory's owner requires root")
+def test_response_cache_dir_02(tmp_path: Path):
+    """
+    Test:
+      - Opening a response cache in an existing directory owned by another user
+
+    Verify:
+      - OPResponseCacheException is raised
+    """
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir(mode=0o700)
+    os.chown(cache_dir, 65534, 65534)
+    with pytest.raises(OPResponseCacheException):
+        OPResponseCache(str(cache_dir), allow_plaintext=True)
+
+
+def test_response_cache_op_01(signed_in_op_response_cache: OP, signed_in_op_response_cache_2: OP):
+    """
+    Test:
+      - Two OP objects sharing a response cache directory get the same item
+
+    Verify:
+      - The second OP object gets the item without running 'op item get'
+      - Both items are equal
+    """
+    item_1 = signed_in_op_response_cache.item_get(
+        "Example Login 1", vault="Test Data")
+    item_2 = signed_in_op_response_cache_2.item_get(
+        "Example Login 1", vault="Test Data")
+    assert "item get" not in signed_in_op_response_cache_2.latency_stats()
+    assert item_2 == item_1
+
+
+def test_response_cache_op_02(signed_in_op_response_cache: OP, tmp_path: Path):
+    """
+    Test:
+      - Deleting an item with an OP object that has a response cache
+
+    Verify:
+      - The account's cached responses are cleared
+    """
+    op = signed_in_op_response_cache
+    login_name = "Delete Me Unique"
+    vault = "Test Data"
+    op.item_list(vault=vault)
+    assert len(os.listdir(tmp_path)) == 1
+    op.item_delete(login_name, vault=vault)
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import base64
+import datetime
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pyonepassword.api.exceptions import OPInvalidTOTPException
+from pyonepassword.api.object_types import (
+    OPTOTPField,
+    OPTOTPGenerator,
+    OPTOTPItem,
+    OPTOTPProvider
+)
+from pyonepassword.op_items.field_registry import OPItemFieldFactory
+
+if TYPE_CHECKING:
+    from .fixtures.valid_data import ValidData
+
+"""
+Test local TOTP code generation, with the RFC 6238 test vectors
+"""
+
+# RFC 6238 Appendix B seeds, which are the ASCII digits repeated to the hash's length
+RFC_6238_SECRETS = {
+    "SHA1": base64.b32encode(b"12345678901234567890").decode(),
+    "SHA256": base64.b32encode(b"12345678901234567890123456789012").decode(),
+    "SHA512": base64.b32encode(b"1234567890" * 6 + b"1234").decode()
+}
+
+RFC_6238_VECTORS = [
+    (59, "SHA1", "94287082"),
+    (59, "SHA256", "46119246"),
+    (59, "SHA512", "90693936"),
+    (1111111109, "SHA1", "07081804"),
+    (1111111109, "SHA256", "68084774"),
+    (1111111109, "SHA512", "25091201"),
+    (1111111111, "SHA1", "14050471"),
+    (1111111111, "SHA256", "67062674"),
+    (1111111111, "SHA512", "99943326"),
+    (1234567890, "SHA1", "89005924"),
+    (1234567890, "SHA256", "91819424"),
+    (1234567890, "SHA512", "93441116"),
+    (2000000000, "SHA1", "69279037"),
+    (2000000000, "SHA256", "90698825"),
+    (2000000000, "SHA512", "38618901"),
+    (20000000000, "SHA1", "65353130"),
+    (20000000000, "SHA256", "77737706"),
+    (20000000000, "SHA512", "47863826")
+]
+
+
+@pytest.mark.parametrize("at, algorithm, expected", RFC_6238_VECTORS)
+def test_totp_generator_rfc_6238_01(at, algorithm, expected):
+    secret = RFC_6238_SECRETS[algorithm]
+    generator = OPTOTPGenerator(secret, digits=8, algorithm=algorithm)
+    assert generator.generate(at) == expected
+
+
+@pytest.mark.parametrize("at, algorithm, expected", RFC_6238_VECTORS)
+def test_totp_generator_uri_01(at, algorithm, expected):
+    """
+    Test that otpauth:// URI parameters are honored
+    """
+    secret = RFC_6238_SECRETS[algorithm].rstrip("=")
+    uri = f"otpauth://totp/Example:alice%40example.com?secret={secret}&digits=8&algorithm={algorithm}&issuer=Example"
+    generator = OPTOTPGenerator.from_secret_or_uri(uri)
+    assert generator.generate(at) == expected
+
+
+def test_totp_generator_01():
+    """
+    Test that the default parameters produce 6-digit codes, that are truncations of the
+    8-digit codes
+    """
+    generator = OPTOTPGenerator(RFC_6238_SECRETS["SHA1"])
+    assert generator.generate(59) == "287082"
+    assert generator.generate(1111111109) == "081804"
+
+
+def test_totp_generator_02():
+    """
+    Test that datetimes are accepted, with naive datetimes taken to be UTC
+    """
+    generator = OPTOTPGenerator(RFC_6238_SECRETS["SHA1"], digits=8)
+    naive = datetime.datetime(2005, 3, 18, 1, 58, 29)
+    aware = datetime.datetime(2005, 3, 18, 1, 58, 29,
+                              tzinfo=datetime.timezone.utc)
+    assert generator.generate(naive) == "07081804"
+    assert generator.generate(aware) == "07081804"
+
+
+def test_totp_generator_03():
+    """
+    Test that the period parameter and seconds_remaining() agree
+    """
+    generator = OPTOTPGenerator.from_secret_or_uri(
+        "otpauth://totp/example?secret=JBSWY3DPEHPK3PXP&period=60")
+    assert generator.period == 60
+    assert generator.generate(60) == generator.generate(119)
+    assert generator.generate(119) != generator.generate(120)
+    assert generator.seconds_remaining(100) == 20
+
+
+def test_totp_generator_04():
+    """
+    Test that secrets are accepted in lower case, grouped with spaces, and unpadded
+    """
+    expected = OPTOTPGenerator("JBSWY3DPEHPK3PXP").generate(59)
+    assert OPTOTPGenerator("jbsw y3dp ehpk 3pxp").generate(59) == expected
+
+
+@pytest.mark.parametrize("secret_or_uri",
+                         ["not base32!",
+                          "",
+                          "otpauth://hotp/example?secret=JBSWY3DPEHPK3PXP&counter=1",
+                          "otpauth://totp/example?digits=6",
+                          "otpauth://totp/example?secret=JBSWY3DPEHPK3PXP&digits=six",
+                          "otpauth://totp/example?secret=JBSWY3DPEHPK3PXP&period=0",
+                          "otpauth://totp/example?secret=JBSWY3DPEHPK3PXP&algorithm=MD5"])
+def test_totp_generator_invalid_01(secret_or_uri):
+    with pytest.raises(OPInvalidTOTPException):
+        OPTOTPGenerator.from_secret_or_uri(secret_or_uri)
+
+
+def test_totp_field_generate_01(valid_data: ValidData):
+    """
+    Test that a TOTP field with an otpauth:// URI value generates codes locally
+    """
+    field_dict = valid_data.data_for_name("login-item-field-totp")
+    field: OPTOTPField = OPItemFieldFactory.item_field(field_dict)
+    expected = OPTOTPGenerator("EPW4UE4E7IKC2QMB").generate(59)
+    assert field.generate(59) == expected
+    assert field.totp_generator() is field.totp_generator()
+
+
+def test_totp_item_generate_01():
+    totp_item = OPTOTPItem({"id": "TOTP_obe3whgcenxulnxs5cjyjy763i",
+                            "type": "OTP",
+                            "value": RFC_6238_SECRETS["SHA1"]})
+    assert totp_item.generate(59) == "287082"
+
+
+def test_totp_provider_01():
+    """
+    Test that a provider whose refresh fails discards its secret, and fetches it again
+    the next time a code is generated
+    """
+    values = [RFC_6238_SECRETS["SHA1"], "not base32!", RFC_6238_SECRETS["SHA1"]]
+    fetched = []
+
+    def _fetch():
+        value = values[len(fetched)]
+        fetched.append(value)
+        return OPTOTPItem({"value": value})
+
+    provider = OPTOTPProvider(_fetch)
+    assert provider.code(59) == "287082"
+    with pytest.raises(OPInvalidTOTPException):
+        provider.refresh()
+    assert provider.code(59) == "287082"
+    assert len(fetched) == 3